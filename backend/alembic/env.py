@@ -74,8 +74,13 @@ def run_migrations_online() -> None:
     )
 
     with connectable.connect() as connection:
+        # Commit after each revision so a long upgrade doesn't hold locks from
+        # earlier steps, and autocommit blocks (CONCURRENTLY, ALTER TYPE ... ADD
+        # VALUE) only have to close their own revision's transaction
         context.configure(
-            connection=connection, target_metadata=target_metadata
+            connection=connection,
+            target_metadata=target_metadata,
+            transaction_per_migration=True
         )
 
         with context.begin_transaction():
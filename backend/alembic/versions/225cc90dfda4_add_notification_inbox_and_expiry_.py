@@ -0,0 +1,38 @@
+"""add notification inbox and expiry indexes
+
+Revision ID: 225cc90dfda4
+Revises: 2fffdcf4603f
+Create Date: 2026-10-16 14:51:54.528353
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '225cc90dfda4'
+down_revision: Union[str, None] = '2fffdcf4603f'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_notifications_user_read_created', 'notifications', ['user_id', 'is_read', 'created_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_notifications_expires', 'notifications', ['expires_at'],
+            postgresql_where=sa.text("expires_at IS NOT NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_notifications_expires', table_name='notifications', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_notifications_user_read_created', table_name='notifications', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,32 @@
+"""add user history action index
+
+Revision ID: 2cf8d80b0a42
+Revises: fd6e38c5757e
+Create Date: 2026-10-16 14:41:27.975794
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2cf8d80b0a42'
+down_revision: Union[str, None] = 'fd6e38c5757e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_user_history_user_action_created', 'user_history', ['user_id', 'action', 'created_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_history_user_action_created', table_name='user_history', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,56 @@
+"""store refresh tokens as sha256 hashes
+
+Revision ID: 2fffdcf4603f
+Revises: eac9c8c46f70
+Create Date: 2026-10-16 14:51:09.561379
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2fffdcf4603f'
+down_revision: Union[str, None] = 'eac9c8c46f70'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Hash existing tokens in place so sessions survive the upgrade
+    # Tables created by create_all after this change already have token_hash and no token column
+    op.execute("""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = 'refresh_tokens' AND column_name = 'token'
+            ) THEN
+                ALTER TABLE refresh_tokens ADD COLUMN IF NOT EXISTS token_hash bytea;
+                UPDATE refresh_tokens SET token_hash = sha256(convert_to(token, 'UTF8'));
+                ALTER TABLE refresh_tokens ALTER COLUMN token_hash SET NOT NULL;
+                IF NOT EXISTS (
+                    SELECT 1 FROM pg_constraint WHERE conname = 'refresh_tokens_token_hash_key'
+                ) THEN
+                    ALTER TABLE refresh_tokens
+                        ADD CONSTRAINT refresh_tokens_token_hash_key UNIQUE (token_hash);
+                END IF;
+                DROP INDEX IF EXISTS ix_refresh_tokens_token;
+                ALTER TABLE refresh_tokens DROP COLUMN token;
+            END IF;
+        END $$
+    """)
+
+
+def downgrade() -> None:
+    # Raw tokens cannot be recovered: revoke every session and keep the hex digest
+    # as a placeholder so the restored column stays unique and non-null
+    op.add_column('refresh_tokens', sa.Column('token', sa.String(255), nullable=True))
+    op.execute("UPDATE refresh_tokens SET token = encode(token_hash, 'hex'), revoked = true, revoked_at = now()")
+    op.alter_column('refresh_tokens', 'token', nullable=False)
+    op.create_index('ix_refresh_tokens_token', 'refresh_tokens', ['token'], unique=True)
+    op.drop_constraint('refresh_tokens_token_hash_key', 'refresh_tokens', type_='unique')
+    op.drop_column('refresh_tokens', 'token_hash')
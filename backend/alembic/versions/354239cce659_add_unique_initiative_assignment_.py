@@ -0,0 +1,47 @@
+"""add unique initiative assignment constraint
+
+Revision ID: 354239cce659
+Revises: 94e8535f2a59
+Create Date: 2026-10-16 14:36:34.487683
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '354239cce659'
+down_revision: Union[str, None] = '94e8535f2a59'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep one row per (initiative, user) before enforcing uniqueness
+    op.execute("""
+        DELETE FROM initiative_assignments a
+        USING initiative_assignments b
+        WHERE a.initiative_id = b.initiative_id
+          AND a.user_id = b.user_id
+          AND a.ctid > b.ctid
+    """)
+    # Tables created by create_all after this change already have the constraint
+    op.execute("""
+        DO $$
+        BEGIN
+            IF NOT EXISTS (
+                SELECT 1 FROM pg_constraint WHERE conname = 'unique_initiative_assignment'
+            ) THEN
+                ALTER TABLE initiative_assignments
+                    ADD CONSTRAINT unique_initiative_assignment UNIQUE (initiative_id, user_id);
+            END IF;
+        END $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute(
+        "ALTER TABLE initiative_assignments DROP CONSTRAINT IF EXISTS unique_initiative_assignment"
+    )
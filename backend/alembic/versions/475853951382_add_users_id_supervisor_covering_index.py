@@ -0,0 +1,34 @@
+"""add users id supervisor covering index
+
+Revision ID: 475853951382
+Revises: 6b104d71ae9d
+Create Date: 2026-10-16 14:20:56.604807
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '475853951382'
+down_revision: Union[str, None] = '6b104d71ae9d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_id_supervisor', 'users', ['id'],
+            postgresql_include=['supervisor_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_id_supervisor', table_name='users', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,54 @@
+"""store review assignment type and status as native enums
+
+Revision ID: 654a01fd1e31
+Revises: 225cc90dfda4
+Create Date: 2026-10-16 14:56:47.304523
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '654a01fd1e31'
+down_revision: Union[str, None] = '225cc90dfda4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (column, enum type, values, check constraint the enum replaces)
+ENUM_COLUMNS = [
+    ('review_type', 'reviewassignmenttype', ('self', 'peer', 'supervisor'), 'valid_review_type'),
+    ('status', 'reviewassignmentstatus', ('pending', 'in_progress', 'completed', 'overdue'), 'valid_status'),
+]
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    for column, type_name, values, constraint in ENUM_COLUMNS:
+        # Tables built by create_all after the model change already use the enum
+        postgresql.ENUM(*values, name=type_name).create(bind, checkfirst=True)
+        op.execute(f"ALTER TABLE review_assignments DROP CONSTRAINT IF EXISTS {constraint}")
+        op.alter_column(
+            'review_assignments', column,
+            type_=postgresql.ENUM(*values, name=type_name, create_type=False),
+            existing_type=sa.String(20),
+            postgresql_using=f"{column}::text::{type_name}"
+        )
+
+
+def downgrade() -> None:
+    bind = op.get_bind()
+    for column, type_name, values, constraint in reversed(ENUM_COLUMNS):
+        op.alter_column(
+            'review_assignments', column,
+            type_=sa.String(20),
+            existing_type=postgresql.ENUM(*values, name=type_name, create_type=False),
+            postgresql_using=f"{column}::text"
+        )
+        allowed = ", ".join(f"'{value}'" for value in values)
+        op.create_check_constraint(constraint, 'review_assignments', f"{column} IN ({allowed})")
+        postgresql.ENUM(*values, name=type_name).drop(bind, checkfirst=True)
@@ -0,0 +1,40 @@
+"""add goal owner status and pending approval indexes
+
+Revision ID: 6b104d71ae9d
+Revises: 8b723be0bcc6
+Create Date: 2026-10-16 14:16:06.595730
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b104d71ae9d'
+down_revision: Union[str, None] = '8b723be0bcc6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_goals_owner_status', 'goals', ['owner_id', 'status'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_goals_status_type', 'goals', ['status', 'type'],
+            postgresql_where=sa.text("status = 'PENDING_APPROVAL'"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        # goal_assignments (goal_id, assigned_to) is already covered by the unique_goal_assignment constraint
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_goals_status_type', table_name='goals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_goals_owner_status', table_name='goals', postgresql_concurrently=True, if_exists=True)
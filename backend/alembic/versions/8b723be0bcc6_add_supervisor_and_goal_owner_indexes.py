@@ -0,0 +1,32 @@
+"""add supervisor and goal owner indexes
+
+Revision ID: 8b723be0bcc6
+Revises: 9fd870d1c1e4
+Create Date: 2026-10-16 14:11:31.651587
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8b723be0bcc6'
+down_revision: Union[str, None] = '9fd870d1c1e4'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index('ix_users_supervisor_id', 'users', ['supervisor_id'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index('ix_goals_owner_id', 'goals', ['owner_id'], postgresql_concurrently=True, if_not_exists=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_goals_owner_id', table_name='goals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_users_supervisor_id', table_name='users', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,57 @@
+"""derive user name from name parts
+
+Revision ID: 92f4166b39a8
+Revises: 2cf8d80b0a42
+Create Date: 2026-10-16 14:42:41.268410
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '92f4166b39a8'
+down_revision: Union[str, None] = '2cf8d80b0a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+FULL_NAME_SQL = "first_name || ' ' || COALESCE(NULLIF(middle_name, '') || ' ', '') || last_name"
+
+TRGM_INDEXES = [
+    ('ix_users_name_trgm', 'name'),
+    ('ix_users_email_trgm', 'email'),
+]
+
+
+def upgrade() -> None:
+    # Replace the stored name with a generated column in one statement, so there is
+    # never a moment without a name column
+    op.execute(
+        "ALTER TABLE users DROP COLUMN name, "
+        f"ADD COLUMN name VARCHAR(255) GENERATED ALWAYS AS ({FULL_NAME_SQL}) STORED"
+    )
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        for name, column in TRGM_INDEXES:
+            op.create_index(
+                name, 'users', [column],
+                postgresql_using='gin', postgresql_ops={column: 'gin_trgm_ops'},
+                postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, _ in reversed(TRGM_INDEXES):
+            op.drop_index(name, table_name='users', postgresql_concurrently=True, if_exists=True)
+
+    op.execute(
+        "ALTER TABLE users DROP COLUMN name, ADD COLUMN name VARCHAR(255)"
+    )
+    op.execute(f"UPDATE users SET name = {FULL_NAME_SQL}")
+    op.alter_column('users', 'name', nullable=False)
@@ -0,0 +1,53 @@
+"""add dashboard composite indexes
+
+Revision ID: 94e8535f2a59
+Revises: bc72c1d92db8
+Create Date: 2026-10-16 14:36:00.728202
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '94e8535f2a59'
+down_revision: Union[str, None] = 'bc72c1d92db8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_initiatives_status_due', 'initiatives', ['status', 'due_date'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_initiatives_created_by_status', 'initiatives', ['created_by', 'status'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_initiative_assignments_user_initiative', 'initiative_assignments', ['user_id', 'initiative_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_reviews_cycle_reviewee', 'reviews', ['cycle_id', 'reviewee_id'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_user_history_user_created', 'user_history', ['user_id', 'created_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_user_history_user_created', table_name='user_history', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_reviews_cycle_reviewee', table_name='reviews', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_initiative_assignments_user_initiative', table_name='initiative_assignments', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_initiatives_created_by_status', table_name='initiatives', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_initiatives_status_due', table_name='initiatives', postgresql_concurrently=True, if_exists=True)
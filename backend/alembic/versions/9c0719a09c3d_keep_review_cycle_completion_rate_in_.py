@@ -0,0 +1,70 @@
+"""keep review cycle completion rate in sync
+
+Revision ID: 9c0719a09c3d
+Revises: c019d96f3eba
+Create Date: 2026-10-16 14:39:47.642927
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c0719a09c3d'
+down_revision: Union[str, None] = 'c019d96f3eba'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Statement-level triggers so the bulk insert in _generate_review_assignments
+# recomputes each cycle once instead of once per row. Every trigger exposes its
+# transition table as changed_rows so they can share one function.
+RECOMPUTE_FUNCTION = """
+CREATE OR REPLACE FUNCTION recompute_cycle_completion() RETURNS TRIGGER AS $$
+BEGIN
+    UPDATE review_cycles rc
+    SET completion_rate = COALESCE((
+        SELECT 100.0 * count(*) FILTER (WHERE ra.status = 'completed') / NULLIF(count(*), 0)
+        FROM review_assignments ra
+        WHERE ra.cycle_id = rc.id
+    ), 0)
+    WHERE rc.id IN (SELECT DISTINCT cycle_id FROM changed_rows);
+    RETURN NULL;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+TRIGGERS = [
+    ('review_assignments_completion_insert', 'INSERT', 'NEW'),
+    ('review_assignments_completion_update', 'UPDATE', 'NEW'),
+    ('review_assignments_completion_delete', 'DELETE', 'OLD'),
+]
+
+
+def upgrade() -> None:
+    op.execute(RECOMPUTE_FUNCTION)
+    for name, event, transition in TRIGGERS:
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON review_assignments")
+        op.execute(
+            f"CREATE TRIGGER {name} AFTER {event} ON review_assignments "
+            f"REFERENCING {transition} TABLE AS changed_rows "
+            f"FOR EACH STATEMENT EXECUTE FUNCTION recompute_cycle_completion()"
+        )
+
+    # Backfill cycles that already have assignments
+    op.execute("""
+        UPDATE review_cycles rc
+        SET completion_rate = COALESCE((
+            SELECT 100.0 * count(*) FILTER (WHERE ra.status = 'completed') / NULLIF(count(*), 0)
+            FROM review_assignments ra
+            WHERE ra.cycle_id = rc.id
+        ), 0)
+    """)
+
+
+def downgrade() -> None:
+    for name, _, _ in reversed(TRIGGERS):
+        op.execute(f"DROP TRIGGER IF EXISTS {name} ON review_assignments")
+    op.execute("DROP FUNCTION IF EXISTS recompute_cycle_completion()")
@@ -0,0 +1,39 @@
+"""baseline schema
+
+Revision ID: 9fd870d1c1e4
+Revises: 
+Create Date: 2026-10-16 15:20:56.960485
+
+"""
+from typing import Sequence, Union
+
+from alembic import context, op
+import sqlalchemy as sa
+
+from database import Base
+import models  # noqa: F401 - registers every table on Base.metadata
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9fd870d1c1e4'
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The schema predates migrations and is built by create_all on startup. Build it
+    # here too so `alembic upgrade head` works on an empty database before the app
+    # has ever run; every later revision tolerates objects create_all already made
+    if context.is_offline_mode():
+        Base.metadata.create_all(op.get_bind(), checkfirst=False)
+        return
+
+    bind = op.get_bind()
+    if not sa.inspect(bind).has_table('users'):
+        Base.metadata.create_all(bind)
+
+
+def downgrade() -> None:
+    # Existing databases were never created by this revision, so leave the schema in place
+    pass
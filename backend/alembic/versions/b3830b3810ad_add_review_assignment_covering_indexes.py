@@ -0,0 +1,39 @@
+"""add review assignment covering indexes
+
+Revision ID: b3830b3810ad
+Revises: 654a01fd1e31
+Create Date: 2026-10-16 14:57:34.830029
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'b3830b3810ad'
+down_revision: Union[str, None] = '654a01fd1e31'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_review_assignments_reviewer_status_cycle', 'review_assignments', ['reviewer_id', 'status', 'cycle_id'],
+            postgresql_include=['reviewee_id', 'completed_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index(
+            'ix_review_assignments_reviewee_cycle', 'review_assignments', ['reviewee_id', 'cycle_id'],
+            postgresql_include=['status', 'review_type'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_review_assignments_reviewee_cycle', table_name='review_assignments', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_review_assignments_reviewer_status_cycle', table_name='review_assignments', postgresql_concurrently=True, if_exists=True)
@@ -0,0 +1,70 @@
+"""store queried json columns as jsonb with gin indexes
+
+Revision ID: bc72c1d92db8
+Revises: 475853951382
+Create Date: 2026-10-16 14:34:49.455543
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'bc72c1d92db8'
+down_revision: Union[str, None] = '475853951382'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# (table, column) pairs moved from json to jsonb
+JSONB_COLUMNS = [
+    ('roles', 'permissions'),
+    ('review_cycles', 'phase_schedule'),
+    ('review_cycles', 'target_population'),
+    ('review_cycles', 'inclusion_criteria'),
+    ('review_cycles', 'mandatory_participants'),
+    ('reviews', 'responses'),
+    ('performance_records', 'strengths'),
+    ('performance_records', 'development_areas'),
+    ('competency_assessments', 'competency_scores'),
+]
+
+GIN_INDEXES = [
+    ('ix_roles_permissions_gin', 'roles', 'permissions'),
+    ('ix_review_cycles_target_population_gin', 'review_cycles', 'target_population'),
+    ('ix_review_cycles_mandatory_participants_gin', 'review_cycles', 'mandatory_participants'),
+]
+
+
+def upgrade() -> None:
+    # The cast is a no-op for tables create_all already built with jsonb
+    for table, column in JSONB_COLUMNS:
+        op.alter_column(
+            table, column,
+            type_=postgresql.JSONB(), existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb'
+        )
+
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        for name, table, column in GIN_INDEXES:
+            op.create_index(
+                name, table, [column],
+                postgresql_using='gin', postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(GIN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
+
+    for table, column in reversed(JSONB_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.JSON(), existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json'
+        )
@@ -0,0 +1,41 @@
+"""add brin indexes on append only timestamps
+
+Revision ID: c019d96f3eba
+Revises: 354239cce659
+Create Date: 2026-10-16 14:38:06.365067
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c019d96f3eba'
+down_revision: Union[str, None] = '354239cce659'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+BRIN_INDEXES = [
+    ('ix_user_history_created_brin', 'user_history', 'created_at'),
+    ('ix_initiative_submissions_submitted_brin', 'initiative_submissions', 'submitted_at'),
+    ('ix_goal_progress_reports_created_brin', 'goal_progress_reports', 'created_at'),
+]
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        for name, table, column in BRIN_INDEXES:
+            op.create_index(
+                name, table, [column],
+                postgresql_using='brin', postgresql_concurrently=True, if_not_exists=True
+            )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, column in reversed(BRIN_INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True, if_exists=True)
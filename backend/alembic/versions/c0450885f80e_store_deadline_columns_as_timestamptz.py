@@ -0,0 +1,55 @@
+"""store deadline columns as timestamptz
+
+Revision ID: c0450885f80e
+Revises: 92f4166b39a8
+Create Date: 2026-10-16 14:45:34.194853
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c0450885f80e'
+down_revision: Union[str, None] = '92f4166b39a8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Naive values were written as UTC
+TIMESTAMPTZ_COLUMNS = [
+    ('initiatives', 'due_date'),
+    ('initiative_extensions', 'new_due_date'),
+    ('review_cycles', 'start_date'),
+    ('review_cycles', 'end_date'),
+    ('reviews', 'deadline'),
+    ('peer_reviews', 'deadline'),
+]
+
+# Only convert columns that are still naive: tables built by create_all after the
+# model change already use timestamptz, and converting again would shift the values
+CONVERT_IF_NAIVE = """
+DO $$
+BEGIN
+    IF (SELECT data_type FROM information_schema.columns
+        WHERE table_name = '{table}' AND column_name = '{column}') = 'timestamp without time zone' THEN
+        ALTER TABLE {table} ALTER COLUMN {column} TYPE timestamptz USING {column} AT TIME ZONE 'UTC';
+    END IF;
+END $$
+"""
+
+
+def upgrade() -> None:
+    for table, column in TIMESTAMPTZ_COLUMNS:
+        op.execute(CONVERT_IF_NAIVE.format(table=table, column=column))
+
+
+def downgrade() -> None:
+    for table, column in reversed(TIMESTAMPTZ_COLUMNS):
+        op.alter_column(
+            table, column,
+            type_=sa.DateTime(), existing_type=sa.DateTime(timezone=True),
+            postgresql_using=f"{column} AT TIME ZONE 'UTC'"
+        )
@@ -0,0 +1,40 @@
+"""add goal freeze lookup and creator indexes
+
+Revision ID: d25df128098b
+Revises: b3830b3810ad
+Create Date: 2026-10-16 15:07:57.749860
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd25df128098b'
+down_revision: Union[str, None] = 'b3830b3810ad'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    # CONCURRENTLY avoids blocking writes but cannot run inside a transaction
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_goals_freeze_lookup', 'goals', ['year', 'quarter', 'scope', 'frozen'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+        op.create_index('ix_goals_created_by', 'goals', ['created_by'], postgresql_concurrently=True, if_not_exists=True)
+        op.create_index(
+            'ix_goal_freeze_logs_performed_at', 'goal_freeze_logs', ['performed_at'],
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_goal_freeze_logs_performed_at', table_name='goal_freeze_logs', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_goals_created_by', table_name='goals', postgresql_concurrently=True, if_exists=True)
+        op.drop_index('ix_goals_freeze_lookup', table_name='goals', postgresql_concurrently=True, if_exists=True)
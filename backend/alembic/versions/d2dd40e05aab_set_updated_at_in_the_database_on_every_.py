@@ -0,0 +1,69 @@
+"""set updated_at in the database on every update
+
+Revision ID: d2dd40e05aab
+Revises: c0450885f80e
+Create Date: 2026-10-16 14:46:56.721706
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2dd40e05aab'
+down_revision: Union[str, None] = 'c0450885f80e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Every table whose model declares updated_at
+UPDATED_AT_TABLES = [
+    'organizations',
+    'roles',
+    'users',
+    'development_plans',
+    'goal_tags',
+    'goals',
+    'review_cycles',
+    'review_traits',
+    'initiatives',
+    'peer_reviews',
+    'performance_records',
+    'performance_scores',
+    'review_assignments',
+    'review_questions',
+    'review_scores',
+    'reviews',
+    'initiative_extensions',
+    'initiative_subtasks',
+    'review_responses',
+]
+
+SET_UPDATED_AT_FUNCTION = """
+CREATE OR REPLACE FUNCTION set_updated_at() RETURNS TRIGGER AS $$
+BEGIN
+    NEW.updated_at = now();
+    RETURN NEW;
+END;
+$$ LANGUAGE plpgsql
+"""
+
+
+def upgrade() -> None:
+    # The models keep onupdate=func.now() for ORM and Core updates; the trigger also
+    # covers raw SQL and writes from outside the application
+    op.execute(SET_UPDATED_AT_FUNCTION)
+    for table in UPDATED_AT_TABLES:
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+        op.execute(
+            f"CREATE TRIGGER {table}_set_updated_at BEFORE UPDATE ON {table} "
+            f"FOR EACH ROW EXECUTE FUNCTION set_updated_at()"
+        )
+
+
+def downgrade() -> None:
+    for table in reversed(UPDATED_AT_TABLES):
+        op.execute(f"DROP TRIGGER IF EXISTS {table}_set_updated_at ON {table}")
+    op.execute("DROP FUNCTION IF EXISTS set_updated_at()")
@@ -0,0 +1,33 @@
+"""index user onboarding tokens
+
+Revision ID: eac9c8c46f70
+Revises: d2dd40e05aab
+Create Date: 2026-10-16 14:50:27.683248
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'eac9c8c46f70'
+down_revision: Union[str, None] = 'd2dd40e05aab'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_users_onboarding_token', 'users', ['onboarding_token'],
+            postgresql_where=sa.text("onboarding_token IS NOT NULL"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_users_onboarding_token', table_name='users', postgresql_concurrently=True, if_exists=True)
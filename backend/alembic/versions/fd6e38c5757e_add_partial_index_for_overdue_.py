@@ -0,0 +1,33 @@
+"""add partial index for overdue initiative sweep
+
+Revision ID: fd6e38c5757e
+Revises: 9c0719a09c3d
+Create Date: 2026-10-16 14:40:31.220995
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'fd6e38c5757e'
+down_revision: Union[str, None] = '9c0719a09c3d'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Tables are also created by create_all on startup, so tolerate indexes that already exist
+    with op.get_context().autocommit_block():
+        op.create_index(
+            'ix_initiatives_overdue', 'initiatives', ['due_date'],
+            postgresql_where=sa.text("status IN ('PENDING', 'ONGOING', 'UNDER_REVIEW')"),
+            postgresql_concurrently=True, if_not_exists=True
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.drop_index('ix_initiatives_overdue', table_name='initiatives', postgresql_concurrently=True, if_exists=True)
@@ -1,17 +1,34 @@
 """
 Script to clear all goal-related data from the database
-Run this with: python clear_goals.py
+Run this with: python clear_goals.py [--yes]
 """
 
-from sqlalchemy import create_engine, text
-from database import get_db, engine
+from sqlalchemy import text
+from database import engine
 from models import (
     Goal, GoalProgressReport, GoalAssignment,
     GoalFreezeLog, GoalTag
 )
 import sys
 
-def clear_goals_data():
+# Leaf tables in foreign key order. PostgreSQL truncates them in one statement;
+# goals itself is not truncated: initiatives references it, and CASCADE would
+# empty initiatives too, so goals are deleted after unlinking them
+TRUNCATE_LEAF_TABLES = text(
+    "TRUNCATE TABLE goal_tag_assignments, goal_progress_reports, "
+    "goal_assignments, goal_freeze_logs, goal_tags"
+)
+DELETE_LEAF_TABLES = (
+    ("goal tag assignments", text("DELETE FROM goal_tag_assignments")),
+    ("progress reports", text("DELETE FROM goal_progress_reports")),
+    ("goal assignments", text("DELETE FROM goal_assignments")),
+    ("freeze logs", text("DELETE FROM goal_freeze_logs")),
+)
+UNLINK_INITIATIVES = text("UPDATE initiatives SET goal_id = NULL WHERE goal_id IS NOT NULL")
+DELETE_GOALS = text("DELETE FROM goals")
+DELETE_GOAL_TAGS = text("DELETE FROM goal_tags")
+
+def clear_goals_data(confirmed: bool = False):
     """
     Clear all goal-related data from the database
     This will delete:
@@ -20,71 +37,55 @@ def clear_goals_data():
     - Goal assignments
     - Goal freeze logs
     - Goal tags and tag assignments
+
+    Pass confirmed=True (or --yes on the command line) to skip the prompt
     """
 
     print("WARNING: This will delete ALL goals and related data!")
     print("This action cannot be undone.")
-    response = input("Type 'YES' to confirm: ")
-
-    if response != "YES":
-        print("Operation cancelled.")
-        return
-
-    try:
-        db = next(get_db())
-
-        print("\nStarting deletion process...")
+    if not confirmed:
+        response = input("Type 'YES' to confirm: ")
 
-        # Delete in correct order due to foreign key constraints
+        if response != "YES":
+            print("Operation cancelled.")
+            return
 
-        # 1. Delete goal tag assignments (association table)
-        print("  - Deleting goal tag assignments...")
-        result = db.execute(text("DELETE FROM goal_tag_assignments"))
-        print(f"    Deleted {result.rowcount} tag assignments")
+    print("\nStarting deletion process...")
 
-        # 2. Delete goal progress reports
-        print("  - Deleting goal progress reports...")
-        result = db.execute(text("DELETE FROM goal_progress_reports"))
-        print(f"    Deleted {result.rowcount} progress reports")
-
-        # 3. Delete goal assignments
-        print("  - Deleting goal assignments...")
-        result = db.execute(text("DELETE FROM goal_assignments"))
-        print(f"    Deleted {result.rowcount} goal assignments")
-
-        # 4. Delete goal freeze logs
-        print("  - Deleting goal freeze logs...")
-        result = db.execute(text("DELETE FROM goal_freeze_logs"))
-        print(f"    Deleted {result.rowcount} freeze logs")
-
-        # 5. Update initiatives to remove goal_id references
-        print("  - Removing goal references from initiatives...")
-        result = db.execute(text("UPDATE initiatives SET goal_id = NULL WHERE goal_id IS NOT NULL"))
-        print(f"    Updated {result.rowcount} initiatives")
-
-        # 6. Delete all goals
-        print("  - Deleting all goals...")
-        result = db.execute(text("DELETE FROM goals"))
-        print(f"    Deleted {result.rowcount} goals")
-
-        # 7. Delete goal tags
-        print("  - Deleting goal tags...")
-        result = db.execute(text("DELETE FROM goal_tags"))
-        print(f"    Deleted {result.rowcount} tags")
-
-        # Commit all changes
-        db.commit()
+    try:
+        # engine.begin() commits when the block exits and rolls back on any error
+        with engine.begin() as conn:
+            if conn.dialect.name == "postgresql":
+                print("  - Truncating goal tag assignments, progress reports, assignments, freeze logs and tags...")
+                conn.execute(TRUNCATE_LEAF_TABLES)
+                print("    Truncated 5 tables")
+            else:
+                for label, statement in DELETE_LEAF_TABLES:
+                    print(f"  - Deleting {label}...")
+                    result = conn.execute(statement)
+                    print(f"    Deleted {result.rowcount} {label}")
+
+            print("  - Removing goal references from initiatives...")
+            result = conn.execute(UNLINK_INITIATIVES)
+            print(f"    Updated {result.rowcount} initiatives")
+
+            print("  - Deleting all goals...")
+            result = conn.execute(DELETE_GOALS)
+            print(f"    Deleted {result.rowcount} goals")
+
+            # Goal tags were already truncated on PostgreSQL
+            if conn.dialect.name != "postgresql":
+                print("  - Deleting goal tags...")
+                result = conn.execute(DELETE_GOAL_TAGS)
+                print(f"    Deleted {result.rowcount} tags")
 
         print("\nSuccessfully cleared all goal-related data!")
         print("You can now create fresh goals without any old data.")
 
     except Exception as e:
         print(f"\nError occurred: {e}")
-        db.rollback()
         print("   Database rolled back - no changes made.")
         sys.exit(1)
-    finally:
-        db.close()
 
 if __name__ == "__main__":
-    clear_goals_data()
+    clear_goals_data(confirmed="--yes" in sys.argv[1:])
@@ -122,7 +122,6 @@ def init_basic_data():
             admin_user = User(
                 id=uuid.uuid4(),
                 email="admin@nigcomsat.gov.ng",
-                name="System Administrator",
                 first_name="System",
                 last_name="Administrator",
                 middle_name=None,
@@ -1,3 +1,6 @@
+import asyncio
+import importlib
+from contextlib import asynccontextmanager
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.staticfiles import StaticFiles
@@ -6,27 +9,41 @@ import logging
 from decouple import config
 from dotenv import load_dotenv
 load_dotenv()  
-# Enable debug logging
-logging.basicConfig(level=logging.DEBUG)
+# Log level comes from the environment; set LOG_LEVEL=DEBUG in .env for development
+logging.basicConfig(level=config("LOG_LEVEL", default="INFO").upper())
+# Keep SQLAlchemy's per-statement logging off even when the root level is DEBUG
+logging.getLogger("sqlalchemy.engine").setLevel(logging.WARNING)
 logger = logging.getLogger(__name__)
 
-from database import create_tables
-from routers import auth, users, roles, organization, initiatives, goals, goal_tags, reviews, performance, notifications
+from database import create_tables, warm_connection_pool, engine
 
 # Read CORS origins from environment variable, with fallback to .env file
-CORS_ALLOWED_ORIGINS = config("CORS_ALLOWED_ORIGINS", default="http://localhost:3000").split(",")
-
-# Strip whitespace from each origin
-CORS_ALLOWED_ORIGINS = [origin.strip() for origin in CORS_ALLOWED_ORIGINS]
-print(CORS_ALLOWED_ORIGINS)
+# Whitespace is stripped and empty entries (e.g. a trailing comma) are dropped
+CORS_ALLOWED_ORIGINS = tuple(
+    origin.strip()
+    for origin in config("CORS_ALLOWED_ORIGINS", default="http://localhost:3000").split(",")
+    if origin.strip()
+)
 
 # Log CORS configuration for debugging
 logger.info(f"CORS Allowed Origins: {CORS_ALLOWED_ORIGINS}")
 
+# Connections opened at startup so the first requests skip the connect handshake
+POOL_WARM_SIZE = config("POOL_WARM_SIZE", default=engine.pool.size(), cast=int)
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Create database tables and pre-open pooled connections on startup"""
+    await asyncio.to_thread(create_tables)
+    warmed = await warm_connection_pool(POOL_WARM_SIZE)
+    logger.info(f"Warmed {warmed}/{POOL_WARM_SIZE} database connections")
+    yield
+
 app = FastAPI(
     title="NIGCOMSAT PMS API",
     description="Performance Management System for Nigerian Communications Satellite Limited",
-    version="2.0.0"
+    version="2.0.0",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -35,27 +52,53 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Paginated array endpoints report their match count in a header
+    expose_headers=["X-Total-Count"],
+    # Let browsers reuse preflight results instead of an OPTIONS round trip per call
+    max_age=config("CORS_MAX_AGE", default=86400, cast=int),
 )
 
-if not os.path.exists("uploads"):
-    os.makedirs("uploads")
-app.mount("/api/uploads", StaticFiles(directory="uploads"), name="uploads")
+class CachedStaticFiles(StaticFiles):
+    """
+    Static files with long-lived browser/CDN caching
+    Every upload is written under a freshly generated unique name and never
+    rewritten in place, so a served file can be cached as immutable
+    """
+
+    async def get_response(self, path, scope):
+        response = await super().get_response(path, scope)
+        if response.status_code in (200, 304):
+            response.headers.setdefault("Cache-Control", "public, max-age=31536000, immutable")
+        return response
+
+# Routers write under the relative "uploads/" path; resolve it once for serving.
+# exist_ok keeps this safe when several workers start at the same time
+UPLOAD_DIR = os.path.abspath("uploads")
+os.makedirs(UPLOAD_DIR, exist_ok=True)
+app.mount("/api/uploads", CachedStaticFiles(directory=UPLOAD_DIR), name="uploads")
 
-app.include_router(auth.router, prefix="/api/auth", tags=["Authentication"])
-app.include_router(users.router, prefix="/api/users", tags=["Users"])
-app.include_router(roles.router, prefix="/api/roles", tags=["Roles"])
-app.include_router(organization.router, prefix="/api/organization", tags=["Organization"])
-app.include_router(initiatives.router, prefix="/api", tags=["Initiatives"])
-app.include_router(goals.router, prefix="/api/goals", tags=["Goals"])
-app.include_router(goal_tags.router, tags=["Goal Tags"])
-app.include_router(reviews.router, prefix="/api/reviews", tags=["Reviews"])
-app.include_router(performance.router, prefix="/api/performance", tags=["Performance"])
-app.include_router(notifications.router, tags=["Notifications"])
+# (module under routers/, URL prefix, OpenAPI tags)
+ROUTERS = [
+    ("auth", "/api/auth", ["Authentication"]),
+    ("users", "/api/users", ["Users"]),
+    ("roles", "/api/roles", ["Roles"]),
+    ("organization", "/api/organization", ["Organization"]),
+    ("initiatives", "/api/initiatives", ["Initiatives"]),
+    ("goals", "/api/goals", ["Goals"]),
+    ("goal_tags", "/api/goal-tags", ["Goal Tags"]),
+    ("reviews", "/api/reviews", ["Reviews"]),
+    ("performance", "/api/performance", ["Performance"]),
+    ("notifications", "/api/notifications", ["Notifications"]),
+]
 
-@app.on_event("startup")
-async def startup_event():
-    """Create database tables on startup"""
-    create_tables()
+for name, prefix, tags in ROUTERS:
+    # A router that fails to import is logged and skipped so the rest of the API still boots
+    try:
+        module = importlib.import_module(f"routers.{name}")
+    except Exception:
+        logger.exception(f"Failed to load router '{name}', skipping")
+        continue
+    app.include_router(module.router, prefix=prefix, tags=tags)
 
 @app.get("/")
 async def root():
@@ -67,4 +110,13 @@ async def health_check():
 
 if __name__ == "__main__":
     import uvicorn
-    uvicorn.run("main:app", host="0.0.0.0", port=8000, reload=True)
\ No newline at end of file
+    # Reload is opt-in for development; WORKERS > 1 is ignored by uvicorn while reloading
+    uvicorn.run(
+        "main:app",
+        host=config("HOST", default="0.0.0.0"),
+        port=config("PORT", default=8000, cast=int),
+        reload=config("RELOAD", default=False, cast=bool),
+        workers=config("WORKERS", default=1, cast=int),
+        loop="auto",
+        http="httptools"
+    )
\ No newline at end of file
@@ -1,11 +1,28 @@
-from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Date, Float, Numeric, UniqueConstraint, CheckConstraint, Table
-from sqlalchemy.orm import relationship
+from sqlalchemy import Column, Integer, String, Boolean, DateTime, Text, ForeignKey, JSON, Enum, Date, Float, Numeric, LargeBinary, UniqueConstraint, CheckConstraint, Table, Index, Computed, DDL, event, text, inspect
+from sqlalchemy.orm import relationship, joinedload, selectinload, raiseload
 from sqlalchemy.sql import func
 from database import Base
+from decouple import config
 import enum
 import uuid
-from sqlalchemy.dialects.postgresql import UUID
+from sqlalchemy.dialects.postgresql import UUID, JSONB
 from datetime import datetime
+import os
+import time
+
+def uuid7() -> uuid.UUID:
+    """
+    Time-ordered UUID (RFC 9562 version 7) for primary keys
+    A 48-bit millisecond timestamp followed by random bits, so new rows land at
+    the end of the primary key B-tree instead of at random pages
+    """
+    value = (time.time_ns() // 1_000_000) << 80 | int.from_bytes(os.urandom(10), "big")
+    value = (value & ~(0xF << 76)) | (0x7 << 76)  # version 7
+    value = (value & ~(0x3 << 62)) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+# Binary JSON on PostgreSQL (parsed once on write, GIN-indexable); plain JSON elsewhere
+JSONBType = JSON().with_variant(JSONB(), "postgresql")
 
 # Enums for Organization Levels
 class OrganizationLevel(str, enum.Enum):
@@ -99,6 +116,17 @@ class ReviewType(str, enum.Enum):
     SUBORDINATE = "subordinate"
     MULTISOURCE = "360"
 
+class ReviewAssignmentType(str, enum.Enum):
+    SELF = "self"
+    PEER = "peer"
+    SUPERVISOR = "supervisor"
+
+class ReviewAssignmentStatus(str, enum.Enum):
+    PENDING = "pending"
+    IN_PROGRESS = "in_progress"
+    COMPLETED = "completed"
+    OVERDUE = "overdue"
+
 class TraitScopeType(str, enum.Enum):
     GLOBAL = "global"
     DIRECTORATE = "directorate"
@@ -128,7 +156,7 @@ class Organization(Base):
     """
     __tablename__ = "organizations"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     level = Column(Enum(OrganizationLevel), nullable=False)
@@ -148,18 +176,27 @@ class Role(Base):
     """
     __tablename__ = "roles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String(255), nullable=False, unique=True)
     description = Column(Text)
     is_leadership = Column(Boolean, default=False)
     scope_override = Column(Enum(ScopeOverride), default=ScopeOverride.NONE)
-    permissions = Column(JSON, nullable=False, default=list)  # Array of permission strings
+    permissions = Column(JSONBType, nullable=False, default=list)  # Array of permission strings
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
 
     # Relationships
     users = relationship("User", back_populates="role")
 
+    # Indexes
+    __table_args__ = (
+        # Containment lookups such as permissions @> '["goal_approve"]'
+        Index('ix_roles_permissions_gin', 'permissions', postgresql_using='gin'),
+    )
+
+# first [middle] last, skipping an empty middle name
+USER_FULL_NAME_SQL = "first_name || ' ' || COALESCE(NULLIF(middle_name, '') || ' ', '') || last_name"
+
 class User(Base):
     """
     Complete user profiles with organizational assignment and status management
@@ -167,9 +204,10 @@ class User(Base):
     """
     __tablename__ = "users"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     email = Column(String(255), nullable=False, unique=True, index=True)
-    name = Column(String(255), nullable=False)  # Full name for display purposes
+    # Full name for display purposes, derived from the parts so it cannot drift from them
+    name = Column(String(255), Computed(USER_FULL_NAME_SQL, persisted=True))
     first_name = Column(String(100), nullable=False)
     last_name = Column(String(100), nullable=False)
     middle_name = Column(String(100), nullable=True)
@@ -190,19 +228,36 @@ class User(Base):
     # Foreign Keys
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=False)
     role_id = Column(UUID(as_uuid=True), ForeignKey("roles.id"), nullable=False)
-    supervisor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)
+    supervisor_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)
     level_rank = Column(Integer, default=2)  # For level comparison
 
     # Relationships
-    organization = relationship("Organization", back_populates="users")
-    supervisor = relationship("User", remote_side=[id], backref="subordinates")
-    role = relationship("Role", back_populates="users")
+    # Organization, role and supervisor are needed whenever a user is serialized or
+    # authenticated, so load them in the same query instead of one lazy SELECT each.
+    # join_depth=1 stops the self-referential join at the direct supervisor
+    organization = relationship("Organization", back_populates="users", lazy="joined")
+    supervisor = relationship("User", remote_side=[id], backref="subordinates", lazy="joined", join_depth=1)
+    role = relationship("Role", back_populates="users", lazy="joined")
     created_initiatives = relationship("Initiative", foreign_keys="Initiative.created_by", back_populates="creator")
     initiative_assignments = relationship("InitiativeAssignment", back_populates="user")
     goals = relationship("Goal", foreign_keys="Goal.created_by", back_populates="creator")
     owned_goals = relationship("Goal", foreign_keys="Goal.owner_id", back_populates="owner")
     user_history = relationship("UserHistory", foreign_keys="UserHistory.user_id", back_populates="user")
 
+    # Indexes
+    __table_args__ = (
+        # Covering index: supervisor checks by user id are answered from the index alone
+        Index('ix_users_id_supervisor', 'id', postgresql_include=['supervisor_id']),
+        # Onboarding/reset token lookups; only users with an outstanding token are indexed
+        Index(
+            'ix_users_onboarding_token', 'onboarding_token',
+            postgresql_where=text("onboarding_token IS NOT NULL")
+        ),
+        # Trigram indexes for the substring (ILIKE '%term%') user search
+        Index('ix_users_name_trgm', 'name', postgresql_using='gin', postgresql_ops={'name': 'gin_trgm_ops'}),
+        Index('ix_users_email_trgm', 'email', postgresql_using='gin', postgresql_ops={'email': 'gin_trgm_ops'}),
+    )
+
 class UserHistory(Base):
     """
     Comprehensive audit trail for all user changes
@@ -210,7 +265,7 @@ class UserHistory(Base):
     """
     __tablename__ = "user_history"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     action = Column(String(100), nullable=False)  # role_change, status_change, profile_edit, etc.
     old_value = Column(JSON)
     new_value = Column(JSON)
@@ -224,6 +279,17 @@ class UserHistory(Base):
     user = relationship("User", foreign_keys=[user_id], back_populates="user_history")
     admin = relationship("User", foreign_keys=[admin_id])
 
+    # Indexes
+    __table_args__ = (
+        # Audit trail for a user, newest first
+        Index('ix_user_history_user_created', 'user_id', 'created_at'),
+        # "When did this user's role change?" with per-field actions such as role_id_changed
+        Index('ix_user_history_user_action_created', 'user_id', 'action', 'created_at'),
+        # Append-only, so rows are physically in created_at order: a BRIN index
+        # serves time-range scans and retention deletes at a fraction of a btree's size
+        Index('ix_user_history_created_brin', 'created_at', postgresql_using='brin'),
+    )
+
 
 class RefreshToken(Base):
     """
@@ -232,8 +298,9 @@ class RefreshToken(Base):
     """
     __tablename__ = "refresh_tokens"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    token = Column(String(255), nullable=False, unique=True, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    # SHA-256 of the token; the raw value is only ever sent to the client
+    token_hash = Column(LargeBinary(32), nullable=False, unique=True)
     user_id = Column(UUID(as_uuid=True), ForeignKey("users.id", ondelete="CASCADE"), nullable=False)
     expires_at = Column(DateTime(timezone=True), nullable=False)
     revoked = Column(Boolean, default=False)
@@ -258,7 +325,7 @@ class Goal(Base):
     """
     __tablename__ = "goals"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     title = Column(String(1000), nullable=False)
     description = Column(Text)  # Now supports rich text (HTML)
     kpis = Column(Text, nullable=True)  # Key Performance Indicators
@@ -289,7 +356,7 @@ class Goal(Base):
     # Foreign Keys
     parent_goal_id = Column(UUID(as_uuid=True), ForeignKey("goals.id"), nullable=True)
     created_by = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=False)
-    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True)  # For INDIVIDUAL scope goals
+    owner_id = Column(UUID(as_uuid=True), ForeignKey("users.id"), nullable=True, index=True)  # For INDIVIDUAL scope goals
     organization_id = Column(UUID(as_uuid=True), ForeignKey("organizations.id"), nullable=True)  # For DEPARTMENTAL scope goals
 
     # Relationships
@@ -304,6 +371,20 @@ class Goal(Base):
     initiatives = relationship("Initiative", back_populates="goal")
     tags = relationship("GoalTag", secondary="goal_tag_assignments", back_populates="goals")
 
+    # Indexes
+    __table_args__ = (
+        # Supervisee goal lists filter by owner and status
+        Index('ix_goals_owner_status', 'owner_id', 'status'),
+        # Partial index: only goals awaiting approval are kept in it
+        Index('ix_goals_status_type', 'status', 'type', postgresql_where=text("status = 'PENDING_APPROVAL'")),
+        # Quarter freeze/unfreeze match on period, scope and frozen flag
+        Index('ix_goals_freeze_lookup', 'year', 'quarter', 'scope', 'frozen'),
+        # Stats and goal lists for users without goal_view_all filter by creator
+        Index('ix_goals_created_by', 'created_by'),
+    )
+    # Fetch server-generated created_at/updated_at via RETURNING during flush
+    __mapper_args__ = {"eager_defaults": True}
+
 class GoalProgressReport(Base):
     """
     Progress documentation for manual goal updates
@@ -311,7 +392,7 @@ class GoalProgressReport(Base):
     """
     __tablename__ = "goal_progress_reports"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     old_percentage = Column(Integer)
     new_percentage = Column(Integer)
     report = Column(Text, nullable=False)
@@ -325,6 +406,11 @@ class GoalProgressReport(Base):
     goal = relationship("Goal", back_populates="progress_reports")
     updater = relationship("User")
 
+    # Indexes
+    __table_args__ = (
+        Index('ix_goal_progress_reports_created_brin', 'created_at', postgresql_using='brin'),
+    )
+
 class Initiative(Base):
     """
     Core initiative management with individual and group support
@@ -333,12 +419,12 @@ class Initiative(Base):
     """
     __tablename__ = "initiatives"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     type = Column(Enum(InitiativeType), nullable=False)
     urgency = Column(Enum(InitiativeUrgency), default=InitiativeUrgency.MEDIUM)
-    due_date = Column(DateTime, nullable=False)
+    due_date = Column(DateTime(timezone=True), nullable=False)
     status = Column(Enum(InitiativeStatus), default=InitiativeStatus.PENDING_APPROVAL)
     score = Column(Integer)  # 1-10 scale, set during final approval
     feedback = Column(Text)
@@ -367,6 +453,18 @@ class Initiative(Base):
     extensions = relationship("InitiativeExtension", back_populates="initiative", cascade="all, delete-orphan")
     subtasks = relationship("InitiativeSubTask", back_populates="initiative", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        # Status + due date for overdue checks and due-soon dashboards
+        Index('ix_initiatives_status_due', 'status', 'due_date'),
+        Index('ix_initiatives_created_by_status', 'created_by', 'status'),
+        # Only initiatives the overdue sweep can still flip, so the index stays small
+        Index(
+            'ix_initiatives_overdue', 'due_date',
+            postgresql_where=text("status IN ('PENDING', 'ONGOING', 'UNDER_REVIEW')")
+        ),
+    )
+
 class InitiativeAssignment(Base):
     """
     Many-to-many relationship between initiatives and users
@@ -374,7 +472,7 @@ class InitiativeAssignment(Base):
     """
     __tablename__ = "initiative_assignments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
     # Foreign Keys
@@ -385,6 +483,13 @@ class InitiativeAssignment(Base):
     initiative = relationship("Initiative", back_populates="assignments")
     user = relationship("User", back_populates="initiative_assignments")
 
+    # Constraints and indexes
+    __table_args__ = (
+        UniqueConstraint('initiative_id', 'user_id', name='unique_initiative_assignment'),
+        # "Initiatives assigned to user X" lookups lead with the user
+        Index('ix_initiative_assignments_user_initiative', 'user_id', 'initiative_id'),
+    )
+
 class InitiativeSubmission(Base):
     """
     Initiative completion reports from assignees
@@ -392,7 +497,7 @@ class InitiativeSubmission(Base):
     """
     __tablename__ = "initiative_submissions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     report = Column(Text, nullable=False)
     submitted_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -404,6 +509,11 @@ class InitiativeSubmission(Base):
     initiative = relationship("Initiative", back_populates="submissions")
     submitter = relationship("User")
 
+    # Indexes
+    __table_args__ = (
+        Index('ix_initiative_submissions_submitted_brin', 'submitted_at', postgresql_using='brin'),
+    )
+
 class InitiativeDocument(Base):
     """
     File attachments for initiative submissions
@@ -411,7 +521,7 @@ class InitiativeDocument(Base):
     """
     __tablename__ = "initiative_documents"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     file_name = Column(String(255), nullable=False)
     file_path = Column(String(500), nullable=False)
     uploaded_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -431,8 +541,8 @@ class InitiativeExtension(Base):
     """
     __tablename__ = "initiative_extensions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    new_due_date = Column(DateTime, nullable=False)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    new_due_date = Column(DateTime(timezone=True), nullable=False)
     reason = Column(Text, nullable=False)
     status = Column(Enum(ExtensionStatus), default=ExtensionStatus.PENDING)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -455,7 +565,7 @@ class InitiativeSubTask(Base):
     """
     __tablename__ = "initiative_subtasks"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text, nullable=True)
     status = Column(String(20), default='pending')  # pending, completed
@@ -481,20 +591,20 @@ class ReviewCycle(Base):
     """
     __tablename__ = "review_cycles"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String(255), nullable=False)
     type = Column(String(50), nullable=False)  # quarterly, annual, probationary, project
     period = Column(String(50), nullable=False)  # Q1-2024, FY-2024, etc.
-    start_date = Column(DateTime, nullable=False)
-    end_date = Column(DateTime, nullable=False)
+    start_date = Column(DateTime(timezone=True), nullable=False)
+    end_date = Column(DateTime(timezone=True), nullable=False)
 
     # JSON configurations
-    phase_schedule = Column(JSON, nullable=False, default=dict)  # Timeline for different phases
+    phase_schedule = Column(JSONBType, nullable=False, default=dict)  # Timeline for different phases
     buffer_time = Column(String(20), default='1_week')  # Grace period for submissions
-    target_population = Column(JSON)  # Criteria for automatic participant selection
-    inclusion_criteria = Column(JSON)  # Who to include
+    target_population = Column(JSONBType)  # Criteria for automatic participant selection
+    inclusion_criteria = Column(JSONBType)  # Who to include
     exclusion_criteria = Column(JSON)  # Who to exclude
-    mandatory_participants = Column(JSON)  # List of user IDs that must participate
+    mandatory_participants = Column(JSONBType)  # List of user IDs that must participate
     components = Column(JSON, nullable=False, default=dict)  # Review components and weights
     ai_assistance = Column(JSON)  # AI configuration for insights and analysis
     calibration_sessions = Column(JSON)  # Calibration meeting configurations
@@ -516,6 +626,12 @@ class ReviewCycle(Base):
     reviews = relationship("Review", back_populates="cycle", cascade="all, delete-orphan")
     peer_reviews = relationship("PeerReview", back_populates="cycle", cascade="all, delete-orphan")
 
+    # Indexes
+    __table_args__ = (
+        Index('ix_review_cycles_target_population_gin', 'target_population', postgresql_using='gin'),
+        Index('ix_review_cycles_mandatory_participants_gin', 'mandatory_participants', postgresql_using='gin'),
+    )
+
 class Review(Base):
     """
     Individual review instances within a cycle
@@ -523,17 +639,17 @@ class Review(Base):
     """
     __tablename__ = "reviews"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     type = Column(Enum(ReviewType), nullable=False)
 
     # Response data and metadata
-    responses = Column(JSON)  # All form responses
+    responses = Column(JSONBType)  # All form responses
     completion_percentage = Column(Float, default=0.0)
     time_spent = Column(Integer, default=0)  # Minutes spent on review
     ai_insights = Column(JSON)  # AI-generated insights and suggestions
 
     status = Column(Enum(ReviewStatus), default=ReviewStatus.NOT_STARTED)
-    deadline = Column(DateTime)
+    deadline = Column(DateTime(timezone=True))
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -549,6 +665,11 @@ class Review(Base):
     reviewee = relationship("User", foreign_keys=[reviewee_id])
     reviewer = relationship("User", foreign_keys=[reviewer_id])
 
+    # Indexes
+    __table_args__ = (
+        Index('ix_reviews_cycle_reviewee', 'cycle_id', 'reviewee_id'),
+    )
+
 class PeerReview(Base):
     """
     Peer review assignments for 360-degree feedback
@@ -556,13 +677,13 @@ class PeerReview(Base):
     """
     __tablename__ = "peer_reviews"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     responses = Column(JSON)  # Peer feedback responses
     completion_percentage = Column(Float, default=0.0)
     time_spent = Column(Integer, default=0)
 
     status = Column(Enum(ReviewStatus), default=ReviewStatus.NOT_STARTED)
-    deadline = Column(DateTime)
+    deadline = Column(DateTime(timezone=True))
     relationship_context = Column(String(100))  # colleague, collaborator, etc.
 
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -588,7 +709,7 @@ class PerformanceRecord(Base):
     """
     __tablename__ = "performance_records"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     period = Column(String(50), nullable=False)  # Q1-2024, FY-2024
     period_start = Column(Date, nullable=False)
     period_end = Column(Date, nullable=False)
@@ -608,8 +729,8 @@ class PerformanceRecord(Base):
     innovation_creativity = Column(Float)
 
     # Qualitative assessments
-    strengths = Column(JSON)  # List of identified strengths
-    development_areas = Column(JSON)  # Areas needing improvement
+    strengths = Column(JSONBType)  # List of identified strengths
+    development_areas = Column(JSONBType)  # Areas needing improvement
     achievements = Column(JSON)  # Notable achievements
     feedback_summary = Column(Text)  # Consolidated feedback
 
@@ -631,7 +752,7 @@ class DevelopmentPlan(Base):
     """
     __tablename__ = "development_plans"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     title = Column(String(255), nullable=False)
     description = Column(Text)
     period = Column(String(50))  # FY-2024, Q1-Q2-2024
@@ -665,12 +786,12 @@ class CompetencyAssessment(Base):
     """
     __tablename__ = "competency_assessments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     competency_framework = Column(String(100), nullable=False)  # Technical, Leadership, Core
     assessment_date = Column(Date, nullable=False)
 
     # Assessment data
-    competency_scores = Column(JSON, nullable=False)  # Scores for each competency
+    competency_scores = Column(JSONBType, nullable=False)  # Scores for each competency
     evidence = Column(JSON)  # Evidence supporting the assessments
     assessor_notes = Column(Text)
     development_recommendations = Column(JSON)  # Specific recommendations
@@ -700,7 +821,7 @@ class ReviewTrait(Base):
     """
     __tablename__ = "review_traits"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String(255), nullable=False)
     description = Column(Text)
     is_active = Column(Boolean, default=True)
@@ -735,7 +856,7 @@ class ReviewQuestion(Base):
     """
     __tablename__ = "review_questions"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     question_text = Column(Text, nullable=False)
     applies_to_self = Column(Boolean, default=True)
     applies_to_peer = Column(Boolean, default=True)
@@ -759,7 +880,7 @@ class ReviewCycleTrait(Base):
     """
     __tablename__ = "review_cycle_traits"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     is_active = Column(Boolean, default=True)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
 
@@ -781,9 +902,9 @@ class ReviewAssignment(Base):
     """
     __tablename__ = "review_assignments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
-    review_type = Column(String(20), nullable=False)  # self, peer, supervisor
-    status = Column(String(20), default='pending')  # pending, in_progress, completed, overdue
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
+    review_type = Column(Enum(ReviewAssignmentType, values_callable=lambda x: [e.value for e in x]), nullable=False)
+    status = Column(Enum(ReviewAssignmentStatus, values_callable=lambda x: [e.value for e in x]), default=ReviewAssignmentStatus.PENDING)
     completed_at = Column(DateTime(timezone=True))
     created_at = Column(DateTime(timezone=True), server_default=func.now())
     updated_at = Column(DateTime(timezone=True), onupdate=func.now())
@@ -799,11 +920,20 @@ class ReviewAssignment(Base):
     reviewee = relationship("User", foreign_keys=[reviewee_id])
     responses = relationship("ReviewResponse", back_populates="assignment", cascade="all, delete-orphan")
 
-    # Constraints
+    # Constraints and indexes
     __table_args__ = (
         UniqueConstraint('cycle_id', 'reviewer_id', 'reviewee_id', 'review_type', name='unique_assignment'),
-        CheckConstraint("review_type IN ('self', 'peer', 'supervisor')", name='valid_review_type'),
-        CheckConstraint("status IN ('pending', 'in_progress', 'completed', 'overdue')", name='valid_status')
+        # Reviewer inboxes filter by reviewer, then status and cycle; covering so the
+        # dashboard columns come from the index alone
+        Index(
+            'ix_review_assignments_reviewer_status_cycle', 'reviewer_id', 'status', 'cycle_id',
+            postgresql_include=['reviewee_id', 'completed_at']
+        ),
+        # Per-reviewee completion checks and score aggregation within a cycle
+        Index(
+            'ix_review_assignments_reviewee_cycle', 'reviewee_id', 'cycle_id',
+            postgresql_include=['status', 'review_type']
+        ),
     )
 
 class ReviewResponse(Base):
@@ -812,7 +942,7 @@ class ReviewResponse(Base):
     """
     __tablename__ = "review_responses"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     rating = Column(Integer, nullable=False)  # 1-5 scale
     comment = Column(Text)
     created_at = Column(DateTime(timezone=True), server_default=func.now())
@@ -838,7 +968,7 @@ class ReviewScore(Base):
     """
     __tablename__ = "review_scores"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     self_score = Column(Numeric(3, 2))
     peer_score = Column(Numeric(3, 2))
     supervisor_score = Column(Numeric(3, 2))
@@ -866,7 +996,7 @@ class PerformanceScore(Base):
     """
     __tablename__ = "performance_scores"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     task_performance_score = Column(Numeric(5, 2))
     review_performance_score = Column(Numeric(5, 2))
     overall_performance_score = Column(Numeric(5, 2))  # task*0.6 + review*0.4
@@ -945,7 +1075,7 @@ class Notification(Base):
     """
     __tablename__ = "notifications"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     type = Column(Enum(NotificationType), nullable=False)
     priority = Column(Enum(NotificationPriority), default=NotificationPriority.MEDIUM)
 
@@ -972,6 +1102,14 @@ class Notification(Base):
     user = relationship("User", foreign_keys=[user_id])
     trigger_user = relationship("User", foreign_keys=[triggered_by])
 
+    # Indexes
+    __table_args__ = (
+        # A user's inbox, optionally unread only, newest first
+        Index('ix_notifications_user_read_created', 'user_id', 'is_read', 'created_at'),
+        # Expired-notification cleanup
+        Index('ix_notifications_expires', 'expires_at', postgresql_where=text("expires_at IS NOT NULL")),
+    )
+
 class GoalAssignment(Base):
     """
     Track supervisor-assigned goals to supervisees
@@ -979,7 +1117,7 @@ class GoalAssignment(Base):
     """
     __tablename__ = "goal_assignments"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Assignment status
     status = Column(Enum(GoalStatus), default=GoalStatus.PENDING_APPROVAL)
@@ -1011,7 +1149,7 @@ class GoalFreezeLog(Base):
     """
     __tablename__ = "goal_freeze_logs"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
 
     # Freeze/Unfreeze action
     action = Column(String(20), nullable=False)  # 'freeze' or 'unfreeze'
@@ -1036,6 +1174,8 @@ class GoalFreezeLog(Base):
     # Constraints
     __table_args__ = (
         CheckConstraint("action IN ('freeze', 'unfreeze')", name='valid_freeze_action'),
+        # Freeze logs are listed newest first
+        Index('ix_goal_freeze_logs_performed_at', 'performed_at'),
     )
 
 # Goal Tags/Labels - Association Table
@@ -1054,7 +1194,7 @@ class GoalTag(Base):
     """
     __tablename__ = "goal_tags"
 
-    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid.uuid4, index=True)
+    id = Column(UUID(as_uuid=True), primary_key=True, default=uuid7, index=True)
     name = Column(String(100), nullable=False, unique=True)
     color = Column(String(7), nullable=False, default="#6B7280")  # Hex color code
     description = Column(Text, nullable=True)
@@ -1064,4 +1204,50 @@ class GoalTag(Base):
 
     # Relationships
     creator = relationship("User")
-    goals = relationship("Goal", secondary="goal_tag_assignments", back_populates="tags")
\ No newline at end of file
+    goals = relationship("Goal", secondary="goal_tag_assignments", back_populates="tags")
+
+# gin_trgm_ops indexes need pg_trgm before create_all builds them
+event.listen(
+    Base.metadata, "before_create",
+    DDL("CREATE EXTENSION IF NOT EXISTS pg_trgm").execute_if(dialect="postgresql")
+)
+
+# Loader options for list endpoints. Wrap them with strict_loads() so touching a
+# relationship that is not listed raises instead of issuing a lazy SELECT per row
+USER_LIST_OPTIONS = (
+    joinedload(User.organization),
+    joinedload(User.role),
+    joinedload(User.supervisor),
+)
+
+# Login, refresh and get_current_user read only the role and organization; wrap
+# with strict_loads() so the auth path stays at a single user query
+AUTH_USER_OPTIONS = (
+    joinedload(User.role),
+    joinedload(User.organization),
+    # Lets get_current_db_user reuse the authenticated user for notifications
+    joinedload(User.supervisor),
+)
+
+INITIATIVE_LIST_OPTIONS = (
+    selectinload(Initiative.assignments).joinedload(InitiativeAssignment.user),
+    joinedload(Initiative.creator),
+    joinedload(Initiative.team_head),
+    joinedload(Initiative.goal),
+    selectinload(Initiative.submissions),
+    selectinload(Initiative.documents),
+    selectinload(Initiative.extensions),
+)
+
+# Turn off to let unlisted relationships fall back to lazy loading instead of raising
+STRICT_LOADING = config("STRICT_LOADING", default=True, cast=bool)
+
+def strict_loads(*options):
+    """Return the given loader options plus raiseload('*') for every other relationship"""
+    if not STRICT_LOADING:
+        return options
+    return (*options, raiseload("*"))
+
+def column_values(obj) -> dict:
+    """Column attribute values of an instance, without relationships, for building response schemas"""
+    return {attr.key: getattr(obj, attr.key) for attr in inspect(obj).mapper.column_attrs}
@@ -0,0 +1,106 @@
+"""
+Shared cache client
+Uses Redis when REDIS_URL is configured, otherwise an in-process TTL cache
+Values are JSON-serialized so both backends store the same shapes
+"""
+
+import json
+import logging
+import threading
+import time
+from collections import OrderedDict
+from typing import Any, Optional
+
+from decouple import config
+
+logger = logging.getLogger(__name__)
+
+REDIS_URL = config("REDIS_URL", default="")
+LOCAL_CACHE_MAX_ENTRIES = config("LOCAL_CACHE_MAX_ENTRIES", default=1024, cast=int)
+
+
+class Cache:
+    """
+    Minimal get/set/delete cache with per-key TTL
+    Redis errors are logged and treated as cache misses so callers always
+    fall back to the database
+    The in-process store is bounded: expired entries are purged on every set
+    and the least recently used entry is evicted once max_entries is reached
+    """
+
+    def __init__(self, url: str = "", max_entries: int = LOCAL_CACHE_MAX_ENTRIES):
+        self._redis = None
+        self._local = OrderedDict()
+        self._max_entries = max_entries
+        self._lock = threading.Lock()
+
+        if url:
+            try:
+                import redis
+                self._redis = redis.Redis.from_url(url, decode_responses=True, socket_timeout=1)
+            except Exception as e:
+                logger.warning(f"Redis unavailable, using in-process cache: {e}")
+
+    def get(self, key: str) -> Optional[Any]:
+        if self._redis is not None:
+            try:
+                raw = self._redis.get(key)
+            except Exception as e:
+                logger.warning(f"Redis get failed for {key}: {e}")
+                return None
+            return json.loads(raw) if raw is not None else None
+
+        with self._lock:
+            entry = self._local.get(key)
+            if entry is None:
+                return None
+            expires_at, value = entry
+            if expires_at is not None and expires_at < time.monotonic():
+                del self._local[key]
+                return None
+            self._local.move_to_end(key)
+            return value
+
+    def set(self, key: str, value: Any, ttl: Optional[int] = None):
+        if self._redis is not None:
+            try:
+                self._redis.set(key, json.dumps(value), ex=ttl)
+            except Exception as e:
+                logger.warning(f"Redis set failed for {key}: {e}")
+            return
+
+        expires_at = time.monotonic() + ttl if ttl else None
+        # Round-trip through JSON so cached values never alias caller objects
+        with self._lock:
+            self._purge_expired()
+            self._local[key] = (expires_at, json.loads(json.dumps(value)))
+            self._local.move_to_end(key)
+            while len(self._local) > self._max_entries:
+                self._local.popitem(last=False)
+
+    def delete(self, *keys: str):
+        if not keys:
+            return
+        if self._redis is not None:
+            try:
+                self._redis.delete(*keys)
+            except Exception as e:
+                logger.warning(f"Redis delete failed for {keys}: {e}")
+            return
+
+        with self._lock:
+            for key in keys:
+                self._local.pop(key, None)
+
+    def _purge_expired(self):
+        """Drop expired local entries; caller holds the lock"""
+        now = time.monotonic()
+        expired = [
+            key for key, (expires_at, _) in self._local.items()
+            if expires_at is not None and expires_at < now
+        ]
+        for key in expired:
+            del self._local[key]
+
+
+cache = Cache(REDIS_URL)
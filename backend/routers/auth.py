@@ -4,14 +4,15 @@ Based on CLAUDE.md specification with onboarding flow
 Supports refresh token pattern for extended sessions
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Request
+from sqlalchemy import func, or_
+from sqlalchemy.orm import Session, load_only
 from datetime import timedelta, datetime, timezone
 from pydantic import BaseModel
 from typing import Optional
 
 from database import get_db
-from models import User, UserStatus
+from models import User, UserStatus, AUTH_USER_OPTIONS, strict_loads
 from schemas.auth import (
     LoginRequest, LoginResponse, OnboardingRequest,
     PasswordResetRequest, PasswordChangeRequest, UserSession
@@ -20,10 +21,11 @@ from utils.auth import (
     authenticate_user, create_access_token, get_current_user,
     verify_password, get_password_hash, generate_onboarding_token,
     ACCESS_TOKEN_EXPIRE_MINUTES, get_role_version,
-    create_refresh_token, validate_refresh_token, revoke_refresh_token,
+    create_refresh_token, consume_refresh_token, revoke_refresh_token,
     revoke_all_user_refresh_tokens, REFRESH_TOKEN_EXPIRE_DAYS
 )
 from utils.permissions import UserPermissions
+from utils.notifications import send_password_reset_notification
 
 router = APIRouter(tags=["authentication"])
 
@@ -39,7 +41,7 @@ class TokenResponse(BaseModel):
     expires_in: int  # Access token expiry in seconds
 
 @router.post("/login")
-async def login(
+def login(
     login_data: LoginRequest,
     request: Request,
     db: Session = Depends(get_db)
@@ -74,7 +76,7 @@ async def login(
     # Create refresh token
     user_agent = request.headers.get("user-agent")
     client_ip = request.client.host if request.client else None
-    refresh_token_obj = create_refresh_token(
+    refresh_token = create_refresh_token(
         db=db,
         user_id=user.id,
         user_agent=user_agent,
@@ -85,23 +87,16 @@ async def login(
     permission_service = UserPermissions(db)
     user_perms = permission_service.get_user_effective_permissions(user)
 
-    # Compute full name from separate fields
-    name_parts = [user.first_name]
-    if user.middle_name:
-        name_parts.append(user.middle_name)
-    name_parts.append(user.last_name)
-    full_name = " ".join(name_parts)
-
     return {
         "access_token": access_token,
-        "refresh_token": refresh_token_obj.token,
+        "refresh_token": refresh_token,
         "token_type": "bearer",
         "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,  # in seconds
         "refresh_expires_in": REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,  # in seconds
         "user": {
             "id": str(user.id),
             "email": user.email,
-            "name": full_name,
+            "name": user.name,
             "first_name": user.first_name,
             "last_name": user.last_name,
             "middle_name": user.middle_name,
@@ -119,7 +114,7 @@ class LogoutRequest(BaseModel):
 
 
 @router.post("/logout")
-async def logout(
+def logout(
     logout_data: Optional[LogoutRequest] = None,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -140,7 +135,7 @@ async def logout(
         return {"message": "Successfully logged out"}
 
 @router.post("/onboard")
-async def onboard_user(
+def onboard_user(
     onboarding_data: OnboardingRequest,
     db: Session = Depends(get_db)
 ):
@@ -150,18 +145,15 @@ async def onboard_user(
     - For existing users: Reset password (when initiated via forgot-password flow)
     Users receive email with secure token → set password → gain system access
     """
-    user = db.query(User).filter(User.onboarding_token == onboarding_data.token).first()
+    # Only the user row itself is needed; expired tokens are filtered out in the query
+    user = db.query(User).options(*strict_loads()).filter(
+        User.onboarding_token == onboarding_data.token,
+        or_(User.onboarding_token_expires_at.is_(None), User.onboarding_token_expires_at > func.now())
+    ).first()
     if not user:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Invalid or expired onboarding token"
-        )
-
-    # Check if token is expired
-    if user.onboarding_token_expires_at and user.onboarding_token_expires_at < datetime.now(timezone.utc):
-        raise HTTPException(
-            status_code=status.HTTP_400_BAD_REQUEST,
-            detail="Token has expired. Please request a new password reset link."
+            detail="Invalid or expired onboarding token. Please request a new password reset link."
         )
 
     # Determine if this is onboarding or password reset
@@ -183,33 +175,39 @@ async def onboard_user(
     return {"message": message}
 
 @router.post("/reset-password")
-async def reset_password(
+def reset_password(
     reset_data: PasswordResetRequest,
+    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
     Password reset via email
     Generates new onboarding token and sends email
     """
-    user = db.query(User).filter(User.email == reset_data.email).first()
+    # Only the columns needed to issue the token
+    user = db.query(User).options(
+        load_only(User.id, User.onboarding_token, User.onboarding_token_expires_at),
+        *strict_loads()
+    ).filter(User.email == reset_data.email).first()
     if not user:
         # Don't reveal if email exists for security
         return {"message": "If the email exists, a reset link has been sent"}
 
     # Generate new onboarding token with 7-day expiration
-    user.onboarding_token = generate_onboarding_token()
+    user_id = user.id
+    reset_token = generate_onboarding_token()
+    user.onboarding_token = reset_token
     user.onboarding_token_expires_at = datetime.now(timezone.utc) + timedelta(days=7)
     db.commit()
 
-    # Send password reset email
-    from utils.notifications import NotificationService
-    notification_service = NotificationService(db)
-    notification_service.notify_password_reset(user, user.onboarding_token)
+    # Send password reset email after the response, so response time does not
+    # depend on the mail provider or reveal whether the email exists
+    background_tasks.add_task(send_password_reset_notification, user_id, reset_token)
 
     return {"message": "If the email exists, a reset link has been sent"}
 
 @router.post("/change-password")
-async def change_password(
+def change_password(
     password_data: PasswordChangeRequest,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -217,7 +215,7 @@ async def change_password(
     """
     Change password for authenticated user
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
+    user = db.query(User).options(*strict_loads()).filter(User.id == current_user.user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
@@ -250,7 +248,7 @@ async def get_session_data(current_user: UserSession = Depends(get_current_user)
     return current_user
 
 @router.post("/refresh")
-async def refresh_access_token(
+def refresh_access_token(
     refresh_data: RefreshTokenRequest,
     request: Request,
     db: Session = Depends(get_db)
@@ -259,22 +257,22 @@ async def refresh_access_token(
     Refresh access token using refresh token
     Does NOT require valid access token - allows refreshing expired sessions
     """
-    # Validate refresh token
-    refresh_token_obj = validate_refresh_token(db, refresh_data.refresh_token)
-    if not refresh_token_obj:
+    # Revoke the presented token; rotation and the new token commit together
+    user_id = consume_refresh_token(db, refresh_data.refresh_token)
+    if not user_id:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid or expired refresh token"
         )
 
     # Get user from refresh token
-    user = db.query(User).filter(User.id == refresh_token_obj.user_id).first()
+    user = db.query(User).options(*strict_loads(*AUTH_USER_OPTIONS)).filter(User.id == user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     if user.status != UserStatus.ACTIVE:
-        # Revoke the refresh token if user is no longer active
-        revoke_refresh_token(db, refresh_data.refresh_token)
+        # Keep the refresh token revoked if user is no longer active
+        db.commit()
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="User account is not active"
@@ -290,28 +288,25 @@ async def refresh_access_token(
         expires_delta=access_token_expires
     )
 
-    # Optionally rotate refresh token for better security
-    # Revoke old token and create new one
-    revoke_refresh_token(db, refresh_data.refresh_token)
+    # Create the replacement refresh token
     user_agent = request.headers.get("user-agent")
     client_ip = request.client.host if request.client else None
     new_refresh_token = create_refresh_token(
         db=db,
         user_id=user.id,
         user_agent=user_agent,
-        ip_address=client_ip
+        ip_address=client_ip,
+        commit=False
     )
 
-    # Get user permissions
-    permission_service = UserPermissions(db)
-    user_perms = permission_service.get_user_effective_permissions(user)
+    db.commit()
 
+    # Permissions are not repeated here: clients get them from /login and /me,
+    # and the role_version in the new access token flags when they change
     return {
         "access_token": access_token,
-        "refresh_token": new_refresh_token.token,
+        "refresh_token": new_refresh_token,
         "token_type": "bearer",
         "expires_in": ACCESS_TOKEN_EXPIRE_MINUTES * 60,
-        "refresh_expires_in": REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60,
-        "permissions": user_perms["permissions"],
-        "scope": user_perms["effective_scope"]
+        "refresh_expires_in": REFRESH_TOKEN_EXPIRE_DAYS * 24 * 60 * 60
     }
\ No newline at end of file
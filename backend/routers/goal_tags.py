@@ -12,11 +12,11 @@ from models import GoalTag, User
 from schemas.goals import GoalTagCreate, GoalTag as GoalTagSchema
 from utils.auth import get_current_user, UserSession
 
-router = APIRouter(prefix="/api/goal-tags", tags=["Goal Tags"])
+router = APIRouter(tags=["Goal Tags"])
 
 
 @router.get("/", response_model=List[GoalTagSchema])
-async def get_all_tags(
+def get_all_tags(
     db: Session = Depends(get_db),
     current_user: UserSession = Depends(get_current_user)
 ):
@@ -26,7 +26,7 @@ async def get_all_tags(
 
 
 @router.post("/", response_model=GoalTagSchema)
-async def create_tag(
+def create_tag(
     tag_data: GoalTagCreate,
     db: Session = Depends(get_db),
     current_user: UserSession = Depends(get_current_user)
@@ -63,7 +63,7 @@ async def create_tag(
 
 
 @router.put("/{tag_id}", response_model=GoalTagSchema)
-async def update_tag(
+def update_tag(
     tag_id: str,
     tag_data: GoalTagCreate,
     db: Session = Depends(get_db),
@@ -108,7 +108,7 @@ async def update_tag(
 
 
 @router.delete("/{tag_id}")
-async def delete_tag(
+def delete_tag(
     tag_id: str,
     db: Session = Depends(get_db),
     current_user: UserSession = Depends(get_current_user)
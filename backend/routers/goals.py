@@ -3,15 +3,18 @@ Goal Management API Router
 Based on CLAUDE.md specification with hierarchical goal cascade
 """
 
-from fastapi import APIRouter, Depends, HTTPException, status, Query
-from sqlalchemy.orm import Session
+from fastapi import APIRouter, BackgroundTasks, Depends, HTTPException, status, Query, Request, Response
+from sqlalchemy import func, exists, update, select, or_, and_, tuple_
+from sqlalchemy.orm import Session, selectinload, joinedload
 from typing import List, Optional
+from pydantic import TypeAdapter
 import uuid
 import json
 from datetime import datetime
 
 from database import get_db
-from models import Goal, GoalScope, GoalType, GoalStatus, User, Quarter, GoalFreezeLog, Organization, OrganizationLevel
+from redis_client import cache
+from models import Goal, GoalScope, GoalType, GoalStatus, User, Quarter, GoalFreezeLog, Organization, OrganizationLevel, strict_loads
 from schemas.goals import (
     GoalCreate, GoalUpdate, GoalProgressUpdate, GoalStatusUpdate,
     Goal as GoalSchema, GoalWithChildren, GoalProgressReport, GoalList, GoalStats,
@@ -19,10 +22,13 @@ from schemas.goals import (
     GoalFreezeLog as GoalFreezeLogSchema
 )
 from schemas.auth import UserSession
-from utils.auth import get_current_user
+from utils.auth import get_current_user, get_current_db_user
 from utils.permissions import UserPermissions, SystemPermissions
 from utils.goal_cascade import GoalCascadeService
-from utils.notifications import NotificationService
+from utils.hierarchy import organization_subtree_query
+from utils.notifications import (
+    NotificationService, send_goal_notification, send_goal_created_notification, send_goals_freeze_notification
+)
 
 router = APIRouter(tags=["goals"])
 
@@ -55,44 +61,99 @@ def deserialize_kpis(kpis_json: Optional[str]) -> Optional[List[str]]:
         # Backward compatibility: if it's not valid JSON, treat as single item
         return [kpis_json] if kpis_json else None
 
-def enrich_goal_dict(goal_dict: dict, goal: Goal, db: Session) -> dict:
-    """Enrich goal dictionary with deserialized KPIs and related names"""
+# Relationships read by enrich_goal_dict / GoalSchema, loaded up front for list endpoints
+GOAL_LIST_OPTIONS = (
+    selectinload(Goal.owner),
+    selectinload(Goal.creator),
+    selectinload(Goal.approver),
+    selectinload(Goal.organization),
+    selectinload(Goal.tags),
+    joinedload(Goal.parent_goal),
+)
+
+# Rows fetched per round trip when streaming large goal lists
+GOAL_STREAM_BATCH_SIZE = 100
+
+def get_child_counts(db: Session, goal_ids: List[uuid.UUID]) -> dict:
+    """Count child goals for many parents in a single GROUP BY query"""
+    if not goal_ids:
+        return {}
+    rows = db.query(Goal.parent_goal_id, func.count(Goal.id)).filter(
+        Goal.parent_goal_id.in_(goal_ids)
+    ).group_by(Goal.parent_goal_id).all()
+    return {parent_id: count for parent_id, count in rows}
+
+def paginate_query(query, page: int, per_page: int):
+    """
+    Fetch one page of a query together with the total match count
+    The total comes from count(*) OVER () on the same SELECT, so the
+    filter is evaluated once instead of a separate COUNT round trip
+    """
+    offset = (page - 1) * per_page
+    rows = query.add_columns(func.count().over().label('total')).offset(offset).limit(per_page).all()
+    if rows:
+        return [row[0] for row in rows], rows[0].total
+    # Past the last page no row carries the total, so fall back to a COUNT
+    return [], query.count() if page > 1 else 0
+
+def enrich_goal_dict(goal_dict: dict, goal: Goal, db: Session, child_count: Optional[int] = None) -> dict:
+    """
+    Enrich goal dictionary with deserialized KPIs and related names
+    Names are read through the goal's relationships so eager-loaded lists
+    don't issue a query per goal; pass child_count from get_child_counts to
+    skip the per-goal COUNT as well
+    """
     # Deserialize KPIs
     goal_dict['kpis'] = deserialize_kpis(goal.kpis)
 
     # Add organization name for DEPARTMENTAL goals
     if goal.organization_id:
-        org = db.query(Organization).filter(Organization.id == goal.organization_id).first()
-        goal_dict['organization_name'] = org.name if org else None
+        goal_dict['organization_name'] = goal.organization.name if goal.organization else None
 
     # Add owner name for INDIVIDUAL goals
     if goal.owner_id:
-        owner = db.query(User).filter(User.id == goal.owner_id).first()
-        goal_dict['owner_name'] = owner.name if owner else None
+        goal_dict['owner_name'] = goal.owner.name if goal.owner else None
 
     # Add creator name
     if goal.created_by:
-        creator = db.query(User).filter(User.id == goal.created_by).first()
-        goal_dict['creator_name'] = creator.name if creator else None
+        goal_dict['creator_name'] = goal.creator.name if goal.creator else None
 
     # Add approver name
     if goal.approved_by:
-        approver = db.query(User).filter(User.id == goal.approved_by).first()
-        goal_dict['approver_name'] = approver.name if approver else None
+        goal_dict['approver_name'] = goal.approver.name if goal.approver else None
 
     # Add parent goal title
     if goal.parent_goal_id:
-        parent = db.query(Goal).filter(Goal.id == goal.parent_goal_id).first()
-        goal_dict['parent_goal_title'] = parent.title if parent else None
+        goal_dict['parent_goal_title'] = goal.parent_goal.title if goal.parent_goal else None
 
     # Add child count
-    child_count = db.query(Goal).filter(Goal.parent_goal_id == goal.id).count()
+    if child_count is None:
+        child_count = db.query(Goal).filter(Goal.parent_goal_id == goal.id).count()
     goal_dict['child_count'] = child_count
 
     return goal_dict
 
+# Validates a whole list of ORM goals in one pydantic-core call
+_goal_list_adapter = TypeAdapter(List[GoalSchema])
+_freeze_log_list_adapter = TypeAdapter(List[GoalFreezeLogSchema])
+
+FREEZE_LOGS_CACHE_TTL = 30
+
+def serialize_goals(goals: List[Goal], db: Session, child_counts: Optional[dict] = None) -> List[GoalSchema]:
+    """
+    Build enriched goal responses for a list endpoint
+    The batch is validated once instead of from_orm + re-validation per goal;
+    the enriched names are then set on the validated models
+    """
+    responses = _goal_list_adapter.validate_python(goals, from_attributes=True)
+    for response, goal in zip(responses, goals):
+        child_count = child_counts.get(goal.id, 0) if child_counts is not None else None
+        for field, value in enrich_goal_dict({}, goal, db, child_count).items():
+            setattr(response, field, value)
+    return responses
+
 @router.get("/", response_model=GoalList)
-async def get_goals(
+def get_goals(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     scope: Optional[GoalScope] = Query(None, description="Filter by goal scope: COMPANY_WIDE, DEPARTMENTAL, or INDIVIDUAL"),
@@ -100,6 +161,7 @@ async def get_goals(
     status: Optional[GoalStatus] = None,
     owner_id: Optional[uuid.UUID] = Query(None, description="Filter goals by owner user ID"),
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -112,17 +174,13 @@ async def get_goals(
     - INDIVIDUAL: Personal employee goals - user sees their own and supervisees' goals
     - No scope parameter: All goals user has access to (default behavior)
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Get user's organization
     user_org = db.query(Organization).filter(Organization.id == user.organization_id).first()
     if not user_org:
         raise HTTPException(status_code=404, detail="User organization not found")
 
-    # Build base query
-    query = db.query(Goal)
+    # Build base query; related rows for the response are batch-loaded per page
+    query = db.query(Goal).options(*strict_loads(*GOAL_LIST_OPTIONS))
 
     # Check if user has admin access
     is_admin = permission_service.user_has_permission(user, SystemPermissions.GOAL_VIEW_ALL)
@@ -144,17 +202,7 @@ async def get_goals(
                 pass  # No additional filtering
             elif user_org.level == OrganizationLevel.DIRECTORATE:
                 # Directorate-level users can see all departmental goals in their directorate
-                # Get all organizations under this directorate
-                def get_all_child_org_ids(org_id):
-                    """Recursively get all child organization IDs"""
-                    child_ids = [org_id]
-                    children = db.query(Organization).filter(Organization.parent_id == org_id).all()
-                    for child in children:
-                        child_ids.extend(get_all_child_org_ids(child.id))
-                    return child_ids
-
-                accessible_org_ids = get_all_child_org_ids(user.organization_id)
-                query = query.filter(Goal.organization_id.in_(accessible_org_ids))
+                query = query.filter(Goal.organization_id.in_(organization_subtree_query(user.organization_id)))
             else:
                 # Department/Division/Unit level users can only see goals in their department
                 query = query.filter(Goal.organization_id == user.organization_id)
@@ -165,10 +213,9 @@ async def get_goals(
         query = query.filter(Goal.scope == GoalScope.INDIVIDUAL)
 
         if not is_admin:
-            # Get user's supervisees
-            supervisee_ids = [s.id for s in db.query(User).filter(User.supervisor_id == user.id).all()]
+            # Supervisee IDs stay in SQL as a semi-join within the same statement
+            supervisee_ids = select(User.id).where(User.supervisor_id == user.id)
 
-            from sqlalchemy import or_
             query = query.filter(
                 or_(
                     Goal.owner_id == user.id,
@@ -181,29 +228,26 @@ async def get_goals(
         # No scope specified - return all goals user has access to
         # This is the default behavior for backward compatibility
         if not is_admin:
-            from sqlalchemy import or_
-
-            # Get supervisees
-            supervisee_ids = [s.id for s in db.query(User).filter(User.supervisor_id == user.id).all()]
+            # Supervisees and accessible organizations stay in SQL as subqueries,
+            # so the visibility filter and page count run as a single statement
+            supervisee_ids = select(User.id).where(User.supervisor_id == user.id)
 
             # Determine accessible organizations for departmental goals
             if user_org.level == OrganizationLevel.GLOBAL:
-                accessible_org_ids = [org.id for org in db.query(Organization).all()]
+                departmental_filter = Goal.scope == GoalScope.DEPARTMENTAL
             elif user_org.level == OrganizationLevel.DIRECTORATE:
-                def get_all_child_org_ids(org_id):
-                    child_ids = [org_id]
-                    children = db.query(Organization).filter(Organization.parent_id == org_id).all()
-                    for child in children:
-                        child_ids.extend(get_all_child_org_ids(child.id))
-                    return child_ids
-                accessible_org_ids = get_all_child_org_ids(user.organization_id)
+                departmental_filter = (Goal.scope == GoalScope.DEPARTMENTAL) & (
+                    Goal.organization_id.in_(organization_subtree_query(user.organization_id))
+                )
             else:
-                accessible_org_ids = [user.organization_id]
+                departmental_filter = (Goal.scope == GoalScope.DEPARTMENTAL) & (
+                    Goal.organization_id == user.organization_id
+                )
 
             # Combined visibility filter
             visibility_filter = or_(
                 Goal.scope == GoalScope.COMPANY_WIDE,
-                (Goal.scope == GoalScope.DEPARTMENTAL) & (Goal.organization_id.in_(accessible_org_ids)),
+                departmental_filter,
                 (Goal.scope == GoalScope.INDIVIDUAL) & (
                     or_(
                         Goal.owner_id == user.id,
@@ -224,19 +268,12 @@ async def get_goals(
     if status:
         query = query.filter(Goal.status == status)
 
-    # Get total count
-    total = query.count()
-
-    # Apply pagination
-    offset = (page - 1) * per_page
-    goals = query.offset(offset).limit(per_page).all()
+    # Fetch the requested page and the total count in one query
+    goals, total = paginate_query(query, page, per_page)
 
     # Enrich goals with additional names and counts
-    goal_responses = []
-    for goal in goals:
-        goal_dict = GoalSchema.from_orm(goal).dict()
-        goal_dict = enrich_goal_dict(goal_dict, goal, db)
-        goal_responses.append(GoalSchema(**goal_dict))
+    child_counts = get_child_counts(db, [goal.id for goal in goals])
+    goal_responses = serialize_goals(goals, db, child_counts)
 
     return GoalList(
         goals=goal_responses,
@@ -246,44 +283,59 @@ async def get_goals(
     )
 
 @router.get("/supervisees", response_model=List[GoalSchema])
-async def get_supervisees_goals(
+def get_supervisees_goals(
+    pending_only: bool = Query(False, description="Only return goals awaiting approval"),
+    page: int = Query(1, ge=1),
+    per_page: Optional[int] = Query(None, ge=1, le=100, description="Page size; omit to return every goal"),
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
     """
     Get all goals belonging to the current user's supervisees
-    Only returns individual goals
+    Only returns individual goals; pending_only narrows to the approval queue
+    With per_page, returns one page (newest first) and the match count in X-Total-Count
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Get all supervisees
-    supervisees = db.query(User).filter(User.supervisor_id == user.id).all()
-    supervisee_ids = [s.id for s in supervisees]
-
-    if not supervisee_ids:
-        return []
+    # Supervisee IDs stay in SQL as a semi-join, so large teams never hit bind-parameter limits
+    supervisee_ids = select(User.id).where(User.supervisor_id == current_user.user_id)
+    filters = [Goal.scope == GoalScope.INDIVIDUAL, Goal.owner_id.in_(supervisee_ids)]
+    if pending_only:
+        filters.append(Goal.status == GoalStatus.PENDING_APPROVAL)
+
+    if per_page is not None:
+        query = db.query(Goal).options(*strict_loads(*GOAL_LIST_OPTIONS)).filter(*filters).order_by(
+            Goal.created_at.desc(), Goal.id
+        )
+        goals, total = paginate_query(query, page, per_page)
+        child_counts = get_child_counts(db, [goal.id for goal in goals])
+        return Response(
+            content=_goal_list_adapter.dump_json(serialize_goals(goals, db, child_counts)),
+            media_type="application/json",
+            headers={"X-Total-Count": str(total)}
+        )
 
-    # Get all individual goals owned by supervisees
-    goals = db.query(Goal).filter(
-        Goal.scope == GoalScope.INDIVIDUAL,
-        Goal.owner_id.in_(supervisee_ids)
-    ).all()
+    # Stream individual goals owned by supervisees in batches, with related rows batch-loaded
+    stmt = select(Goal).options(*strict_loads(*GOAL_LIST_OPTIONS)).where(*filters).execution_options(
+        yield_per=GOAL_STREAM_BATCH_SIZE
+    )
 
-    # Manually populate owner_name, creator_name, and other user names for each goal
+    # Populate owner_name, creator_name, and other user names for each goal
     goal_responses = []
-    for goal in goals:
-        goal_dict = GoalSchema.from_orm(goal).dict()
-        goal_dict = enrich_goal_dict(goal_dict, goal, db)
-        goal_responses.append(GoalSchema(**goal_dict))
+    for goals in db.execute(stmt).scalars().partitions():
+        child_counts = get_child_counts(db, [goal.id for goal in goals])
+        goal_responses.extend(serialize_goals(goals, db, child_counts))
+        # Release serialized goals from the identity map as we go
+        for goal in goals:
+            db.expunge(goal)
 
-    return goal_responses
+    # The models were validated above; encode them once instead of letting
+    # response_model re-validate and re-encode the whole list
+    return Response(content=_goal_list_adapter.dump_json(goal_responses), media_type="application/json")
 
 @router.get("/stats", response_model=GoalStats)
-async def get_goal_stats(
+def get_goal_stats(
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -291,40 +343,39 @@ async def get_goal_stats(
     Get goal statistics and analytics
     Returns stats based on user's access scope
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Get accessible organizations
-    accessible_org_ids = permission_service.get_accessible_organizations(user)
+    # Aggregate in the database: one row per (type, status) group instead of every goal
+    from datetime import date
+    today = date.today()
+    query = db.query(
+        Goal.type,
+        Goal.status,
+        func.count(Goal.id),
+        func.coalesce(func.sum(Goal.progress_percentage), 0),
+        func.count(Goal.id).filter(and_(Goal.end_date < today, Goal.status == GoalStatus.ACTIVE))
+    )
 
     # Get all goals (company-wide)
-    if permission_service.user_has_permission(user, SystemPermissions.GOAL_VIEW_ALL):
-        goals = db.query(Goal).all()
-    else:
+    if not permission_service.user_has_permission(user, SystemPermissions.GOAL_VIEW_ALL):
         # Can only see goals they created
-        goals = db.query(Goal).filter(Goal.created_by == user.id).all()
+        query = query.filter(Goal.created_by == user.id)
 
     # Calculate statistics
-    total_goals = len(goals)
-
-    by_type = {}
-    for goal_type in GoalType:
-        by_type[goal_type.value] = sum(1 for goal in goals if goal.type == goal_type)
-
-    by_status = {}
-    for goal_status in GoalStatus:
-        by_status[goal_status.value] = sum(1 for goal in goals if goal.status == goal_status)
+    by_type = {goal_type.value: 0 for goal_type in GoalType}
+    by_status = {goal_status.value: 0 for goal_status in GoalStatus}
+    total_goals = 0
+    total_progress = 0
+    overdue_goals = 0
+    for goal_type, goal_status, count, progress, overdue in query.group_by(Goal.type, Goal.status):
+        if goal_type is not None:
+            by_type[goal_type.value] += count
+        if goal_status is not None:
+            by_status[goal_status.value] += count
+        total_goals += count
+        total_progress += progress
+        overdue_goals += overdue
 
     # Calculate average progress
-    total_progress = sum(goal.progress_percentage for goal in goals if goal.progress_percentage)
-    average_progress = total_progress / len(goals) if goals else 0
-
-    # Count overdue goals
-    from datetime import date
-    today = date.today()
-    overdue_goals = sum(1 for goal in goals
-                       if goal.end_date < today and goal.status == GoalStatus.ACTIVE)
+    average_progress = float(total_progress) / total_goals if total_goals else 0
 
     return GoalStats(
         total_goals=total_goals,
@@ -335,9 +386,11 @@ async def get_goal_stats(
     )
 
 @router.post("/freeze-quarter", response_model=FreezeGoalsResponse)
-async def freeze_goals_for_quarter(
+def freeze_goals_for_quarter(
     freeze_request: FreezeGoalsRequest,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -346,10 +399,6 @@ async def freeze_goals_for_quarter(
     Frozen goals cannot be edited
     Only users with goal_freeze permission can freeze goals
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Permission check
     if not permission_service.user_has_permission(user, 'goal_freeze'):
         raise HTTPException(
@@ -357,41 +406,19 @@ async def freeze_goals_for_quarter(
             detail="You do not have permission to freeze goals"
         )
 
-    # Get all individual goals for the specified quarter and year
-    goals = db.query(Goal).filter(
-        Goal.scope == GoalScope.INDIVIDUAL,
-        Goal.quarter == freeze_request.quarter,
-        Goal.year == freeze_request.year,
-        Goal.frozen == False  # Only freeze goals that aren't already frozen
-    ).all()
-
-    if not goals:
-        # Still log the action even if no goals found
-        freeze_log = GoalFreezeLog(
-            action='freeze',
-            quarter=freeze_request.quarter,
-            year=freeze_request.year,
-            affected_goals_count=0,
-            scheduled_unfreeze_date=freeze_request.scheduled_unfreeze_date,
-            performed_by=user.id
-        )
-        db.add(freeze_log)
-        db.commit()
-
-        return FreezeGoalsResponse(
-            affected_count=0,
-            message=f"No unfrozen individual goals found for {freeze_request.quarter.value} {freeze_request.year}"
-        )
-
-    # Freeze all goals
-    frozen_count = 0
-    for goal in goals:
-        goal.frozen = True
-        goal.frozen_at = datetime.now()
-        goal.frozen_by = user.id
-        frozen_count += 1
-
-    # Create freeze log
+    # Freeze all individual goals for the quarter in one UPDATE, returning owners to notify
+    owner_ids = db.execute(
+        update(Goal).where(
+            Goal.scope == GoalScope.INDIVIDUAL,
+            Goal.quarter == freeze_request.quarter,
+            Goal.year == freeze_request.year,
+            Goal.frozen == False  # Only freeze goals that aren't already frozen
+        ).values(frozen=True, frozen_at=func.now(), frozen_by=user.id).returning(Goal.owner_id),
+        execution_options={"synchronize_session": False}
+    ).scalars().all()
+    frozen_count = len(owner_ids)
+
+    # Log the action even if no goals were found, in the same transaction as the UPDATE
     freeze_log = GoalFreezeLog(
         action='freeze',
         quarter=freeze_request.quarter,
@@ -403,18 +430,18 @@ async def freeze_goals_for_quarter(
     db.add(freeze_log)
     db.commit()
 
-    # Send notifications to affected users
-    try:
-        notification_service = NotificationService(db)
-        affected_user_ids = list(set([goal.owner_id for goal in goals if goal.owner_id]))
-        notification_service.notify_goals_frozen(
-            quarter=freeze_request.quarter.value,
-            year=freeze_request.year,
-            affected_user_ids=affected_user_ids,
-            frozen_by=user
+    if not frozen_count:
+        return FreezeGoalsResponse(
+            affected_count=0,
+            message=f"No unfrozen individual goals found for {freeze_request.quarter.value} {freeze_request.year}"
         )
-    except Exception as e:
-        print(f"Error sending freeze notifications: {e}")
+
+    # Notify affected users once the response is sent
+    affected_user_ids = list(set([owner_id for owner_id in owner_ids if owner_id]))
+    background_tasks.add_task(
+        send_goals_freeze_notification, "frozen",
+        freeze_request.quarter.value, freeze_request.year, affected_user_ids, user.id
+    )
 
     return FreezeGoalsResponse(
         affected_count=frozen_count,
@@ -423,9 +450,11 @@ async def freeze_goals_for_quarter(
 
 
 @router.post("/unfreeze-quarter", response_model=FreezeGoalsResponse)
-async def unfreeze_goals_for_quarter(
+def unfreeze_goals_for_quarter(
     unfreeze_request: UnfreezeGoalsRequest,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -435,10 +464,6 @@ async def unfreeze_goals_for_quarter(
     Supports emergency override with required reason
     Only users with goal_freeze permission can unfreeze goals
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Permission check
     if not permission_service.user_has_permission(user, 'goal_freeze'):
         raise HTTPException(
@@ -446,42 +471,19 @@ async def unfreeze_goals_for_quarter(
             detail="You do not have permission to unfreeze goals"
         )
 
-    # Get all frozen individual goals for the specified quarter and year
-    goals = db.query(Goal).filter(
-        Goal.scope == GoalScope.INDIVIDUAL,
-        Goal.quarter == unfreeze_request.quarter,
-        Goal.year == unfreeze_request.year,
-        Goal.frozen == True  # Only unfreeze goals that are currently frozen
-    ).all()
-
-    if not goals:
-        # Still log the action even if no goals found
-        unfreeze_log = GoalFreezeLog(
-            action='unfreeze',
-            quarter=unfreeze_request.quarter,
-            year=unfreeze_request.year,
-            affected_goals_count=0,
-            is_emergency_override=unfreeze_request.is_emergency_override,
-            emergency_reason=unfreeze_request.emergency_reason,
-            performed_by=user.id
-        )
-        db.add(unfreeze_log)
-        db.commit()
-
-        return FreezeGoalsResponse(
-            affected_count=0,
-            message=f"No frozen individual goals found for {unfreeze_request.quarter.value} {unfreeze_request.year}"
-        )
-
-    # Unfreeze all goals
-    unfrozen_count = 0
-    for goal in goals:
-        goal.frozen = False
-        goal.frozen_at = None
-        goal.frozen_by = None
-        unfrozen_count += 1
-
-    # Create unfreeze log
+    # Unfreeze all frozen individual goals for the quarter in one UPDATE, returning owners to notify
+    owner_ids = db.execute(
+        update(Goal).where(
+            Goal.scope == GoalScope.INDIVIDUAL,
+            Goal.quarter == unfreeze_request.quarter,
+            Goal.year == unfreeze_request.year,
+            Goal.frozen == True  # Only unfreeze goals that are currently frozen
+        ).values(frozen=False, frozen_at=None, frozen_by=None).returning(Goal.owner_id),
+        execution_options={"synchronize_session": False}
+    ).scalars().all()
+    unfrozen_count = len(owner_ids)
+
+    # Log the action even if no goals were found, in the same transaction as the UPDATE
     unfreeze_log = GoalFreezeLog(
         action='unfreeze',
         quarter=unfreeze_request.quarter,
@@ -494,19 +496,19 @@ async def unfreeze_goals_for_quarter(
     db.add(unfreeze_log)
     db.commit()
 
-    # Send notifications to affected users
-    try:
-        notification_service = NotificationService(db)
-        affected_user_ids = list(set([goal.owner_id for goal in goals if goal.owner_id]))
-        notification_service.notify_goals_unfrozen(
-            quarter=unfreeze_request.quarter.value,
-            year=unfreeze_request.year,
-            affected_user_ids=affected_user_ids,
-            unfrozen_by=user,
-            is_emergency=unfreeze_request.is_emergency_override
+    if not unfrozen_count:
+        return FreezeGoalsResponse(
+            affected_count=0,
+            message=f"No frozen individual goals found for {unfreeze_request.quarter.value} {unfreeze_request.year}"
         )
-    except Exception as e:
-        print(f"Error sending unfreeze notifications: {e}")
+
+    # Notify affected users once the response is sent
+    affected_user_ids = list(set([owner_id for owner_id in owner_ids if owner_id]))
+    background_tasks.add_task(
+        send_goals_freeze_notification, "unfrozen",
+        unfreeze_request.quarter.value, unfreeze_request.year, affected_user_ids, user.id,
+        unfreeze_request.is_emergency_override
+    )
 
     override_msg = " (Emergency Override)" if unfreeze_request.is_emergency_override else ""
     return FreezeGoalsResponse(
@@ -516,75 +518,104 @@ async def unfreeze_goals_for_quarter(
 
 
 @router.get("/freeze-logs", response_model=List[GoalFreezeLogSchema])
-async def get_freeze_logs(
+def get_freeze_logs(
+    request: Request,
     quarter: Optional[Quarter] = None,
     year: Optional[int] = None,
+    before: Optional[datetime] = Query(None, description="performed_at of the last log on the previous page"),
+    before_id: Optional[uuid.UUID] = Query(None, description="id of the last log on the previous page"),
+    limit: Optional[int] = Query(None, ge=1, le=100, description="Page size; omit to return every log"),
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
     """
     Get freeze/unfreeze logs
     Everyone can view these logs for transparency
+    Logs are append-only, so the row count and newest timestamp act as an ETag
+    Pages are keyset-based: pass the performed_at and id of the last log as `before` and `before_id`
     """
-    query = db.query(GoalFreezeLog)
+    if (before is None) != (before_id is None):
+        raise HTTPException(status_code=400, detail="before and before_id must be provided together")
 
     # Apply filters
+    filters = []
     if quarter:
-        query = query.filter(GoalFreezeLog.quarter == quarter)
+        filters.append(GoalFreezeLog.quarter == quarter)
     if year:
-        query = query.filter(GoalFreezeLog.year == year)
-
-    logs = query.order_by(GoalFreezeLog.performed_at.desc()).all()
-
-    # Enrich with performer names
-    result = []
-    for log in logs:
-        performer = db.query(User).filter(User.id == log.performed_by).first()
-        log_dict = {
-            "id": log.id,
-            "action": log.action,
-            "quarter": log.quarter,
-            "year": log.year,
-            "affected_goals_count": log.affected_goals_count,
-            "scheduled_unfreeze_date": log.scheduled_unfreeze_date,
-            "is_emergency_override": log.is_emergency_override,
-            "emergency_reason": log.emergency_reason,
-            "performer_name": performer.name if performer else None,
-            "performed_at": log.performed_at
-        }
-        result.append(GoalFreezeLogSchema(**log_dict))
-
-    return result
+        filters.append(GoalFreezeLog.year == year)
+    if before is not None:
+        # The id breaks ties so logs sharing a timestamp are not skipped at page boundaries
+        filters.append(tuple_(GoalFreezeLog.performed_at, GoalFreezeLog.id) < tuple_(before, before_id))
+
+    total, latest = db.query(func.count(GoalFreezeLog.id), func.max(GoalFreezeLog.performed_at)).filter(*filters).one()
+    etag = f'W/"{total}-{latest.timestamp() if latest else 0}"'
+    headers = {"ETag": etag, "Cache-Control": "private, no-cache"}
+    if request.headers.get("if-none-match") == etag:
+        return Response(status_code=304, headers=headers)
+
+    # A new log changes the ETag, so cached bodies never need explicit invalidation
+    # Only first pages are cached; later pages are keyed by client-supplied cursors
+    cache_key = None
+    if before is None:
+        cache_key = f"freeze_logs:{quarter.value if quarter else 'all'}:{year or 'all'}:{limit}:{etag}"
+    content = cache.get(cache_key) if cache_key else None
+    if content is None:
+        # Performer names come from the same query instead of one user lookup per log
+        logs = db.query(GoalFreezeLog, User.name).outerjoin(
+            User, User.id == GoalFreezeLog.performed_by
+        ).filter(*filters).order_by(
+            GoalFreezeLog.performed_at.desc(), GoalFreezeLog.id.desc()
+        ).limit(limit).all()
+
+        # Enrich with performer names
+        result = []
+        for log, performer_name in logs:
+            log_dict = {
+                "id": log.id,
+                "action": log.action,
+                "quarter": log.quarter,
+                "year": log.year,
+                "affected_goals_count": log.affected_goals_count,
+                "scheduled_unfreeze_date": log.scheduled_unfreeze_date,
+                "is_emergency_override": log.is_emergency_override,
+                "emergency_reason": log.emergency_reason,
+                "performer_name": performer_name,
+                "performed_at": log.performed_at
+            }
+            result.append(GoalFreezeLogSchema(**log_dict))
+
+        content = _freeze_log_list_adapter.dump_json(result).decode()
+        if cache_key:
+            cache.set(cache_key, content, ttl=FREEZE_LOGS_CACHE_TTL)
+
+    return Response(content=content, media_type="application/json", headers=headers)
 
 
 @router.post("/create-for-supervisee", response_model=GoalSchema)
-async def create_goal_for_supervisee(
+def create_goal_for_supervisee(
     goal_data: GoalCreate,
     supervisee_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
-    permission_service: UserPermissions = Depends(get_permission_service),
-    notification_service: NotificationService = Depends(get_notification_service)
+    permission_service: UserPermissions = Depends(get_permission_service)
 ):
     """
     Supervisor creates a goal for their supervisee
     Goal starts as ACTIVE and can be worked on immediately
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    # Get supervisee
-    supervisee = db.query(User).filter(User.id == supervisee_id).first()
+    # Get supervisee together with their supervisor (the current user when authorized)
+    supervisee = db.query(User).options(joinedload(User.supervisor)).filter(User.id == supervisee_id).first()
     if not supervisee:
         raise HTTPException(status_code=404, detail="Supervisee not found")
 
     # Check if current user is the supervisor
-    if supervisee.supervisor_id != user.id:
+    if supervisee.supervisor_id != current_user.user_id:
         raise HTTPException(
             status_code=403,
             detail="You can only create goals for your direct supervisees"
         )
+    user = supervisee.supervisor
 
     # Only individual goals can be created for supervisees
     if goal_data.scope != GoalScope.INDIVIDUAL:
@@ -618,10 +649,9 @@ async def create_goal_for_supervisee(
     )
 
     db.add(goal)
-    db.commit()
-    db.refresh(goal)
+    db.flush()
 
-    # Create goal assignment record
+    # Create goal assignment record in the same transaction
     from models import GoalAssignment
     assignment = GoalAssignment(
         goal_id=goal.id,
@@ -630,43 +660,41 @@ async def create_goal_for_supervisee(
         status=GoalStatus.ACTIVE
     )
     db.add(assignment)
+
+    # Serialize before commit; eager_defaults already returned the server timestamps, so no refresh SELECT
+    response = GoalSchema.from_orm(goal)
     db.commit()
 
-    # Send notification to supervisee
-    try:
-        notification_service.notify_goal_assigned(goal, user, supervisee)
-    except Exception as e:
-        print(f"Error sending goal assignment notification: {e}")
+    # Notify supervisee after the response is sent
+    background_tasks.add_task(send_goal_notification, "assigned", response.id, current_user.user_id, supervisee_id)
 
-    return GoalSchema.from_orm(goal)
+    return response
 
 
 @router.put("/{goal_id}/respond", response_model=GoalSchema)
-async def respond_to_assigned_goal(
+def respond_to_assigned_goal(
     goal_id: uuid.UUID,
+    background_tasks: BackgroundTasks,
     accepted: bool = Query(..., description="Whether the goal is accepted"),
     response_message: Optional[str] = Query(None, description="Optional response message"),
     current_user: UserSession = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    notification_service: NotificationService = Depends(get_notification_service)
+    db: Session = Depends(get_db)
 ):
     """
     Supervisee accepts or declines a goal assigned by their supervisor
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    # Goal plus its owner (the responding supervisee) in one query
+    goal = db.query(Goal).options(joinedload(Goal.owner)).filter(Goal.id == goal_id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
     # Check if user is the goal owner
-    if goal.owner_id != user.id:
+    if goal.owner_id != current_user.user_id:
         raise HTTPException(
             status_code=403,
             detail="You can only respond to goals assigned to you"
         )
+    user = goal.owner
 
     # Check if goal is pending approval
     if goal.status != GoalStatus.PENDING_APPROVAL:
@@ -679,9 +707,9 @@ async def respond_to_assigned_goal(
     if goal.frozen:
         raise HTTPException(status_code=400, detail="Cannot respond to frozen goal")
 
-    # Get assignment record
+    # Get assignment record together with the assigning supervisor
     from models import GoalAssignment
-    assignment = db.query(GoalAssignment).filter(
+    assignment = db.query(GoalAssignment).options(joinedload(GoalAssignment.assigner)).filter(
         GoalAssignment.goal_id == goal_id,
         GoalAssignment.assigned_to == user.id
     ).first()
@@ -692,7 +720,7 @@ async def respond_to_assigned_goal(
     # Update goal and assignment
     if accepted:
         goal.status = GoalStatus.ACTIVE
-        goal.approved_at = datetime.now()
+        goal.approved_at = func.now()
         goal.approved_by = user.id
         assignment.status = GoalStatus.ACTIVE
     else:
@@ -701,51 +729,50 @@ async def respond_to_assigned_goal(
         assignment.status = GoalStatus.REJECTED
 
     assignment.response_message = response_message
-    assignment.responded_at = datetime.now()
+    assignment.responded_at = func.now()
+    supervisor_id = assignment.assigned_by
 
+    db.flush()
+    # Serialize before commit; eager_defaults already returned the server timestamps, so no refresh SELECT
+    response = GoalSchema.from_orm(goal)
     db.commit()
-    db.refresh(goal)
 
-    # Send notification to supervisor
-    try:
-        supervisor = db.query(User).filter(User.id == goal.created_by).first()
-        if supervisor:
-            if accepted:
-                notification_service.notify_goal_accepted(goal, user, supervisor)
-            else:
-                notification_service.notify_goal_declined(goal, user, supervisor, response_message or "")
-    except Exception as e:
-        print(f"Error sending response notification: {e}")
+    # Notify supervisor after the response is sent (ids only, so expired rows aren't reloaded)
+    if supervisor_id:
+        if accepted:
+            background_tasks.add_task(send_goal_notification, "accepted", goal_id, current_user.user_id, supervisor_id)
+        else:
+            background_tasks.add_task(
+                send_goal_notification, "declined", goal_id, current_user.user_id, supervisor_id, response_message or ""
+            )
 
-    return GoalSchema.from_orm(goal)
+    return response
 
 
 @router.put("/{goal_id}/request-change", response_model=GoalSchema)
-async def request_goal_change(
+def request_goal_change(
     goal_id: uuid.UUID,
     change_request: str,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    notification_service: NotificationService = Depends(get_notification_service)
+    db: Session = Depends(get_db)
 ):
     """
     Supervisee requests a change to their goal
     Supervisor must re-approve the goal after changes
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
+    # Goal and its owner (the current user when authorized) in one query
+    goal = db.query(Goal).options(joinedload(Goal.owner)).filter(Goal.id == goal_id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
 
     # Check if user is the goal owner
-    if goal.owner_id != user.id:
+    if goal.owner_id != current_user.user_id:
         raise HTTPException(
             status_code=403,
             detail="You can only request changes to your own goals"
         )
+    user = goal.owner
 
     # Check if goal is frozen
     if goal.frozen:
@@ -756,24 +783,27 @@ async def request_goal_change(
     goal.rejection_reason = f"Change requested: {change_request}"
     goal.approved_at = None
     goal.approved_by = None
+    supervisor_id = user.supervisor_id or goal.created_by
 
+    db.flush()
+    # Serialize before commit; eager_defaults already returned the server timestamps, so no refresh SELECT
+    response = GoalSchema.from_orm(goal)
     db.commit()
-    db.refresh(goal)
 
-    # Send notification to supervisor
-    try:
-        supervisor = user.supervisor if user.supervisor else db.query(User).filter(User.id == goal.created_by).first()
-        if supervisor:
-            notification_service.notify_goal_change_requested(goal, user, supervisor, change_request)
-    except Exception as e:
-        print(f"Error sending change request notification: {e}")
+    # Notify supervisor (or the goal creator) after the response is sent
+    if supervisor_id:
+        background_tasks.add_task(
+            send_goal_notification, "change_requested", goal_id, current_user.user_id, supervisor_id, change_request
+        )
 
-    return GoalSchema.from_orm(goal)
+    return response
 
 @router.post("/", response_model=GoalSchema)
-async def create_goal(
+def create_goal(
     goal_data: GoalCreate,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service),
     goal_service: GoalCascadeService = Depends(get_goal_service)
@@ -785,10 +815,6 @@ async def create_goal(
     - INDIVIDUAL: Personal employee goals (no special permission required, starts as ACTIVE)
     """
 
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Determine initial status based on scope and user role
     # Individual goals by non-leadership staff require supervisor approval
     user_role = user.role
@@ -875,28 +901,21 @@ async def create_goal(
 
     # Send notification if individual goal created (for supervisor awareness)
     if goal.scope == GoalScope.INDIVIDUAL and user.supervisor_id:
-        try:
-            notification_service = NotificationService(db)
-            notification_service.notify_goal_created(goal, user)
-        except Exception as e:
-            print(f"Error sending goal creation notification: {e}")
+        background_tasks.add_task(send_goal_created_notification, goal.id, user.id)
 
     return GoalSchema.from_orm(goal)
 
 @router.get("/{goal_id}", response_model=GoalSchema)
-async def get_goal(
+def get_goal(
     goal_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
     """
     Get goal details
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     goal = db.query(Goal).filter(Goal.id == goal_id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -913,10 +932,11 @@ async def get_goal(
     return GoalSchema(**goal_dict)
 
 @router.put("/{goal_id}", response_model=GoalSchema)
-async def update_goal(
+def update_goal(
     goal_id: uuid.UUID,
     goal_data: GoalUpdate,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -924,10 +944,6 @@ async def update_goal(
     Edit goal details
     Requires GOAL_EDIT permission
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     if not permission_service.user_has_permission(user, SystemPermissions.GOAL_EDIT):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
@@ -942,11 +958,6 @@ async def update_goal(
             detail=f"Cannot edit frozen goal. This goal was frozen on {goal.frozen_at.strftime('%Y-%m-%d') if goal.frozen_at else 'unknown date'}."
         )
 
-    # Check access permissions
-    if not permission_service.user_has_permission(user, SystemPermissions.GOAL_EDIT):
-        if goal.created_by != user.id:
-            raise HTTPException(status_code=403, detail="Cannot modify this goal")
-
     # Update fields
     update_data = goal_data.dict(exclude_unset=True)
 
@@ -995,10 +1006,11 @@ async def update_goal(
     return GoalSchema.from_orm(goal)
 
 @router.put("/{goal_id}/progress", response_model=GoalSchema)
-async def update_goal_progress(
+def update_goal_progress(
     goal_id: uuid.UUID,
     progress_data: GoalProgressUpdate,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service),
     goal_service: GoalCascadeService = Depends(get_goal_service)
@@ -1007,10 +1019,6 @@ async def update_goal_progress(
     Update progress percentage with required report
     Only allowed for goals without children (leaf goals)
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     # Allow super-admin or users with goal progress update permission
     is_super_admin = permission_service.user_has_permission(user, SystemPermissions.SYSTEM_ADMIN)
     has_progress_permission = permission_service.user_has_permission(user, SystemPermissions.GOAL_PROGRESS_UPDATE)
@@ -1043,10 +1051,11 @@ async def update_goal_progress(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{goal_id}/status", response_model=GoalSchema)
-async def update_goal_status(
+def update_goal_status(
     goal_id: uuid.UUID,
     status_data: GoalStatusUpdate,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service),
     goal_service: GoalCascadeService = Depends(get_goal_service)
@@ -1055,10 +1064,6 @@ async def update_goal_status(
     Mark goal as achieved or discard
     Status changes trigger parent goal achievement check
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     if not permission_service.user_has_permission(user, SystemPermissions.GOAL_STATUS_CHANGE):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
@@ -1094,7 +1099,7 @@ async def update_goal_status(
     return GoalSchema.from_orm(goal)
 
 @router.get("/{goal_id}/children", response_model=List[GoalSchema])
-async def get_goal_children(
+def get_goal_children(
     goal_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1108,10 +1113,10 @@ async def get_goal_children(
         raise HTTPException(status_code=404, detail="Goal not found")
 
     children = goal_service.get_child_goals(goal_id)
-    return [GoalSchema.from_orm(child) for child in children]
+    return _goal_list_adapter.validate_python(children, from_attributes=True)
 
 @router.get("/{goal_id}/hierarchy")
-async def get_goal_hierarchy(
+def get_goal_hierarchy(
     goal_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1129,10 +1134,11 @@ async def get_goal_hierarchy(
     return hierarchy
 
 @router.post("/{goal_id}/progress-report", response_model=GoalProgressReport)
-async def add_progress_report(
+def add_progress_report(
     goal_id: uuid.UUID,
     progress_data: GoalProgressUpdate,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service),
     goal_service: GoalCascadeService = Depends(get_goal_service)
@@ -1140,10 +1146,6 @@ async def add_progress_report(
     """
     Add progress report (same as update progress but returns the report)
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     if not permission_service.user_has_permission(user, SystemPermissions.GOAL_PROGRESS_UPDATE):
         raise HTTPException(status_code=403, detail="Insufficient permissions")
 
@@ -1167,87 +1169,84 @@ async def add_progress_report(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{goal_id}/approve", response_model=GoalSchema)
-async def approve_goal(
+def approve_goal(
     goal_id: uuid.UUID,
     approval: GoalApproval,
+    background_tasks: BackgroundTasks,
     current_user: UserSession = Depends(get_current_user),
-    db: Session = Depends(get_db),
-    permission_service: UserPermissions = Depends(get_permission_service)
+    db: Session = Depends(get_db)
 ):
     """
     Approve or reject an individual goal
     Only supervisors or HOD can approve goals
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
-    goal = db.query(Goal).filter(Goal.id == goal_id).first()
-    if not goal:
-        raise HTTPException(status_code=404, detail="Goal not found")
-
-    # Validate goal scope
-    if goal.scope != GoalScope.INDIVIDUAL:
-        raise HTTPException(
-            status_code=400,
-            detail="Only INDIVIDUAL goals require approval"
-        )
-
-    # Check if goal is pending approval
-    if goal.status != GoalStatus.PENDING_APPROVAL:
-        raise HTTPException(
-            status_code=400,
-            detail=f"Goal is not pending approval (current status: {goal.status})"
-        )
-
     # Permission check: must be supervisor or have goal_approve permission
-    goal_owner = db.query(User).filter(User.id == goal.owner_id).first()
-    can_approve = (
-        (goal_owner and goal_owner.supervisor_id == user.id) or  # Is supervisor
-        permission_service.user_has_permission(user, 'goal_approve')  # Has permission
-    )
-
-    if not can_approve:
-        raise HTTPException(
-            status_code=403,
-            detail="Only supervisors or authorized users can approve goals"
-        )
+    # Without the permission, the supervisor relationship is enforced in SQL
+    has_approve_permission = SystemPermissions.GOAL_APPROVE in current_user.permissions
+    is_owner_supervisor = exists().where(User.id == Goal.owner_id, User.supervisor_id == current_user.user_id)
 
-    # Check if goal is frozen
-    if goal.frozen:
-        raise HTTPException(status_code=400, detail="Cannot approve frozen goal")
+    # Apply approval with a single UPDATE ... RETURNING guarded by every precondition
+    stmt = update(Goal).where(
+        Goal.id == goal_id,
+        Goal.scope == GoalScope.INDIVIDUAL,
+        Goal.status == GoalStatus.PENDING_APPROVAL,
+        Goal.frozen.isnot(True)
+    )
+    if not has_approve_permission:
+        stmt = stmt.where(is_owner_supervisor)
 
-    # Apply approval
     if approval.approved:
-        goal.status = GoalStatus.ACTIVE
-        goal.approved_at = datetime.now()
-        goal.approved_by = user.id
-        goal.rejection_reason = None
+        values = dict(status=GoalStatus.ACTIVE, rejection_reason=None)
     else:
-        goal.status = GoalStatus.REJECTED
-        goal.rejection_reason = approval.rejection_reason
-        goal.approved_by = user.id
-        goal.approved_at = datetime.now()
+        values = dict(status=GoalStatus.REJECTED, rejection_reason=approval.rejection_reason)
+    stmt = stmt.values(approved_by=current_user.user_id, approved_at=func.now(), **values).returning(Goal)
+
+    goal = db.execute(stmt, execution_options={"synchronize_session": False}).scalar_one_or_none()
+
+    if not goal:
+        # Nothing was updated; look the goal up only to report why
+        goal = db.query(Goal).filter(Goal.id == goal_id).first()
+        if not goal:
+            raise HTTPException(status_code=404, detail="Goal not found")
+        if goal.scope != GoalScope.INDIVIDUAL:
+            raise HTTPException(
+                status_code=400,
+                detail="Only INDIVIDUAL goals require approval"
+            )
+        if goal.status != GoalStatus.PENDING_APPROVAL:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Goal is not pending approval (current status: {goal.status})"
+            )
+        if not has_approve_permission and (
+            db.query(User.supervisor_id).filter(User.id == goal.owner_id).scalar() != current_user.user_id
+        ):
+            raise HTTPException(
+                status_code=403,
+                detail="Only supervisors or authorized users can approve goals"
+            )
+        raise HTTPException(status_code=400, detail="Cannot approve frozen goal")
 
+    # Serialize before commit so the returned row is not expired and re-selected
+    response = GoalSchema.from_orm(goal)
     db.commit()
-    db.refresh(goal)
 
-    # Send notification to goal owner
-    try:
-        notification_service = NotificationService(db)
-        if approval.approved and goal_owner:
-            notification_service.notify_goal_approved(goal, user, goal_owner)
-        elif not approval.approved and goal_owner:
-            notification_service.notify_goal_rejected(goal, user, goal_owner, approval.rejection_reason or "")
-    except Exception as e:
-        print(f"Error sending approval notification: {e}")
+    # Notify goal owner after the response is sent
+    if approval.approved:
+        background_tasks.add_task(send_goal_notification, "approved", response.id, current_user.user_id, response.owner_id)
+    else:
+        background_tasks.add_task(
+            send_goal_notification, "rejected", response.id, current_user.user_id, response.owner_id,
+            approval.rejection_reason or ""
+        )
 
-    return GoalSchema.from_orm(goal)
+    return response
 
 @router.delete("/{goal_id}")
-async def delete_goal(
+def delete_goal(
     goal_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -1255,10 +1254,6 @@ async def delete_goal(
     Delete a goal
     Only the goal creator or users with goal_edit permission can delete goals
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     goal = db.query(Goal).filter(Goal.id == goal_id).first()
     if not goal:
         raise HTTPException(status_code=404, detail="Goal not found")
@@ -1299,10 +1294,11 @@ async def delete_goal(
 
 
 @router.post("/{goal_id}/freeze")
-async def freeze_goal(
+def freeze_goal(
     goal_id: uuid.UUID,
     reason: str = None,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -1310,10 +1306,6 @@ async def freeze_goal(
     Freeze an individual goal to prevent editing
     Requires goal_freeze permission
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     if not permission_service.user_has_permission(user, "goal_freeze"):
         raise HTTPException(status_code=403, detail="Insufficient permissions to freeze goals")
 
@@ -1326,7 +1318,7 @@ async def freeze_goal(
 
     # Freeze the goal
     goal.frozen = True
-    goal.frozen_at = datetime.now()
+    goal.frozen_at = func.now()
     goal.frozen_by = user.id
 
     db.commit()
@@ -1341,10 +1333,11 @@ async def freeze_goal(
 
 
 @router.post("/{goal_id}/unfreeze")
-async def unfreeze_goal(
+def unfreeze_goal(
     goal_id: uuid.UUID,
     reason: str = None,
     current_user: UserSession = Depends(get_current_user),
+    user: User = Depends(get_current_db_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
 ):
@@ -1352,10 +1345,6 @@ async def unfreeze_goal(
     Unfreeze a goal to allow editing again
     Requires goal_freeze permission
     """
-    user = db.query(User).filter(User.id == current_user.user_id).first()
-    if not user:
-        raise HTTPException(status_code=404, detail="User not found")
-
     if not permission_service.user_has_permission(user, "goal_freeze"):
         raise HTTPException(status_code=403, detail="Insufficient permissions to unfreeze goals")
 
@@ -14,7 +14,7 @@ from datetime import datetime
 import json
  
 from database import get_db
-from models import Initiative, InitiativeStatus, InitiativeType, User, InitiativeSubTask, InitiativeAssignment
+from models import Initiative, InitiativeStatus, InitiativeType, User, InitiativeSubTask, InitiativeAssignment, INITIATIVE_LIST_OPTIONS, strict_loads
 from schemas.initiatives import (
     InitiativeCreate, InitiativeUpdate, InitiativeStatusUpdate, InitiativeSubmission, InitiativeReview,
     InitiativeExtensionRequest, InitiativeExtensionReview, Initiative as InitiativeSchema,
@@ -27,20 +27,20 @@ from utils.auth import get_current_user
 from utils.permissions import UserPermissions, SystemPermissions
 from utils.initiative_workflows import InitiativeWorkflowService
 
-router = APIRouter(prefix="/initiatives", tags=["initiatives"])
+router = APIRouter(tags=["initiatives"])
 
 @router.get("/debug")
-async def debug_endpoint():
+def debug_endpoint():
     """Simple debug endpoint to test basic router functionality"""
     return {"message": "Initiatives router is working", "status": "ok"}
 
 @router.get("/debug-auth")
-async def debug_auth_endpoint(current_user: UserSession = Depends(get_current_user)):
+def debug_auth_endpoint(current_user: UserSession = Depends(get_current_user)):
     """Debug endpoint with authentication"""
     return {"message": "Auth working", "user": current_user.user_id}
 
 @router.get("/debug-db")
-async def debug_db_endpoint(
+def debug_db_endpoint(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -49,7 +49,7 @@ async def debug_db_endpoint(
     return {"message": "DB working", "user_name": user.name if user else "Not found"}
 
 @router.post("/debug-create")
-async def debug_create_endpoint(initiative_data: InitiativeCreate):
+def debug_create_endpoint(initiative_data: InitiativeCreate):
     """Debug initiative creation schema only"""
     return {
         "message": "Schema validation passed",
@@ -67,7 +67,7 @@ def get_initiative_service(db: Session = Depends(get_db)) -> InitiativeWorkflowS
 
 
 @router.get("/", response_model=InitiativeList)
-async def get_initiatives(
+def get_initiatives(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     status_filter: Optional[List[InitiativeStatus]] = Query(None),
@@ -88,19 +88,13 @@ async def get_initiatives(
     NOTE: To see subordinate/supervisee initiatives, use GET /supervisees endpoint
     """
     from models import InitiativeAssignment
-    from sqlalchemy.orm import joinedload
 
     user = db.query(User).filter(User.id == current_user.user_id).first()
     if not user:
         raise HTTPException(status_code=404, detail="User not found")
 
     # Build base query with proper joins
-    query = db.query(Initiative).options(
-        joinedload(Initiative.assignments).joinedload(InitiativeAssignment.user),
-        joinedload(Initiative.creator),
-        joinedload(Initiative.team_head),
-        joinedload(Initiative.goal)
-    )
+    query = db.query(Initiative).options(*strict_loads(*INITIATIVE_LIST_OPTIONS))
 
     user_initiative_ids_subquery = db.query(InitiativeAssignment.initiative_id).filter(InitiativeAssignment.user_id == user.id).subquery()
 
@@ -262,7 +256,7 @@ async def upload_initiative_document(
     return InitiativeDocument.from_orm(document)
 
 @router.post("/", response_model=InitiativeSchema)
-async def create_initiative(
+def create_initiative(
     initiative_data: InitiativeCreate,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -302,7 +296,7 @@ async def create_initiative(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{initiative_id}/approve", response_model=InitiativeSchema)
-async def approve_initiative(
+def approve_initiative(
     initiative_id: uuid.UUID,
     approval: InitiativeApproval,
     current_user: UserSession = Depends(get_current_user),
@@ -336,7 +330,7 @@ async def approve_initiative(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{initiative_id}/accept", response_model=InitiativeSchema)
-async def accept_initiative(
+def accept_initiative(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -375,7 +369,7 @@ async def accept_initiative(
     return InitiativeSchema.from_orm(initiative)
 
 @router.put("/{initiative_id}/start", response_model=InitiativeSchema)
-async def start_initiative(
+def start_initiative(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -413,7 +407,7 @@ async def start_initiative(
     return InitiativeSchema.from_orm(initiative)
 
 @router.put("/{initiative_id}/complete", response_model=InitiativeSchema)
-async def complete_initiative(
+def complete_initiative(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -452,7 +446,7 @@ async def complete_initiative(
     return InitiativeSchema.from_orm(initiative)
 
 @router.get("/stats", response_model=InitiativeStats)
-async def get_initiative_stats(
+def get_initiative_stats(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     initiative_service: InitiativeWorkflowService = Depends(get_initiative_service)
@@ -507,7 +501,7 @@ async def get_initiative_stats(
     )
 
 @router.get("/assignable-users")
-async def get_assignable_users(
+def get_assignable_users(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -551,7 +545,7 @@ async def get_assignable_users(
     ]
 
 @router.get("/has-supervisees")
-async def check_has_supervisees(
+def check_has_supervisees(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -571,7 +565,7 @@ async def check_has_supervisees(
     }
 
 @router.get("/supervisees", response_model=List[InitiativeWithAssignees])
-async def get_supervisee_initiatives(
+def get_supervisee_initiatives(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -596,18 +590,12 @@ async def get_supervisee_initiatives(
 
     # Get initiatives created by or assigned to supervisees
     from models import InitiativeAssignment
-    from sqlalchemy.orm import joinedload
 
     supervisee_initiative_ids_subquery = db.query(InitiativeAssignment.initiative_id).filter(
         InitiativeAssignment.user_id.in_(supervisee_ids)
     ).subquery()
 
-    initiatives = db.query(Initiative).options(
-        joinedload(Initiative.assignments).joinedload(InitiativeAssignment.user),
-        joinedload(Initiative.creator),
-        joinedload(Initiative.team_head),
-        joinedload(Initiative.goal)
-    ).filter(
+    initiatives = db.query(Initiative).options(*strict_loads(*INITIATIVE_LIST_OPTIONS)).filter(
         or_(
             Initiative.created_by.in_(supervisee_ids),  # Created by supervisees
             Initiative.id.in_(supervisee_initiative_ids_subquery)  # Assigned to supervisees
@@ -660,7 +648,7 @@ async def get_supervisee_initiatives(
     return initiative_list
 
 @router.get("/assigned", response_model=InitiativeList)
-async def get_assigned_initiatives(
+def get_assigned_initiatives(
     status_filter: Optional[List[InitiativeStatus]] = Query(None),
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -693,7 +681,7 @@ async def get_assigned_initiatives(
     )
 
 @router.get("/created", response_model=InitiativeList)
-async def get_created_initiatives(
+def get_created_initiatives(
     status_filter: Optional[List[InitiativeStatus]] = Query(None),
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -720,7 +708,7 @@ async def get_created_initiatives(
     )
 
 @router.get("/review-queue", response_model=InitiativeList)
-async def get_review_queue(
+def get_review_queue(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -745,7 +733,7 @@ async def get_review_queue(
     )
 
 @router.get("/{initiative_id}", response_model=InitiativeWithAssignees)
-async def get_initiative(
+def get_initiative(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -783,7 +771,7 @@ async def get_initiative(
     return initiative_data
 
 @router.put("/{initiative_id}", response_model=InitiativeSchema)
-async def update_initiative(
+def update_initiative(
     initiative_id: uuid.UUID,
     initiative_data: InitiativeUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -821,7 +809,7 @@ async def update_initiative(
     return InitiativeSchema.from_orm(initiative)
 
 @router.put("/{initiative_id}/status", response_model=InitiativeSchema)
-async def update_initiative_status(
+def update_initiative_status(
     initiative_id: uuid.UUID,
     status_data: InitiativeStatusUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -859,7 +847,7 @@ async def update_initiative_status(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/{initiative_id}/submit", response_model=InitiativeSubmissionDetail)
-async def submit_initiative(
+def submit_initiative(
     initiative_id: uuid.UUID,
     submission_data: InitiativeSubmission,
     current_user: UserSession = Depends(get_current_user),
@@ -892,7 +880,7 @@ async def submit_initiative(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{initiative_id}/submission")
-async def get_initiative_submission(
+def get_initiative_submission(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -954,7 +942,7 @@ async def get_initiative_submission(
     }
 
 @router.get("/{initiative_id}/for-review", response_model=InitiativeForReview)
-async def get_initiative_for_review(
+def get_initiative_for_review(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1030,7 +1018,7 @@ async def get_initiative_for_review(
     return initiative_data
 
 @router.post("/{initiative_id}/review", response_model=InitiativeSchema)
-async def review_initiative(
+def review_initiative(
     initiative_id: uuid.UUID,
     review_data: InitiativeReview,
     current_user: UserSession = Depends(get_current_user),
@@ -1060,7 +1048,7 @@ async def review_initiative(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.post("/{initiative_id}/extension-request", response_model=InitiativeExtension)
-async def request_extension(
+def request_extension(
     initiative_id: uuid.UUID,
     extension_data: InitiativeExtensionRequest,
     current_user: UserSession = Depends(get_current_user),
@@ -1086,7 +1074,7 @@ async def request_extension(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.put("/{initiative_id}/extension/{extension_id}", response_model=InitiativeExtension)
-async def review_extension(
+def review_extension(
     initiative_id: uuid.UUID,
     extension_id: uuid.UUID,
     review_data: InitiativeExtensionReview,
@@ -1119,7 +1107,7 @@ async def review_extension(
         raise HTTPException(status_code=400, detail=str(e))
 
 @router.get("/{initiative_id}/submissions", response_model=List[InitiativeSubmissionDetail])
-async def get_initiative_submissions(
+def get_initiative_submissions(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1192,7 +1180,7 @@ async def upload_initiative_document(
     return InitiativeDocument.from_orm(document)
 
 @router.get("/documents/{document_id}/download")
-async def download_initiative_document(
+def download_initiative_document(
     document_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -1226,7 +1214,7 @@ async def download_initiative_document(
     )
 
 @router.get("/user/{user_id}")
-async def get_user_initiatives(
+def get_user_initiatives(
     user_id: uuid.UUID,
     status: Optional[str] = None,
     current_user: UserSession = Depends(get_current_user),
@@ -1295,7 +1283,7 @@ async def get_user_initiatives(
 # from schemas.initiatives import SubTask, SubTaskCreate, SubTaskUpdate, SubTaskReorder
 
 @router.get("/{initiative_id}/subtasks", response_model=List[SubTask])
-async def get_subtasks(
+def get_subtasks(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1327,7 +1315,7 @@ async def get_subtasks(
     return [SubTask.from_orm(st) for st in subtasks]
 
 @router.post("/{initiative_id}/subtasks", response_model=SubTask)
-async def create_subtask(
+def create_subtask(
     initiative_id: uuid.UUID,
     subtask_data: SubTaskCreate,
     current_user: UserSession = Depends(get_current_user),
@@ -1383,7 +1371,7 @@ async def create_subtask(
     return SubTask.from_orm(subtask)
 
 @router.put("/{initiative_id}/subtasks/{subtask_id}", response_model=SubTask)
-async def update_subtask(
+def update_subtask(
     initiative_id: uuid.UUID,
     subtask_id: uuid.UUID,
     subtask_data: SubTaskUpdate,
@@ -1437,7 +1425,7 @@ async def update_subtask(
     return SubTask.from_orm(subtask)
 
 @router.delete("/{initiative_id}/subtasks/{subtask_id}")
-async def delete_subtask(
+def delete_subtask(
     initiative_id: uuid.UUID,
     subtask_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
@@ -1475,7 +1463,7 @@ async def delete_subtask(
     return {"message": "Sub-task deleted successfully"}
 
 @router.post("/{initiative_id}/subtasks/reorder")
-async def reorder_subtasks(
+def reorder_subtasks(
     initiative_id: uuid.UUID,
     reorder_data: SubTaskReorder,
     current_user: UserSession = Depends(get_current_user),
@@ -1513,7 +1501,7 @@ async def reorder_subtasks(
     return {"message": "Sub-tasks reordered successfully"}
 
 @router.delete("/{initiative_id}")
-async def delete_initiative(
+def delete_initiative(
     initiative_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
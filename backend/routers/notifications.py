@@ -22,7 +22,7 @@ from utils.websocket_manager import manager
 import logging
 
 logger = logging.getLogger(__name__)
-router = APIRouter(prefix="/api/notifications", tags=["Notifications"])
+router = APIRouter(tags=["Notifications"])
 
 
 @router.websocket("/ws")
@@ -119,7 +119,7 @@ async def websocket_endpoint(
 
 
 @router.get("", response_model=NotificationListResponse)
-async def get_notifications(
+def get_notifications(
     skip: int = 0,
     limit: int = 20,
     unread_only: bool = False,
@@ -207,7 +207,7 @@ async def get_notifications(
 
 
 @router.get("/stats", response_model=NotificationStats)
-async def get_notification_stats(
+def get_notification_stats(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -269,7 +269,7 @@ async def get_notification_stats(
 
 
 @router.put("/{notification_id}/read", response_model=NotificationResponse)
-async def mark_notification_as_read(
+def mark_notification_as_read(
     notification_id: UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -318,7 +318,7 @@ async def mark_notification_as_read(
 
 
 @router.put("/mark-all-read")
-async def mark_all_notifications_as_read(
+def mark_all_notifications_as_read(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -338,7 +338,7 @@ async def mark_all_notifications_as_read(
 
 
 @router.delete("/{notification_id}")
-async def delete_notification(
+def delete_notification(
     notification_id: UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -363,7 +363,7 @@ async def delete_notification(
 
 
 @router.get("/connection-stats")
-async def get_connection_stats(
+def get_connection_stats(
     current_user: UserSession = Depends(get_current_user)
 ):
     """Get WebSocket connection statistics (for debugging)"""
@@ -9,7 +9,7 @@ from typing import List, Optional
 import uuid
 
 from database import get_db
-from models import Organization, User, OrganizationLevel
+from models import Organization, User, OrganizationLevel, column_values
 from schemas.organization import (
     OrganizationCreate, OrganizationUpdate, Organization as OrganizationSchema,
     OrganizationWithChildren, OrganizationTree, OrganizationStats
@@ -24,7 +24,7 @@ def get_permission_service(db: Session = Depends(get_db)) -> UserPermissions:
     return UserPermissions(db)
 
 @router.get("/", response_model=List[OrganizationSchema])
-async def get_organizations(
+def get_organizations(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
@@ -43,7 +43,7 @@ async def get_organizations(
     return organizations
 
 @router.get("/tree", response_model=OrganizationTree)
-async def get_organization_tree(
+def get_organization_tree(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
@@ -77,7 +77,7 @@ async def get_organization_tree(
     def build_tree(org: Organization) -> OrganizationWithChildren:
         children = db.query(Organization).filter(Organization.parent_id == org.id).all()
         return OrganizationWithChildren(
-            **org.__dict__,
+            **column_values(org),
             children=[build_tree(child) for child in children]
         )
 
@@ -85,7 +85,7 @@ async def get_organization_tree(
     return OrganizationTree(organization=tree)
 
 @router.post("/", response_model=OrganizationSchema)
-async def create_organization(
+def create_organization(
     organization_data: OrganizationCreate,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -154,7 +154,7 @@ async def create_organization(
     return organization
 
 @router.put("/{organization_id}", response_model=OrganizationSchema)
-async def update_organization(
+def update_organization(
     organization_id: uuid.UUID,
     organization_data: OrganizationUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -199,7 +199,7 @@ async def update_organization(
     return organization
 
 @router.delete("/{organization_id}")
-async def delete_organization(
+def delete_organization(
     organization_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -238,7 +238,7 @@ async def delete_organization(
     return {"message": "Organization deleted successfully"}
 
 @router.get("/{organization_id}/children", response_model=List[OrganizationSchema])
-async def get_organization_children(
+def get_organization_children(
     organization_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -262,7 +262,7 @@ async def get_organization_children(
     return children
 
 @router.get("/stats", response_model=OrganizationStats)
-async def get_organization_stats(
+def get_organization_stats(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
@@ -26,7 +26,7 @@ router = APIRouter(prefix="/performance", tags=["performance"])
 
 # Performance Records endpoints
 @router.get("/records", response_model=List[PerformanceRecordResponse])
-async def get_performance_records(
+def get_performance_records(
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     period: Optional[str] = Query(None, description="Filter by period"),
     current_user: User = Depends(get_current_user),
@@ -65,7 +65,7 @@ async def get_performance_records(
     return query.order_by(desc(PerformanceRecord.period_end)).all()
 
 @router.post("/records", response_model=PerformanceRecordResponse)
-async def create_performance_record(
+def create_performance_record(
     record_data: PerformanceRecordCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -119,7 +119,7 @@ async def create_performance_record(
     return record
 
 @router.get("/records/{record_id}", response_model=PerformanceRecordResponse)
-async def get_performance_record(
+def get_performance_record(
     record_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -145,7 +145,7 @@ async def get_performance_record(
 
 # Development Plans endpoints
 @router.get("/development-plans", response_model=List[DevelopmentPlanResponse])
-async def get_development_plans(
+def get_development_plans(
     user_id: Optional[str] = Query(None, description="Filter by user ID"),
     status: Optional[str] = Query(None, description="Filter by status"),
     current_user: User = Depends(get_current_user),
@@ -183,7 +183,7 @@ async def get_development_plans(
     return query.order_by(desc(DevelopmentPlan.start_date)).all()
 
 @router.post("/development-plans", response_model=DevelopmentPlanResponse)
-async def create_development_plan(
+def create_development_plan(
     plan_data: DevelopmentPlanCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -233,7 +233,7 @@ async def create_development_plan(
 
 # Analytics endpoints
 @router.get("/analytics/summary")
-async def get_performance_analytics(
+def get_performance_analytics(
     organization_id: Optional[str] = Query(None, description="Filter by organization"),
     period: Optional[str] = Query(None, description="Filter by period"),
     current_user: User = Depends(get_current_user),
@@ -333,7 +333,7 @@ async def get_performance_analytics(
     }
 
 @router.get("/user/{user_id}/summary")
-async def get_user_performance_summary(
+def get_user_performance_summary(
     user_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
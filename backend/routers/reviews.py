@@ -5,14 +5,15 @@ Handles review cycles, reviews, and evaluation workflows
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlalchemy.orm import Session, joinedload
-from sqlalchemy import func, and_, or_, desc, asc
+from sqlalchemy import func, and_, or_, desc, asc, insert
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 from typing import List, Optional, Dict, Any
 from database import get_db
 from models import User, ReviewCycle, Review, PeerReview, Initiative, InitiativeAssignment, Goal, Organization, ReviewTrait, ReviewQuestion, ReviewCycleTrait, ReviewAssignment, ReviewResponse as ReviewResponseModel, ReviewScore, PerformanceScore, ReviewCycleStatus
 from routers.auth import get_current_user
 from utils.permissions import UserPermissions
 from pydantic import BaseModel
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 import json
 
 router = APIRouter(tags=["reviews"])
@@ -132,7 +133,7 @@ class PeerReviewResponse(BaseModel):
 
 # Review Cycle endpoints
 @router.get("/cycles", response_model=List[ReviewCycleResponse])
-async def get_review_cycles(
+def get_review_cycles(
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -163,7 +164,7 @@ async def get_review_cycles(
     return cycles
 
 @router.post("/cycles", response_model=ReviewCycleResponse)
-async def create_review_cycle(
+def create_review_cycle(
     cycle_data: ReviewCycleCreate,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -228,7 +229,7 @@ async def create_review_cycle(
     return cycle
 
 @router.get("/cycles/{cycle_id}", response_model=ReviewCycleResponse)
-async def get_review_cycle(
+def get_review_cycle(
     cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -271,7 +272,7 @@ async def get_review_cycle(
     return cycle_dict
 
 @router.put("/cycles/{cycle_id}", response_model=ReviewCycleResponse)
-async def update_review_cycle(
+def update_review_cycle(
     cycle_id: str,
     cycle_data: ReviewCycleUpdate,
     current_user: User = Depends(get_current_user),
@@ -306,7 +307,7 @@ async def update_review_cycle(
     return cycle
 
 @router.post("/cycles/{cycle_id}/sync-traits")
-async def sync_cycle_traits(
+def sync_cycle_traits(
     cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -363,7 +364,7 @@ async def sync_cycle_traits(
     }
 
 @router.post("/cycles/{cycle_id}/start")
-async def start_review_cycle(
+def start_review_cycle(
     cycle_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -417,7 +418,7 @@ async def start_review_cycle(
 
 # Review endpoints
 @router.get("/", response_model=List[ReviewResponse])
-async def get_reviews(
+def get_reviews(
     cycle_id: Optional[int] = None,
     reviewee_id: Optional[int] = None,
     type: Optional[str] = None,
@@ -445,7 +446,7 @@ async def get_reviews(
     return reviews
 
 @router.post("/", response_model=ReviewResponse)
-async def create_review(
+def create_review(
     review_data: ReviewCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -481,7 +482,7 @@ async def create_review(
     return review
 
 @router.put("/{review_id}", response_model=ReviewResponse)
-async def update_review(
+def update_review(
     review_id: int,
     review_data: ReviewUpdate,
     current_user: User = Depends(get_current_user),
@@ -522,7 +523,7 @@ async def update_review(
     return review
 
 @router.post("/{review_id}/submit")
-async def submit_review(
+def submit_review(
     review_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -558,7 +559,7 @@ async def submit_review(
 
 # Peer Review endpoints
 @router.get("/peer", response_model=List[PeerReviewResponse])
-async def get_peer_reviews(
+def get_peer_reviews(
     cycle_id: Optional[int] = None,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -576,7 +577,7 @@ async def get_peer_reviews(
     return peer_reviews
 
 @router.post("/peer", response_model=PeerReviewResponse)
-async def create_peer_review(
+def create_peer_review(
     peer_review_data: PeerReviewCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -661,7 +662,7 @@ def _initialize_cycle_participants(cycle: ReviewCycle, db: Session) -> List[User
 # Advanced Review System Features
 
 @router.post("/cycles/{cycle_id}/analytics")
-async def generate_cycle_analytics(
+def generate_cycle_analytics(
     cycle_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -693,7 +694,7 @@ async def generate_cycle_analytics(
     return analytics
 
 @router.post("/cycles/{cycle_id}/calibration")
-async def schedule_calibration_session(
+def schedule_calibration_session(
     cycle_id: int,
     session_data: dict,
     current_user: User = Depends(get_current_user),
@@ -728,7 +729,7 @@ async def schedule_calibration_session(
     return {"message": "Calibration session scheduled successfully"}
 
 @router.get("/bias-detection/{cycle_id}")
-async def get_bias_detection_report(
+def get_bias_detection_report(
     cycle_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -758,7 +759,7 @@ async def get_bias_detection_report(
     return bias_report
 
 @router.post("/ai-insights/{review_id}")
-async def generate_ai_insights(
+def generate_ai_insights(
     review_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -799,7 +800,7 @@ async def generate_ai_insights(
     return insights
 
 @router.get("/performance-dashboard/{user_id}")
-async def get_performance_dashboard(
+def get_performance_dashboard(
     user_id: int,
     time_period: str = Query("current_year"),
     current_user: User = Depends(get_current_user),
@@ -854,7 +855,7 @@ async def get_performance_dashboard(
     return dashboard
 
 @router.get("/organization-performance")
-async def get_organization_performance(
+def get_organization_performance(
     cycle_id: Optional[str] = Query(None, description="Review cycle ID"),
     department: Optional[str] = Query(None),
     current_user = Depends(get_current_user),
@@ -1032,7 +1033,7 @@ async def get_organization_performance(
     }
 
 @router.get("/my-assignments")
-async def get_my_review_assignments(
+def get_my_review_assignments(
     status: Optional[str] = Query(None),
     cycle_id: Optional[str] = Query(None),
     limit: int = Query(20),
@@ -1114,7 +1115,7 @@ async def get_my_review_assignments(
     return assignments
 
 @router.get("/assignments/{assignment_id}")
-async def get_review_assignment(
+def get_review_assignment(
     assignment_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1194,7 +1195,7 @@ async def get_review_assignment(
     }
 
 @router.get("/assignments/{assignment_id}/questions")
-async def get_review_questions(
+def get_review_questions(
     assignment_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1252,7 +1253,7 @@ async def get_review_questions(
     return formatted_questions
 
 @router.post("/responses")
-async def save_review_responses(
+def save_review_responses(
     response_data: dict,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1296,7 +1297,7 @@ async def save_review_responses(
 # Removed duplicate submit endpoint - using the one at line 3906 instead
 
 @router.get("/cycles/{cycle_id}/analytics")
-async def get_cycle_analytics(
+def get_cycle_analytics(
     cycle_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1322,7 +1323,7 @@ async def get_cycle_analytics(
     return analytics
 
 @router.get("/cycles/{cycle_id}/progress")
-async def get_cycle_progress(
+def get_cycle_progress(
     cycle_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1369,14 +1370,14 @@ async def get_cycle_progress(
         "timeline": {
             "start_date": cycle.start_date.isoformat(),
             "end_date": cycle.end_date.isoformat(),
-            "days_remaining": max(0, (cycle.end_date - datetime.utcnow()).days)
+            "days_remaining": max(0, (cycle.end_date - datetime.now(timezone.utc)).days)
         }
     }
     
     return progress
 
 @router.get("/cycles/{cycle_id}/user-scores")
-async def get_cycle_user_scores(
+def get_cycle_user_scores(
     cycle_id: str,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -1418,12 +1419,7 @@ async def get_cycle_user_scores(
         if not user:
             continue
 
-        # Build user name
-        name_parts = [user.first_name]
-        if user.middle_name:
-            name_parts.append(user.middle_name)
-        name_parts.append(user.last_name)
-        user_name = " ".join(name_parts)
+        user_name = user.name
 
         # Get department name
         department_name = None
@@ -2344,7 +2340,7 @@ def _generate_cycle_recommendations(cycle, reviews, peer_reviews):
 # Additional Advanced Review Features
 
 @router.post("/multi-source-feedback/{user_id}")
-async def initiate_multi_source_feedback(
+def initiate_multi_source_feedback(
     user_id: int,
     feedback_config: dict,
     current_user: User = Depends(get_current_user),
@@ -2449,7 +2445,7 @@ async def initiate_multi_source_feedback(
     }
 
 @router.get("/competency-assessment/{user_id}")
-async def get_competency_assessment(
+def get_competency_assessment(
     user_id: int,
     competency_framework: Optional[str] = Query(None),
     current_user: User = Depends(get_current_user),
@@ -2494,7 +2490,7 @@ async def get_competency_assessment(
     return competency_assessment
 
 @router.post("/development-planning/{user_id}")
-async def create_development_plan(
+def create_development_plan(
     user_id: int,
     development_data: dict,
     current_user: User = Depends(get_current_user),
@@ -2569,7 +2565,7 @@ async def create_development_plan(
     }
 
 @router.get("/performance-trends/{user_id}")
-async def get_performance_trends(
+def get_performance_trends(
     user_id: int,
     time_range: str = Query("2_years"),
     current_user: User = Depends(get_current_user),
@@ -2611,7 +2607,7 @@ async def get_performance_trends(
     return trends_analysis
 
 @router.get("/user-trait-scores/{user_id}")
-async def get_user_trait_scores(
+def get_user_trait_scores(
     user_id: int,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3256,7 +3252,7 @@ class ReviewAssignmentResponse(BaseModel):
 # Trait Management Routes
 
 @router.get("/traits", response_model=List[TraitResponse])
-async def get_traits(
+def get_traits(
     all_traits: bool = None,  # Admin can see all traits
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3330,7 +3326,7 @@ async def get_traits(
     return result
 
 @router.post("/traits", response_model=TraitResponse)
-async def create_trait(
+def create_trait(
     trait_data: TraitCreate,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3428,7 +3424,7 @@ async def create_trait(
     )
 
 @router.delete("/traits/{trait_id}")
-async def delete_trait(
+def delete_trait(
     trait_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3475,7 +3471,7 @@ async def delete_trait(
     return {"message": "Trait deleted successfully"}
 
 @router.get("/traits/{trait_id}/questions", response_model=List[QuestionResponse])
-async def get_trait_questions(
+def get_trait_questions(
     trait_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3497,7 +3493,7 @@ async def get_trait_questions(
     ) for q in questions]
 
 @router.post("/traits/{trait_id}/questions", response_model=QuestionResponse)
-async def create_question(
+def create_question(
     trait_id: str,
     question_data: QuestionCreate,
     current_user: User = Depends(get_current_user),
@@ -3544,7 +3540,7 @@ async def create_question(
     )
 
 @router.delete("/questions/{question_id}")
-async def delete_question(
+def delete_question(
     question_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3580,7 +3576,7 @@ async def delete_question(
 
 
 @router.get("/cycles/{cycle_id}/questions")
-async def get_cycle_questions(
+def get_cycle_questions(
     cycle_id: str,
     review_type: Optional[str] = Query(None, description="Filter by review type: self, peer, supervisor"),
     current_user = Depends(get_current_user),
@@ -3634,7 +3630,7 @@ async def get_cycle_questions(
     return result
 
 @router.post("/cycles/{cycle_id}/questions")
-async def add_question_to_cycle(
+def add_question_to_cycle(
     cycle_id: str,
     question_data: dict,
     current_user = Depends(get_current_user),
@@ -3668,7 +3664,7 @@ async def add_question_to_cycle(
     return {"id": str(question.id), "message": "Question added successfully"}
 
 @router.delete("/cycles/{cycle_id}/questions/{question_id}")
-async def remove_question_from_cycle(
+def remove_question_from_cycle(
     cycle_id: str,
     question_id: str,
     current_user = Depends(get_current_user),
@@ -3696,7 +3692,7 @@ async def remove_question_from_cycle(
     return {"message": "Question removed successfully"}
 
 @router.post("/cycles/{cycle_id}/activate")
-async def activate_review_cycle(
+def activate_review_cycle(
     cycle_id: str,
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3762,37 +3758,38 @@ def _generate_review_assignments(cycle_id: str, db: Session):
 
     # Get all active users
     active_users = db.query(User).filter(User.status == 'ACTIVE').all()
+    active_user_ids = {user.id for user in active_users}
 
+    # Active direct reports per supervisor, built from the users already loaded
+    subordinate_ids = {}
+    for user in active_users:
+        if user.supervisor_id:
+            subordinate_ids.setdefault(user.supervisor_id, []).append(user.id)
+
+    peer_count = cycle.components.get('peer_count', 5)
+
+    # Collect rows and insert them in one batch instead of one ORM object per assignment
+    assignments = []
     for user in active_users:
         # Create self-review assignment
-        self_assignment = ReviewAssignment(
-            cycle_id=cycle_id,
-            reviewer_id=user.id,
-            reviewee_id=user.id,
-            review_type='self'
-        )
-        db.add(self_assignment)
+        assignments.append({
+            "cycle_id": cycle_id,
+            "reviewer_id": user.id,
+            "reviewee_id": user.id,
+            "review_type": 'self'
+        })
 
         # Create supervisor review assignment
         # Use the actual supervisor_id field from the user model
-        if user.supervisor_id:
-            supervisor = db.query(User).filter(
-                User.id == user.supervisor_id,
-                User.status == 'ACTIVE'
-            ).first()
-
-            if supervisor:
-                supervisor_assignment = ReviewAssignment(
-                    cycle_id=cycle_id,
-                    reviewer_id=supervisor.id,
-                    reviewee_id=user.id,
-                    review_type='supervisor'
-                )
-                db.add(supervisor_assignment)
+        if user.supervisor_id in active_user_ids:
+            assignments.append({
+                "cycle_id": cycle_id,
+                "reviewer_id": user.supervisor_id,
+                "reviewee_id": user.id,
+                "review_type": 'supervisor'
+            })
 
         # Create peer reviews (always included in new system)
-        peer_count = cycle.components.get('peer_count', 5)
-
         # Get users from same department, excluding:
         # 1. The user themselves
         # 2. Their supervisor (already reviewing in supervisor section)
@@ -3800,36 +3797,32 @@ def _generate_review_assignments(cycle_id: str, db: Session):
         excluded_ids = [user.id]
         if user.supervisor_id:
             excluded_ids.append(user.supervisor_id)
-
-        # Get all subordinates
-        subordinate_ids = db.query(User.id).filter(
-            User.supervisor_id == user.id,
-            User.status == 'ACTIVE'
-        ).all()
-        excluded_ids.extend([sub_id[0] for sub_id in subordinate_ids])
+        excluded_ids.extend(subordinate_ids.get(user.id, []))
 
         # Get eligible peers from same department
-        dept_users = db.query(User).filter(
+        peer_ids = db.query(User.id).filter(
             User.organization_id == user.organization_id,
             User.status == 'ACTIVE',
             User.id.notin_(excluded_ids)
         ).order_by(func.random()).limit(peer_count).all()
 
-        for peer in dept_users:
-            peer_assignment = ReviewAssignment(
-                cycle_id=cycle_id,
-                reviewer_id=peer.id,
-                reviewee_id=user.id,
-                review_type='peer'
-            )
-            db.add(peer_assignment)
+        for (peer_id,) in peer_ids:
+            assignments.append({
+                "cycle_id": cycle_id,
+                "reviewer_id": peer_id,
+                "reviewee_id": user.id,
+                "review_type": 'peer'
+            })
+
+    if assignments:
+        db.execute(insert(ReviewAssignment), assignments)
 
     db.commit()
 
 # User Review Assignment Endpoints
 
 @router.get("/assignments/me")
-async def get_my_review_assignments(
+def get_my_review_assignments(
     current_user = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -3861,12 +3854,7 @@ async def get_my_review_assignments(
             if not reviewee:
                 continue
 
-            # Build reviewee name
-            name_parts = [reviewee.first_name]
-            if reviewee.middle_name:
-                name_parts.append(reviewee.middle_name)
-            name_parts.append(reviewee.last_name)
-            reviewee_name = " ".join(name_parts)
+            reviewee_name = reviewee.name
 
             # Simple response with empty questions array for now
             result.append({
@@ -3887,7 +3875,7 @@ async def get_my_review_assignments(
     return result
 
 @router.get("/assignments/{assignment_id}/form")
-async def get_review_assignment_form(
+def get_review_assignment_form(
     assignment_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -3992,7 +3980,7 @@ async def get_review_assignment_form(
     return form_data
 
 @router.post("/assignments/{assignment_id}/submit")
-async def submit_review_assignment(
+def submit_review_assignment(
     assignment_id: str,
     responses: dict,  # {"responses": [{"question_id": "uuid", "rating": 8, "comment": "text"}]}
     current_user: User = Depends(get_current_user),
@@ -4012,10 +4000,9 @@ async def submit_review_assignment(
     if assignment.status == 'completed':
         raise HTTPException(status_code=400, detail="Assignment already completed")
 
-    # Validate and save responses
-    response_list = responses.get('responses', [])
-
-    for response_data in response_list:
+    # Validate responses, keeping the last rating given for each question
+    response_rows = {}
+    for response_data in responses.get('responses', []):
         question_id = response_data.get('question_id')
         rating = response_data.get('rating')
         comment = response_data.get('comment', '')
@@ -4027,26 +4014,24 @@ async def submit_review_assignment(
         if not (1 <= rating <= 10):
             raise HTTPException(status_code=400, detail=f"Rating must be between 1 and 10, got {rating}")
 
-        # Check if response already exists
-        existing_response = db.query(ReviewResponseModel).filter(
-            ReviewResponseModel.assignment_id == assignment_id,
-            ReviewResponseModel.question_id == question_id
-        ).first()
-
-        if existing_response:
-            # Update existing response
-            existing_response.rating = rating
-            existing_response.comment = comment
-            existing_response.updated_at = func.now()
-        else:
-            # Create new response
-            new_response = ReviewResponseModel(
-                assignment_id=assignment_id,
-                question_id=question_id,
-                rating=rating,
-                comment=comment
-            )
-            db.add(new_response)
+        response_rows[str(question_id)] = {
+            "assignment_id": assignment_id,
+            "question_id": question_id,
+            "rating": rating,
+            "comment": comment
+        }
+
+    # Save all responses in one upsert instead of a lookup and write per question
+    if response_rows:
+        stmt = pg_insert(ReviewResponseModel).values(list(response_rows.values()))
+        db.execute(stmt.on_conflict_do_update(
+            constraint='unique_response',
+            set_={
+                "rating": stmt.excluded.rating,
+                "comment": stmt.excluded.comment,
+                "updated_at": func.now()
+            }
+        ))
 
     # Check if this is final submission or just saving progress
     is_draft = responses.get('is_draft', False)
@@ -4098,13 +4083,45 @@ def _calculate_user_review_scores(cycle_id: str, user_id: str, db: Session):
         ReviewCycleTrait.is_active == True
     ).all()
 
+    # Average rating per trait and review type in one aggregate, counting only
+    # questions that apply to the type of review they were answered in
+    type_scores = {}
+    for trait_id, review_type, average in db.query(
+        ReviewQuestion.trait_id,
+        ReviewAssignment.review_type,
+        func.avg(ReviewResponseModel.rating)
+    ).join(
+        ReviewAssignment, ReviewResponseModel.assignment_id == ReviewAssignment.id
+    ).join(
+        ReviewQuestion, ReviewResponseModel.question_id == ReviewQuestion.id
+    ).filter(
+        ReviewAssignment.cycle_id == cycle_id,
+        ReviewAssignment.reviewee_id == user_id,
+        ReviewAssignment.status == 'completed',
+        ReviewQuestion.is_active == True,
+        or_(
+            and_(ReviewAssignment.review_type == 'self', ReviewQuestion.applies_to_self == True),
+            and_(ReviewAssignment.review_type == 'peer', ReviewQuestion.applies_to_peer == True),
+            and_(ReviewAssignment.review_type == 'supervisor', ReviewQuestion.applies_to_supervisor == True)
+        )
+    ).group_by(ReviewQuestion.trait_id, ReviewAssignment.review_type):
+        type_scores[(trait_id, review_type)] = float(average)
+
+    existing_scores = {
+        score.trait_id: score
+        for score in db.query(ReviewScore).filter(
+            ReviewScore.cycle_id == cycle_id,
+            ReviewScore.user_id == user_id
+        )
+    }
+
     for cycle_trait in cycle_traits:
         trait_id = cycle_trait.trait_id
 
-        # Calculate scores for each review type
-        self_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'self', db)
-        peer_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'peer', db)
-        supervisor_score = _calculate_trait_score_by_type(cycle_id, user_id, trait_id, 'supervisor', db)
+        # Scores for each review type
+        self_score = type_scores.get((trait_id, 'self'))
+        peer_score = type_scores.get((trait_id, 'peer'))
+        supervisor_score = type_scores.get((trait_id, 'supervisor'))
 
         # Calculate weighted score: self (20%) + peer (30%) + supervisor (50%)
         weighted_score = None
@@ -4129,11 +4146,7 @@ def _calculate_user_review_scores(cycle_id: str, user_id: str, db: Session):
                 weighted_score = weighted_total / total_weight * 10  # Normalize to 10-point scale
 
         # Save or update the score
-        existing_score = db.query(ReviewScore).filter(
-            ReviewScore.cycle_id == cycle_id,
-            ReviewScore.user_id == user_id,
-            ReviewScore.trait_id == trait_id
-        ).first()
+        existing_score = existing_scores.get(trait_id)
 
         if existing_score:
             existing_score.self_score = self_score
@@ -4155,58 +4168,8 @@ def _calculate_user_review_scores(cycle_id: str, user_id: str, db: Session):
 
     db.commit()
 
-def _calculate_trait_score_by_type(cycle_id: str, user_id: str, trait_id: str, review_type: str, db: Session) -> float:
-    """Calculate average score for a trait from specific review type"""
-
-    # Get all assignments of this type for this user
-    assignments = db.query(ReviewAssignment).filter(
-        ReviewAssignment.cycle_id == cycle_id,
-        ReviewAssignment.reviewee_id == user_id,
-        ReviewAssignment.review_type == review_type,
-        ReviewAssignment.status == 'completed'
-    ).all()
-
-    if not assignments:
-        return None
-
-    # Get all questions for this trait
-    trait_questions = db.query(ReviewQuestion).filter(
-        ReviewQuestion.trait_id == trait_id,
-        ReviewQuestion.is_active == True
-    )
-
-    # Filter based on review type
-    if review_type == 'self':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_self == True)
-    elif review_type == 'peer':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_peer == True)
-    elif review_type == 'supervisor':
-        trait_questions = trait_questions.filter(ReviewQuestion.applies_to_supervisor == True)
-
-    question_ids = [str(q.id) for q in trait_questions.all()]
-
-    if not question_ids:
-        return None
-
-    # Get all responses for these questions from these assignments
-    all_ratings = []
-    for assignment in assignments:
-        responses = db.query(ReviewResponseModel).filter(
-            ReviewResponse.assignment_id == assignment.id,
-            ReviewResponse.question_id.in_(question_ids)
-        ).all()
-
-        for response in responses:
-            all_ratings.append(response.rating)
-
-    if not all_ratings:
-        return None
-
-    # Return average score
-    return sum(all_ratings) / len(all_ratings)
-
 @router.post("/cycles/{cycle_id}/calculate-scores")
-async def calculate_cycle_scores(
+def calculate_cycle_scores(
     cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -4246,7 +4209,7 @@ async def calculate_cycle_scores(
 # Dashboard and Analytics Endpoints
 
 @router.get("/cycles/{cycle_id}/dashboard")
-async def get_cycle_dashboard(
+def get_cycle_dashboard(
     cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -4346,7 +4309,7 @@ async def get_cycle_dashboard(
     }
 
 @router.get("/cycles/{cycle_id}/user-progress")
-async def get_user_progress(
+def get_user_progress(
     cycle_id: str,
     current_user: User = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -4413,7 +4376,7 @@ async def get_user_progress(
     return result
 
 @router.get("/users/{user_id}/review-scores/{cycle_id}")
-async def get_user_review_scores(
+def get_user_review_scores(
     user_id: str,
     cycle_id: str,
     current_user: User = Depends(get_current_user),
@@ -24,7 +24,7 @@ def get_permission_service(db: Session = Depends(get_db)) -> UserPermissions:
     return UserPermissions(db)
 
 @router.get("/", response_model=List[RoleSchema])
-async def get_roles(
+def get_roles(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
     permission_service: UserPermissions = Depends(get_permission_service)
@@ -50,7 +50,7 @@ async def get_roles(
     return role_list
 
 @router.post("/", response_model=RoleSchema)
-async def create_role(
+def create_role(
     role_data: RoleCreate,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -91,7 +91,7 @@ async def create_role(
     return RoleSchema.from_orm(role)
 
 @router.get("/permissions")
-async def get_all_permissions(
+def get_all_permissions(
     current_user: UserSession = Depends(get_current_user)
 ):
     """
@@ -102,7 +102,7 @@ async def get_all_permissions(
     return PermissionGroups.get_all_groups()
 
 @router.get("/{role_id}", response_model=RoleSchema)
-async def get_role(
+def get_role(
     role_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -121,7 +121,7 @@ async def get_role(
     return role_data
 
 @router.put("/{role_id}", response_model=RoleSchema)
-async def update_role(
+def update_role(
     role_id: uuid.UUID,
     role_data: RoleUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -160,7 +160,7 @@ async def update_role(
     return RoleSchema.from_orm(role)
 
 @router.delete("/{role_id}")
-async def delete_role(
+def delete_role(
     role_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -195,7 +195,7 @@ async def delete_role(
     return {"message": "Role deleted successfully"}
 
 @router.post("/{role_id}/assign/{user_id}")
-async def assign_role_to_user(
+def assign_role_to_user(
     role_id: uuid.UUID,
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
@@ -240,7 +240,7 @@ async def assign_role_to_user(
     }
 
 @router.get("/{role_id}/users", response_model=List[dict])
-async def get_role_users(
+def get_role_users(
     role_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
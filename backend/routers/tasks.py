@@ -368,16 +368,9 @@ async def get_task(
     # Get assignees
     assignees = []
     for assignment in task.assignments:
-        # Compute full name from separate fields
-        name_parts = [assignment.user.first_name]
-        if assignment.user.middle_name:
-            name_parts.append(assignment.user.middle_name)
-        name_parts.append(assignment.user.last_name)
-        full_name = " ".join(name_parts)
-
         assignees.append({
             "user_id": str(assignment.user.id),
-            "user_name": full_name,
+            "user_name": assignment.user.name,
             "user_email": assignment.user.email,
             "assigned_at": assignment.created_at
         })
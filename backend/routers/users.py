@@ -5,16 +5,18 @@ Based on CLAUDE.md specification with comprehensive user management
 
 from fastapi import APIRouter, Depends, HTTPException, status, Query, UploadFile, File
 from fastapi.responses import FileResponse
+from sqlalchemy import inspect
 from sqlalchemy.orm import Session
 from typing import List, Optional
 from datetime import datetime, timedelta
 import uuid
+import enum
 import os
 import shutil
 from pathlib import Path
 
 from database import get_db
-from models import User, UserStatus, UserHistory
+from models import User, UserStatus, UserHistory, USER_LIST_OPTIONS, strict_loads, column_values
 from schemas.users import (
     UserCreate, UserUpdate, UserStatusUpdate, User as UserSchema,
     UserWithRelations, UserProfile, UserHistoryEntry, UserList
@@ -23,6 +25,7 @@ from schemas.auth import UserSession
 from utils.auth import get_current_user, get_password_hash, generate_onboarding_token
 from utils.permissions import UserPermissions, SystemPermissions
 from utils.email_service import EmailService
+from utils.notifications import NotificationService
 
 router = APIRouter(tags=["users"])
 
@@ -33,13 +36,43 @@ def enhance_user_with_supervisor(user: User, db: Session) -> dict:
     """Helper function to add supervisor information to user object"""
     user_dict = UserSchema.from_orm(user).dict()
     if user.supervisor_id:
-        supervisor = db.query(User).filter(User.id == user.supervisor_id).first()
+        # Eager-loaded with the user, so no per-user query
+        supervisor = user.supervisor
         if supervisor:
             user_dict['supervisor_name'] = f"{supervisor.first_name} {supervisor.last_name}"
     return user_dict
 
+def _history_value(value):
+    """JSON-safe form of a column value for history rows"""
+    if isinstance(value, uuid.UUID):
+        return str(value)
+    if isinstance(value, enum.Enum):
+        return value.value
+    return value
+
+def add_change_history(db: Session, user: User, admin_id: uuid.UUID, fields):
+    """
+    Record one history row per field whose value actually changed
+    Call after setting the attributes and before flushing, while SQLAlchemy still
+    holds the previous values
+    """
+    state = inspect(user)
+    for field in fields:
+        history = state.attrs[field].history
+        old = history.deleted[0] if history.deleted else None
+        new = history.added[0] if history.added else None
+        if not history.added or old == new:
+            continue
+        db.add(UserHistory(
+            user_id=user.id,
+            admin_id=admin_id,
+            action=f"{field}_changed",
+            old_value={field: _history_value(old)},
+            new_value={field: _history_value(new)}
+        ))
+
 @router.delete("/{user_id}")
-async def delete_user(
+def delete_user(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -120,7 +153,7 @@ async def delete_user(
     }
 
 @router.get("/", response_model=UserList)
-async def get_users(
+def get_users(
     page: int = Query(1, ge=1),
     per_page: int = Query(50, ge=1, le=100),
     search: Optional[str] = Query(None, description="Search by name or email"),
@@ -151,10 +184,9 @@ async def get_users(
     if search and search.strip():
         search_term = f"%{search.strip()}%"
         query = query.filter(
+            # name covers first, middle and last name; both columns have trigram indexes
             (User.name.ilike(search_term)) |
-            (User.email.ilike(search_term)) |
-            (User.first_name.ilike(search_term)) |
-            (User.last_name.ilike(search_term))
+            (User.email.ilike(search_term))
         )
 
     # Apply filters
@@ -180,7 +212,7 @@ async def get_users(
 
     # Apply pagination
     offset = (page - 1) * per_page
-    users = query.offset(offset).limit(per_page).all()
+    users = query.options(*strict_loads(*USER_LIST_OPTIONS)).offset(offset).limit(per_page).all()
 
     # Enhance users with supervisor names
     enhanced_users = [UserSchema(**enhance_user_with_supervisor(user, db)) for user in users]
@@ -193,7 +225,7 @@ async def get_users(
     )
 
 @router.post("/", response_model=UserSchema)
-async def create_user(
+def create_user(
     user_data: UserCreate,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -223,17 +255,9 @@ async def create_user(
     onboarding_token = generate_onboarding_token()
     token_expiration = datetime.now() + timedelta(days=7)
 
-    # Compute full name from separate fields
-    name_parts = [user_data.first_name]
-    if user_data.middle_name:
-        name_parts.append(user_data.middle_name)
-    name_parts.append(user_data.last_name)
-    full_name = " ".join(name_parts)
-
     # Create user
     user = User(
         email=user_data.email,
-        name=full_name,
         first_name=user_data.first_name,
         last_name=user_data.last_name,
         middle_name=user_data.middle_name,
@@ -262,7 +286,7 @@ async def create_user(
         old_value=None,
         new_value={
             "email": user_data.email,
-            "name": full_name,
+            "name": user.name,
             "first_name": user_data.first_name,
             "last_name": user_data.last_name,
             "middle_name": user_data.middle_name,
@@ -276,7 +300,6 @@ async def create_user(
     db.refresh(user)
 
     # Send onboarding email
-    from utils.notifications import NotificationService
     notification_service = NotificationService(db)
     notification_service.notify_user_created(user, onboarding_token)
 
@@ -284,7 +307,7 @@ async def create_user(
 
 # Self-service user endpoints (must be defined before /{user_id} routes)
 @router.get("/me", response_model=UserWithRelations)
-async def get_my_profile(
+def get_my_profile(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -296,7 +319,7 @@ async def get_my_profile(
         raise HTTPException(status_code=404, detail="User not found")
 
     return UserWithRelations(
-        **user.__dict__,
+        **column_values(user),
         organization={
             "id": str(user.organization.id),
             "name": user.organization.name,
@@ -310,7 +333,7 @@ async def get_my_profile(
     )
 
 @router.put("/me", response_model=UserSchema)
-async def update_my_profile(
+def update_my_profile(
     profile_data: UserProfile,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -328,15 +351,8 @@ async def update_my_profile(
     for field, value in update_data.items():
         setattr(user, field, value)
 
-    # Create history entry
-    history = UserHistory(
-        user_id=user.id,
-        admin_id=user.id,  # Self-update
-        action="self_profile_update",
-        old_value=None,
-        new_value=update_data
-    )
-    db.add(history)
+    # Self-update, so the user is also the admin on the history rows
+    add_change_history(db, user, user.id, update_data)
 
     db.commit()
     db.refresh(user)
@@ -344,7 +360,7 @@ async def update_my_profile(
     return UserSchema(**enhance_user_with_supervisor(user, db))
 
 @router.post("/me/profile-image")
-async def upload_profile_image(
+def upload_profile_image(
     file: UploadFile = File(...),
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
@@ -422,7 +438,7 @@ async def upload_profile_image(
     }
 
 @router.delete("/me/profile-image")
-async def delete_profile_image(
+def delete_profile_image(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -459,7 +475,7 @@ async def delete_profile_image(
     return {"message": "Profile image deleted successfully"}
 
 @router.get("/{user_id}", response_model=UserWithRelations)
-async def get_user(
+def get_user(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -486,7 +502,7 @@ async def get_user(
     supervisees_list = [UserSchema(**enhance_user_with_supervisor(supervisee, db)) for supervisee in supervisees]
 
     return UserWithRelations(
-        **user.__dict__,
+        **column_values(user),
         organization={
             "id": str(user.organization.id),
             "name": user.organization.name,
@@ -501,7 +517,7 @@ async def get_user(
     )
 
 @router.get("/me/supervisees", response_model=List[UserSchema])
-async def get_my_supervisees(
+def get_my_supervisees(
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db)
 ):
@@ -522,7 +538,7 @@ async def get_my_supervisees(
     return enhanced_supervisees
 
 @router.get("/{user_id}/supervisees", response_model=List[UserSchema])
-async def get_user_supervisees(
+def get_user_supervisees(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -553,7 +569,7 @@ async def get_user_supervisees(
     return enhanced_supervisees
 
 @router.put("/{user_id}", response_model=UserSchema)
-async def update_user(
+def update_user(
     user_id: uuid.UUID,
     user_data: UserUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -579,50 +595,17 @@ async def update_user(
     if not permission_service.user_can_access_organization(updater, user.organization_id):
         raise HTTPException(status_code=403, detail="Cannot access this user")
 
-    # Compute full name from separate fields for history
-    name_parts = [user.first_name]
-    if user.middle_name:
-        name_parts.append(user.middle_name)
-    name_parts.append(user.last_name)
-    full_name = " ".join(name_parts)
-
-    # Store old values for history
-    old_values = {
-        "name": full_name,
-        "first_name": user.first_name,
-        "last_name": user.last_name,
-        "middle_name": user.middle_name,
-        "phone": user.phone,
-        "address": user.address,
-        "skillset": user.skillset,
-        "level": user.level,
-        "job_title": user.job_title,
-        "organization_id": str(user.organization_id) if user.organization_id else None,
-        "role_id": str(user.role_id) if user.role_id else None
-    }
-
-    # Update fields
     update_data = user_data.dict(exclude_unset=True)
-    for field, value in update_data.items():
-        if field == "organization_id" and value:
-            # Validate scope access to new organization
-            if not permission_service.user_can_access_organization(updater, value):
-                raise HTTPException(status_code=403, detail="Cannot assign user to this organization")
+    if update_data.get("organization_id"):
+        # Validate scope access to new organization
+        if not permission_service.user_can_access_organization(updater, update_data["organization_id"]):
+            raise HTTPException(status_code=403, detail="Cannot assign user to this organization")
 
+    # Update fields, with no queries in between so autoflush keeps the old values for history
+    for field, value in update_data.items():
         setattr(user, field, value)
 
-    # Create history entry
-    new_values = {field: str(value) if isinstance(value, uuid.UUID) else value
-                  for field, value in update_data.items()}
-
-    history = UserHistory(
-        user_id=user.id,
-        admin_id=updater.id,
-        action="profile_updated",
-        old_value=old_values,
-        new_value=new_values
-    )
-    db.add(history)
+    add_change_history(db, user, updater.id, update_data)
 
     db.commit()
     db.refresh(user)
@@ -630,7 +613,7 @@ async def update_user(
     return UserSchema(**enhance_user_with_supervisor(user, db))
 
 @router.put("/{user_id}/status", response_model=UserSchema)
-async def update_user_status(
+def update_user_status(
     user_id: uuid.UUID,
     status_data: UserStatusUpdate,
     current_user: UserSession = Depends(get_current_user),
@@ -688,7 +671,7 @@ async def update_user_status(
     return UserSchema(**enhance_user_with_supervisor(user, db))
 
 @router.get("/{user_id}/history", response_model=List[UserHistoryEntry])
-async def get_user_history(
+def get_user_history(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -718,14 +701,14 @@ async def get_user_history(
 
     return [
         UserHistoryEntry(
-            **entry.__dict__,
+            **column_values(entry),
             admin_name=entry.admin.name if entry.admin else "System"
         )
         for entry in history_entries
     ]
 
 @router.get("/{user_id}/potential-supervisors", response_model=List[UserSchema])
-async def get_potential_supervisors(
+def get_potential_supervisors(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -761,7 +744,7 @@ async def get_potential_supervisors(
     return [UserSchema.from_orm(supervisor) for supervisor in potential_supervisors]
 
 @router.put("/{user_id}/supervisor", response_model=UserSchema)
-async def assign_supervisor(
+def assign_supervisor(
     user_id: uuid.UUID,
     supervisor_data: dict,  # {"supervisor_id": "uuid"}
     current_user: UserSession = Depends(get_current_user),
@@ -842,7 +825,7 @@ async def assign_supervisor(
     return UserSchema(**enhance_user_with_supervisor(user, db))
 
 @router.post("/{user_id}/resend-onboarding")
-async def resend_onboarding_email(
+def resend_onboarding_email(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -893,7 +876,6 @@ async def resend_onboarding_email(
     db.refresh(user)
 
     # Resend onboarding email
-    from utils.notifications import NotificationService
     notification_service = NotificationService(db)
     notification_service.notify_user_created(user, onboarding_token)
 
@@ -903,7 +885,7 @@ async def resend_onboarding_email(
     }
 
 @router.post("/{user_id}/send-password-reset")
-async def send_password_reset_link(
+def send_password_reset_link(
     user_id: uuid.UUID,
     current_user: UserSession = Depends(get_current_user),
     db: Session = Depends(get_db),
@@ -954,7 +936,6 @@ async def send_password_reset_link(
     db.refresh(user)
 
     # Send password reset email
-    from utils.notifications import NotificationService
     notification_service = NotificationService(db)
     notification_service.notify_password_reset(user, reset_token)
 
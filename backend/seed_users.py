@@ -217,15 +217,9 @@ try:
 
     created_users = []
     for i, (email, first, last, middle, title, level, role, org) in enumerate(user_data):
-        name_parts = [first]
-        if middle:
-            name_parts.append(middle)
-        name_parts.append(last)
-
         u = User(
             id=uuid.uuid4(),
             email=email,
-            name=" ".join(name_parts),
             first_name=first,
             last_name=last,
             middle_name=middle,
@@ -1,17 +1,19 @@
-from datetime import datetime, timedelta
+from datetime import datetime, timedelta, timezone
 from typing import Optional, List
 from fastapi import Depends, HTTPException, status, Request
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import JWTError, jwt
 from passlib.context import CryptContext
-from sqlalchemy.orm import Session
+from sqlalchemy import func, update
+from sqlalchemy.orm import Session, load_only
 from decouple import config
 import uuid
+import hashlib
 import secrets
 import string
 
 from database import get_db
-from models import User, UserStatus, RefreshToken
+from models import User, UserStatus, RefreshToken, AUTH_USER_OPTIONS, strict_loads
 from schemas.auth import UserSession
 from utils.permissions import UserPermissions
 
@@ -20,7 +22,15 @@ ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 60  # 1 hour for access tokens
 REFRESH_TOKEN_EXPIRE_DAYS = 7  # 7 days for refresh tokens
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+# New hashes use Argon2id; bcrypt hashes still verify and are upgraded on next login
+pwd_context = CryptContext(
+    schemes=["argon2", "bcrypt"],
+    deprecated="auto",
+    argon2__type="ID",
+    argon2__time_cost=2,
+    argon2__memory_cost=64 * 1024,
+    argon2__parallelism=2
+)
 security = HTTPBearer()
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
@@ -51,11 +61,23 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None):
 
 def authenticate_user(db: Session, email: str, password: str) -> Optional[User]:
     """Authenticate a user by email and password"""
-    user = db.query(User).filter(User.email == email).first()
+    # Only the columns the login response reads; the profile fields stay unloaded
+    user = db.query(User).options(
+        load_only(
+            User.id, User.email, User.name, User.first_name, User.last_name, User.middle_name,
+            User.password_hash, User.status, User.role_id, User.organization_id
+        ),
+        *strict_loads(*AUTH_USER_OPTIONS)
+    ).filter(User.email == email).first()
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    valid, new_hash = pwd_context.verify_and_update(password, user.password_hash)
+    if not valid:
         return None
+    if new_hash:
+        # Legacy bcrypt hash: store the Argon2id rehash now that we have the password
+        user.password_hash = new_hash
+        db.commit()
     return user
 
 def generate_onboarding_token() -> str:
@@ -77,51 +99,63 @@ def generate_refresh_token() -> str:
     return secrets.token_urlsafe(64)
 
 
+def hash_refresh_token(token: str) -> bytes:
+    """SHA-256 digest stored and looked up in place of the raw refresh token"""
+    return hashlib.sha256(token.encode()).digest()
+
+
 def create_refresh_token(
     db: Session,
     user_id: uuid.UUID,
     user_agent: Optional[str] = None,
-    ip_address: Optional[str] = None
-) -> RefreshToken:
-    """Create a new refresh token and store it in the database"""
+    ip_address: Optional[str] = None,
+    commit: bool = True
+) -> str:
+    """
+    Create a new refresh token and store its hash in the database
+    Returns the raw token, which is not recoverable afterwards
+    Pass commit=False to leave the insert in the caller's transaction
+    """
     token = generate_refresh_token()
-    expires_at = datetime.utcnow() + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
+    expires_at = datetime.now(timezone.utc) + timedelta(days=REFRESH_TOKEN_EXPIRE_DAYS)
 
     refresh_token = RefreshToken(
-        token=token,
+        token_hash=hash_refresh_token(token),
         user_id=user_id,
         expires_at=expires_at,
         user_agent=user_agent,
         ip_address=ip_address
     )
     db.add(refresh_token)
-    db.commit()
-    db.refresh(refresh_token)
-
-    return refresh_token
-
-
-def validate_refresh_token(db: Session, token: str) -> Optional[RefreshToken]:
-    """Validate a refresh token and return it if valid"""
-    refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == token,
-        RefreshToken.revoked == False
-    ).first()
+    if commit:
+        db.commit()
 
-    if not refresh_token:
-        return None
+    return token
 
-    # Check if token has expired
-    if refresh_token.expires_at < datetime.utcnow():
-        return None
 
-    return refresh_token
+def consume_refresh_token(db: Session, token: str) -> Optional[uuid.UUID]:
+    """
+    Revoke a valid refresh token and return its user id, or None if it is
+    unknown, revoked or expired
+    The revocation is a single conditional UPDATE, so a token can only be
+    exchanged once even by concurrent requests. Does not commit
+    """
+    return db.execute(
+        update(RefreshToken)
+        .where(
+            RefreshToken.token_hash == hash_refresh_token(token),
+            RefreshToken.revoked == False,
+            RefreshToken.expires_at > func.now()
+        )
+        .values(revoked=True, revoked_at=func.now())
+        .returning(RefreshToken.user_id)
+    ).scalar_one_or_none()
 
 
 def revoke_refresh_token(db: Session, token: str) -> bool:
     """Revoke a refresh token"""
     refresh_token = db.query(RefreshToken).filter(
-        RefreshToken.token == token
+        RefreshToken.token_hash == hash_refresh_token(token)
     ).first()
 
     if refresh_token:
@@ -178,9 +212,11 @@ def get_current_user(
         raise credentials_exception
 
     # Get user with full context
-    user = db.query(User).filter(User.id == uuid.UUID(user_id)).first()
+    user = db.query(User).options(*strict_loads(*AUTH_USER_OPTIONS)).filter(User.id == uuid.UUID(user_id)).first()
     if user is None:
         raise credentials_exception
+    # The identity map only holds weak references; keep the user alive for get_current_db_user
+    db.info["current_user"] = user
 
     # Check if user is active
     if user.status != UserStatus.ACTIVE:
@@ -193,13 +229,6 @@ def get_current_user(
     permission_service = UserPermissions(db)
     user_perms = permission_service.get_user_effective_permissions(user)
 
-    # Compute full name from separate fields
-    name_parts = [user.first_name]
-    if user.middle_name:
-        name_parts.append(user.middle_name)
-    name_parts.append(user.last_name)
-    full_name = " ".join(name_parts)
-
     # Compute profile_image_url from profile_image_path
     profile_image_url = None
     if user.profile_image_path:
@@ -210,7 +239,7 @@ def get_current_user(
     return UserSession(
         user_id=user.id,
         email=user.email,
-        name=full_name,
+        name=user.name,
         first_name=user.first_name,
         last_name=user.last_name,
         middle_name=user.middle_name,
@@ -232,6 +261,21 @@ def get_current_user(
         profile_image_url=profile_image_url
     )
 
+
+def get_current_db_user(
+    current_user: UserSession = Depends(get_current_user),
+    db: Session = Depends(get_db)
+) -> User:
+    """
+    Get the ORM user for the current request without another query
+    get_current_user already loaded it into this session with its role and supervisor,
+    so this is an identity map lookup
+    """
+    user = db.get(User, current_user.user_id)
+    if user is None:
+        raise HTTPException(status_code=404, detail="User not found")
+    return user
+
 def get_current_active_user(current_user: User = Depends(get_current_user)) -> User:
     """Get current user if they are active"""
     if not current_user.is_active:
@@ -4,13 +4,14 @@ Based on CLAUDE.md specification for hierarchical goal achievement
 """
 
 from typing import List, Optional
-from sqlalchemy.orm import Session
+from sqlalchemy.orm import Session, selectinload
 from sqlalchemy import and_
 from datetime import datetime
 import uuid
 
 from models import Goal, GoalStatus, GoalProgressReport, User
 from utils.notifications import NotificationService
+from utils.hierarchy import goal_subtree
 
 class GoalCascadeService:
     """
@@ -126,20 +127,27 @@ class GoalCascadeService:
         return True
 
     def get_child_goals(self, goal_id: uuid.UUID) -> List[Goal]:
-        """Get all child goals for a given goal"""
-        return self.db.query(Goal).filter(Goal.parent_goal_id == goal_id).all()
+        """Get all child goals for a given goal, with tags batch-loaded for serialization"""
+        return self.db.query(Goal).options(selectinload(Goal.tags)).filter(Goal.parent_goal_id == goal_id).all()
 
     def get_goal_hierarchy(self, goal_id: uuid.UUID) -> dict:
         """
         Get complete goal hierarchy starting from specified goal
         Returns nested structure showing parent-child relationships
         """
-        goal = self.db.query(Goal).filter(Goal.id == goal_id).first()
+        # Load the whole subtree in one query and group it by parent in memory
+        goals = goal_subtree(self.db, goal_id)
+        goal = next((g for g in goals if g.id == goal_id), None)
         if not goal:
             return None
 
+        children_by_parent = {}
+        for g in goals:
+            if g.id != goal_id:
+                children_by_parent.setdefault(g.parent_goal_id, []).append(g)
+
         def build_hierarchy(current_goal: Goal) -> dict:
-            children = self.get_child_goals(current_goal.id)
+            children = children_by_parent.get(current_goal.id, [])
             return {
                 "goal": {
                     "id": str(current_goal.id),
@@ -0,0 +1,78 @@
+"""
+Hierarchy queries for organizations and goals
+Each walk is a single recursive CTE instead of one query per level
+"""
+
+from typing import List, Optional
+from sqlalchemy import select, literal
+from sqlalchemy.orm import Session
+import uuid
+
+from models import Organization, OrganizationLevel, Goal
+
+def organization_subtree_query(organization_id):
+    """
+    SELECT of the organization and all of its descendant ids, for use as a subquery
+    `organization_id` may be a value or a scalar SQL expression
+    """
+    tree = select(Organization.id).where(
+        Organization.id == organization_id
+    ).cte("org_subtree", recursive=True)
+    tree = tree.union_all(
+        select(Organization.id).where(Organization.parent_id == tree.c.id)
+    )
+    return select(tree.c.id)
+
+def organization_subtree_ids(db: Session, organization_id: uuid.UUID) -> List[uuid.UUID]:
+    """Get the organization and all of its descendants"""
+    return list(db.execute(organization_subtree_query(organization_id)).scalars())
+
+def _organization_ancestors_cte(organization_id: uuid.UUID):
+    """Organization and its ancestors with depth 0 for the organization itself"""
+    chain = select(
+        Organization.id, Organization.parent_id, literal(0).label("depth")
+    ).where(Organization.id == organization_id).cte("org_ancestors", recursive=True)
+    return chain.union_all(
+        select(Organization.id, Organization.parent_id, chain.c.depth + 1).where(
+            Organization.id == chain.c.parent_id
+        )
+    )
+
+def organization_ancestors_query(organization_id):
+    """
+    SELECT of the organization and its ancestor ids, for use as a subquery
+    `organization_id` may be a value or a scalar SQL expression
+    """
+    chain = _organization_ancestors_cte(organization_id)
+    return select(chain.c.id)
+
+def organization_ancestor_ids(db: Session, organization_id: uuid.UUID) -> List[uuid.UUID]:
+    """
+    Get the organization and its ancestors, nearest first
+    Example: for a unit, returns [unit_id, department_id, directorate_id, global_id]
+    """
+    chain = _organization_ancestors_cte(organization_id)
+    return list(db.execute(select(chain.c.id).order_by(chain.c.depth)).scalars())
+
+def organization_ancestor_at_level(
+    db: Session, organization_id: uuid.UUID, level: OrganizationLevel
+) -> Optional[Organization]:
+    """Get the nearest organization at `level`, starting with the organization itself"""
+    chain = _organization_ancestors_cte(organization_id)
+    return db.execute(
+        select(Organization)
+        .join(chain, Organization.id == chain.c.id)
+        .where(Organization.level == level)
+        .order_by(chain.c.depth)
+        .limit(1)
+    ).scalar_one_or_none()
+
+def goal_subtree(db: Session, goal_id: uuid.UUID) -> List[Goal]:
+    """Get the goal and all of its descendant goals"""
+    tree = select(Goal.id).where(Goal.id == goal_id).cte("goal_subtree", recursive=True)
+    tree = tree.union_all(
+        select(Goal.id).where(Goal.parent_goal_id == tree.c.id)
+    )
+    return list(db.execute(
+        select(Goal).where(Goal.id.in_(select(tree.c.id))).order_by(Goal.created_at)
+    ).scalars())
@@ -5,8 +5,8 @@ Based on CLAUDE.md specification for initiative management workflows
 
 from typing import List, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_
-from datetime import datetime, timedelta
+from sqlalchemy import and_, or_, select
+from datetime import datetime, timedelta, timezone
 import uuid
 
 from models import (
@@ -89,8 +89,8 @@ class InitiativeWorkflowService:
         self.db.add(initiative)
         self.db.flush()  # Get initiative ID
 
-        # Create assignments
-        for assignee_id in assignee_ids:
+        # Create assignments (one per user; the table enforces unique_initiative_assignment)
+        for assignee_id in dict.fromkeys(assignee_ids):
             assignment = InitiativeAssignment(
                 initiative_id=initiative.id,
                 user_id=assignee_id
@@ -451,18 +451,19 @@ class InitiativeWorkflowService:
         """
         Daily cron job to mark initiatives as overdue
         """
-        now = datetime.utcnow()
-        active_initiatives = self.db.query(Initiative).filter(
-            Initiative.status.in_([InitiativeStatus.PENDING, InitiativeStatus.ONGOING, InitiativeStatus.UNDER_REVIEW])
+        now = datetime.now(timezone.utc)
+        # Served by the (status, due_date) index instead of loading every active initiative
+        overdue_initiatives = self.db.query(Initiative).filter(
+            Initiative.status.in_([InitiativeStatus.PENDING, InitiativeStatus.ONGOING, InitiativeStatus.UNDER_REVIEW]),
+            Initiative.due_date < now
         ).all()
 
-        for initiative in active_initiatives:
-            if initiative.due_date < now and initiative.status != InitiativeStatus.COMPLETED:
-                initiative.status = InitiativeStatus.OVERDUE
-                self.db.add(initiative)
-                stakeholders = [assignment.user for assignment in initiative.assignments]
-                stakeholders.append(initiative.creator)
-                self.notification_service.notify_initiative_overdue(initiative, stakeholders)
+        for initiative in overdue_initiatives:
+            initiative.status = InitiativeStatus.OVERDUE
+            self.db.add(initiative)
+            stakeholders = [assignment.user for assignment in initiative.assignments]
+            stakeholders.append(initiative.creator)
+            self.notification_service.notify_initiative_overdue(initiative, stakeholders)
 
         self.db.commit()
 
@@ -521,7 +522,11 @@ class InitiativeWorkflowService:
 
         user_initiative_conditions = or_(
             Initiative.created_by == user.id,
-            Initiative.assignments.any(InitiativeAssignment.user_id == user.id),
+            # Uncorrelated IN: the user's assignments are read once from the
+            # (user_id, initiative_id) index instead of an EXISTS probe per initiative
+            Initiative.id.in_(
+                select(InitiativeAssignment.initiative_id).where(InitiativeAssignment.user_id == user.id)
+            ),
             and_(Initiative.type == InitiativeType.GROUP, Initiative.team_head_id == user.id)
         )
 
@@ -9,6 +9,7 @@ from models import (
     User, Initiative, Goal, InitiativeExtension,
     Notification, NotificationType, NotificationPriority
 )
+from database import SessionLocal
 from utils.email_service import EmailService
 import uuid
 from datetime import datetime, timedelta
@@ -17,11 +18,13 @@ class NotificationService:
     """
     Handles all notification triggers
     Persists notifications to database and sends emails for important events
+    Instances only bind a session; the email client is shared process-wide
     """
 
+    email_service = EmailService()
+
     def __init__(self, db: Session):
         self.db = db
-        self.email_service = EmailService()
 
     def create_notification(
         self,
@@ -415,7 +418,7 @@ class NotificationService:
             )
 
             # Send email to supervisor
-            supervisor = self.db.query(User).filter(User.id == created_by.supervisor_id).first()
+            supervisor = created_by.supervisor
             if supervisor and supervisor.email and supervisor.status == 'active':
                 try:
                     # Extract quarter and year from goal if available
@@ -622,4 +625,85 @@ class NotificationService:
     def notify_user_role_changed(self, user: User, old_role: str, new_role: str):
         """Notify administrators when user role changes"""
         # TODO: Implement role change notification
-        print(f"User {user.email} role changed: {old_role} -> {new_role}")
\ No newline at end of file
+        print(f"User {user.email} role changed: {old_role} -> {new_role}")
+
+
+def send_goal_notification(event: str, goal_id: uuid.UUID, actor_id: uuid.UUID, recipient_id: uuid.UUID, *args):
+    """
+    Deliver a goal workflow notification outside the request cycle
+    Scheduled via FastAPI BackgroundTasks; opens its own session and re-fetches
+    the goal and both users, then calls NotificationService.notify_goal_<event>
+    """
+    db: Session = SessionLocal()
+    try:
+        goal = db.query(Goal).filter(Goal.id == goal_id).first()
+        users = {u.id: u for u in db.query(User).filter(User.id.in_([actor_id, recipient_id])).all()}
+        actor = users.get(actor_id)
+        recipient = users.get(recipient_id)
+        if not goal or not actor or not recipient:
+            return
+
+        notify = getattr(NotificationService(db), f"notify_goal_{event}")
+        notify(goal, actor, recipient, *args)
+    except Exception as e:
+        print(f"Error sending goal {event} notification: {e}")
+    finally:
+        db.close()
+
+
+def send_goal_created_notification(goal_id: uuid.UUID, creator_id: uuid.UUID):
+    """
+    Deliver the goal created notification outside the request cycle
+    Scheduled via FastAPI BackgroundTasks; opens its own session and re-fetches the goal and creator
+    """
+    db: Session = SessionLocal()
+    try:
+        goal = db.query(Goal).filter(Goal.id == goal_id).first()
+        creator = db.query(User).filter(User.id == creator_id).first()
+        if not goal or not creator:
+            return
+
+        NotificationService(db).notify_goal_created(goal, creator)
+    except Exception as e:
+        print(f"Error sending goal creation notification: {e}")
+    finally:
+        db.close()
+
+
+def send_goals_freeze_notification(
+    action: str, quarter: str, year: int, affected_user_ids: List[uuid.UUID], actor_id: uuid.UUID, *args
+):
+    """
+    Deliver quarter freeze/unfreeze notifications outside the request cycle
+    Scheduled via FastAPI BackgroundTasks; opens its own session and re-fetches
+    the acting user, then calls NotificationService.notify_goals_<action>
+    """
+    db: Session = SessionLocal()
+    try:
+        actor = db.query(User).filter(User.id == actor_id).first()
+        if not actor:
+            return
+
+        notify = getattr(NotificationService(db), f"notify_goals_{action}")
+        notify(quarter, year, affected_user_ids, actor, *args)
+    except Exception as e:
+        print(f"Error sending {action} notifications: {e}")
+    finally:
+        db.close()
+
+def send_password_reset_notification(user_id: uuid.UUID, reset_token: str):
+    """
+    Deliver the password reset email outside the request cycle
+    Scheduled via FastAPI BackgroundTasks; opens its own session and re-fetches the user
+    """
+    db: Session = SessionLocal()
+    try:
+        user = db.query(User).filter(User.id == user_id).first()
+        if not user:
+            return
+
+        NotificationService(db).notify_password_reset(user, reset_token)
+    except Exception as e:
+        print(f"Error sending password reset notification: {e}")
+    finally:
+        db.close()
@@ -8,6 +8,7 @@ from enum import Enum
 import uuid
 from sqlalchemy.orm import Session
 from models import User, Role, Organization, OrganizationLevel, ScopeOverride
+from utils.hierarchy import organization_subtree_ids, organization_ancestor_ids, organization_ancestor_at_level
 
 # Complete permission definitions from CLAUDE.md
 class SystemPermissions:
@@ -188,7 +189,8 @@ class UserPermissions:
         Based on CLAUDE.md permission system architecture
         """
         role_permissions = user.role.permissions or []
-        base_scope = self._get_organizational_scope(user.organization_id)
+        # organization and role are loaded with the user, so this needs no queries
+        base_scope = self._get_organizational_scope(user.organization)
         effective_scope = user.role.scope_override if user.role.scope_override != ScopeOverride.NONE else base_scope
 
         return {
@@ -199,9 +201,8 @@ class UserPermissions:
             "organization_level": user.organization.level.value,
         }
 
-    def _get_organizational_scope(self, organization_id: uuid.UUID) -> ScopeOverride:
+    def _get_organizational_scope(self, org: Optional[Organization]) -> ScopeOverride:
         """Get base organizational scope for user"""
-        org = self.db.query(Organization).filter(Organization.id == organization_id).first()
         if not org:
             return ScopeOverride.NONE
 
@@ -230,15 +231,9 @@ class UserPermissions:
 
     def _is_within_directorate_network(self, user_org_id: uuid.UUID, target_org_id: uuid.UUID) -> bool:
         """Check if target organization is within user's directorate network"""
-        user_org = self.db.query(Organization).filter(Organization.id == user_org_id).first()
-        target_org = self.db.query(Organization).filter(Organization.id == target_org_id).first()
-
-        if not user_org or not target_org:
-            return False
-
         # Get directorate level for both organizations
-        user_directorate = self._get_parent_at_level(user_org, OrganizationLevel.DIRECTORATE)
-        target_directorate = self._get_parent_at_level(target_org, OrganizationLevel.DIRECTORATE)
+        user_directorate = organization_ancestor_at_level(self.db, user_org_id, OrganizationLevel.DIRECTORATE)
+        target_directorate = organization_ancestor_at_level(self.db, target_org_id, OrganizationLevel.DIRECTORATE)
 
         return user_directorate and target_directorate and user_directorate.id == target_directorate.id
 
@@ -252,33 +247,21 @@ class UserPermissions:
 
     def _get_parent_at_level(self, org: Organization, level: OrganizationLevel) -> Optional[Organization]:
         """Get parent organization at specific level"""
-        current = org
-        while current:
-            if current.level == level:
-                return current
-            if current.parent_id:
-                current = self.db.query(Organization).filter(Organization.id == current.parent_id).first()
-            else:
-                break
-        return None
+        if not org:
+            return None
+        return organization_ancestor_at_level(self.db, org.id, level)
 
     def _is_descendant(self, ancestor_id: uuid.UUID, descendant_id: uuid.UUID) -> bool:
         """Check if descendant_id is a descendant of ancestor_id"""
-        current_id = descendant_id
-        while current_id:
-            if current_id == ancestor_id:
-                return True
-            org = self.db.query(Organization).filter(Organization.id == current_id).first()
-            if org and org.parent_id:
-                current_id = org.parent_id
-            else:
-                break
-        return False
+        return ancestor_id in organization_ancestor_ids(self.db, descendant_id)
 
     def user_has_permission(self, user: User, permission: str) -> bool:
-        """Check if user has specific permission"""
-        user_perms = self.get_user_effective_permissions(user)
-        return permission in user_perms["permissions"]
+        """
+        Check if user has specific permission
+        Permissions come from the role alone, so this skips the scope calculation
+        and never loads the user's organization
+        """
+        return permission in (user.role.permissions or [])
 
     def get_accessible_organizations(self, user: User) -> List[uuid.UUID]:
         """Get list of organization IDs user can access"""
@@ -291,8 +274,7 @@ class UserPermissions:
             return [org.id for org in orgs]
         elif effective_scope == "cross_directorate":
             # User can access all organizations within their directorate
-            user_org = self.db.query(Organization).filter(Organization.id == user.organization_id).first()
-            directorate = self._get_parent_at_level(user_org, OrganizationLevel.DIRECTORATE)
+            directorate = organization_ancestor_at_level(self.db, user.organization_id, OrganizationLevel.DIRECTORATE)
             if directorate:
                 return self._get_all_descendants(directorate.id)
             return [user.organization_id]
@@ -302,11 +284,7 @@ class UserPermissions:
 
     def _get_all_descendants(self, org_id: uuid.UUID) -> List[uuid.UUID]:
         """Get all descendant organization IDs"""
-        descendants = [org_id]
-        children = self.db.query(Organization).filter(Organization.parent_id == org_id).all()
-        for child in children:
-            descendants.extend(self._get_all_descendants(child.id))
-        return descendants
+        return organization_subtree_ids(self.db, org_id)
 
 def require_permission(permission: str):
     """Decorator to require specific permission for endpoint access"""
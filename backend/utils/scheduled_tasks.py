@@ -3,10 +3,10 @@ Scheduled background tasks for the PMS system
 Run this file periodically (e.g., every hour) using a cron job or task scheduler
 """
 
-from datetime import datetime
+from datetime import datetime, timezone
 from sqlalchemy.orm import Session
 from database import SessionLocal
-from models import ReviewCycle
+from models import ReviewCycle, Notification
 from utils.email_service import EmailService
 
 
@@ -57,9 +57,30 @@ def activate_scheduled_review_cycles():
         db.close()
 
 
+def delete_expired_notifications():
+    """
+    Delete notifications whose expires_at has passed
+    They are already hidden from every notification query, so this only reclaims space
+    """
+    db: Session = SessionLocal()
+    try:
+        deleted = db.query(Notification).filter(
+            Notification.expires_at < datetime.now(timezone.utc)
+        ).delete(synchronize_session=False)
+        db.commit()
+        print(f"🧹 Deleted {deleted} expired notifications")
+
+    except Exception as e:
+        print(f"❌ Error in scheduled task: {e}")
+        db.rollback()
+    finally:
+        db.close()
+
+
 if __name__ == "__main__":
     print(f"\n🔄 Running scheduled tasks at {datetime.now()}")
     print("=" * 60)
     activate_scheduled_review_cycles()
+    delete_expired_notifications()
     print("=" * 60)
     print("✨ Done!\n")
@@ -5,7 +5,9 @@ Handles organizational scope-based trait inheritance
 
 from sqlalchemy.orm import Session
 from typing import List
-from models import ReviewTrait, User, Organization, TraitScopeType
+from models import ReviewTrait, User, TraitScopeType
+from sqlalchemy import select
+from utils.hierarchy import organization_subtree_ids, organization_ancestor_ids, organization_ancestors_query
 import uuid
 
 class TraitInheritanceService:
@@ -29,18 +31,7 @@ class TraitInheritanceService:
 
         Example: For a unit, returns [unit_id, department_id, directorate_id, global_id]
         """
-        hierarchy = []
-        current_org_id = organization_id
-
-        while current_org_id:
-            org = self.db.query(Organization).filter(Organization.id == current_org_id).first()
-            if not org:
-                break
-
-            hierarchy.append(org.id)
-            current_org_id = org.parent_id
-
-        return hierarchy
+        return organization_ancestor_ids(self.db, organization_id)
 
     def get_applicable_traits_for_user(self, user_id: uuid.UUID) -> List[ReviewTrait]:
         """
@@ -52,29 +43,11 @@ class TraitInheritanceService:
         - Traits from user's department (if user is in a unit under a department)
         - Traits from user's specific unit
         """
-        user = self.db.query(User).filter(User.id == user_id).first()
-        if not user or not user.organization_id:
-            # Return only global traits if user has no organization
-            return self.db.query(ReviewTrait).filter(
-                ReviewTrait.is_active == True,
-                ReviewTrait.scope_type == TraitScopeType.GLOBAL
-            ).order_by(ReviewTrait.display_order).all()
-
-        # Get organizational hierarchy
-        hierarchy = self.get_organizational_hierarchy(user.organization_id)
-
-        # Build query for applicable traits
-        # 1. Global traits (always apply)
-        # 2. Traits from any organization in the user's hierarchy
-        applicable_traits = self.db.query(ReviewTrait).filter(
-            ReviewTrait.is_active == True,
-            (
-                (ReviewTrait.scope_type == TraitScopeType.GLOBAL) |
-                (ReviewTrait.organization_id.in_(hierarchy))
-            )
-        ).order_by(ReviewTrait.display_order).all()
-
-        return applicable_traits
+        # Resolve the user's organization inside the query, so the user lookup, the
+        # ancestor walk and the trait filter are one statement. A user without an
+        # organization has no ancestors and gets only the global traits
+        user_organization_id = select(User.organization_id).where(User.id == user_id).scalar_subquery()
+        return self._applicable_traits(user_organization_id)
 
     def get_applicable_traits_for_organization(self, organization_id: uuid.UUID) -> List[ReviewTrait]:
         """
@@ -85,20 +58,18 @@ class TraitInheritanceService:
         - Traits from the organization's parent hierarchy
         - Traits specific to this organization
         """
-        # Get organizational hierarchy
-        hierarchy = self.get_organizational_hierarchy(organization_id)
+        return self._applicable_traits(organization_id)
 
-        # Get all applicable traits
-        applicable_traits = self.db.query(ReviewTrait).filter(
+    def _applicable_traits(self, organization_id) -> List[ReviewTrait]:
+        """Active global traits plus traits scoped to the organization or any of its ancestors"""
+        return self.db.query(ReviewTrait).filter(
             ReviewTrait.is_active == True,
             (
                 (ReviewTrait.scope_type == TraitScopeType.GLOBAL) |
-                (ReviewTrait.organization_id.in_(hierarchy))
+                (ReviewTrait.organization_id.in_(organization_ancestors_query(organization_id)))
             )
         ).order_by(ReviewTrait.display_order).all()
 
-        return applicable_traits
-
     def get_users_assessed_on_trait(self, trait_id: uuid.UUID) -> List[User]:
         """
         Get all users who should be assessed on a specific trait based on its scope
@@ -128,18 +99,7 @@ class TraitInheritanceService:
         Get organization and all its children recursively
         Used to find all users affected by a scoped trait
         """
-        result = [organization_id]
-
-        # Get immediate children
-        children = self.db.query(Organization).filter(
-            Organization.parent_id == organization_id
-        ).all()
-
-        # Recursively get all descendants
-        for child in children:
-            result.extend(self._get_organization_and_children(child.id))
-
-        return result
+        return organization_subtree_ids(self.db, organization_id)
 
     def validate_trait_applicability(self, trait_id: uuid.UUID, user_id: uuid.UUID) -> bool:
         """